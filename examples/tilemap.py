@@ -6,6 +6,9 @@ from dataclasses import dataclass
 from typing import Tuple, Dict, List, Optional
 import random
 
+# Bound once for the per-cell get_tile path
+_rand = random.random
+
 @dataclass
 class TileConfig:
     """Configuration for a single tile type"""
@@ -107,6 +110,8 @@ class TileLibrary:
     def __init__(self):
         self.tiles = {}
         self._initialize_tile_library()
+        # Fallback tiles for unknown (scale, tile_type) keys, built once per key
+        self._fallbacks: Dict[Tuple[str, str], TileConfig] = {}
     
     def _initialize_tile_library(self):
         """Initialize complete tile library"""
@@ -951,19 +956,32 @@ class TileLibrary:
                 description="Area with high insect activity"
             )
         }
+
+        # Flat (scale, tile_type) -> (base tile, variants or None) index for get_tile
+        self._flat = {
+            (scale, tile_type): (tile, tile.variants or None)
+            for scale, scale_tiles in self.tiles.items()
+            for tile_type, tile in scale_tiles.items()
+        }
     
     def get_tile(self, scale: str, tile_type: str, use_variant: bool = True) -> TileConfig:
         """Get tile configuration, optionally using a random variant"""
-        if scale not in self.tiles or tile_type not in self.tiles[scale]:
+        key = (scale, tile_type)
+        entry = self._flat.get(key)
+        if entry is None:
             # Return fallback tile
-            return TileConfig("?", ColorPalette.SNOW_WHITE, ColorPalette.BLACK, 
-                            description=f"Unknown tile: {scale}.{tile_type}")
+            fallback = self._fallbacks.get(key)
+            if fallback is None:
+                fallback = TileConfig("?", ColorPalette.SNOW_WHITE, ColorPalette.BLACK,
+                                      description=f"Unknown tile: {scale}.{tile_type}")
+                self._fallbacks[key] = fallback
+            return fallback
         
-        base_tile = self.tiles[scale][tile_type]
+        base_tile, variants = entry
         
         # Use variant if available and requested
-        if use_variant and base_tile.variants and random.random() < 0.3:  # 30% chance for variant
-            return random.choice(base_tile.variants)
+        if use_variant and variants is not None and _rand() < 0.3:  # 30% chance for variant
+            return variants[int(_rand() * len(variants))]
         
         return base_tile
     
@@ -0,0 +1,29 @@
+"""
+Optional Numba JIT support.
+
+Kernels decorated with ``njit`` are compiled with Numba when it is installed
+(``pip install numba``) and run as plain Python/NumPy otherwise, so every
+kernel must stay correct without compilation.
+"""
+
+try:
+    from numba import njit as _numba_njit
+    HAS_NUMBA = True
+except ImportError:
+    # _numba_njit stays undefined; njit() only calls it when HAS_NUMBA is set
+    HAS_NUMBA = False
+
+
+def njit(*args, **kwargs):
+    """
+    Compile a function with ``numba.njit`` when available.
+
+    Supports both ``@njit`` and ``@njit(cache=True, ...)`` forms. Without
+    Numba the decorated function is returned unchanged.
+    """
+    if HAS_NUMBA:
+        return _numba_njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
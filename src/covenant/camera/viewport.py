@@ -5,8 +5,9 @@ This module provides camera movement and viewport management, replacing
 direct player movement with a scrolling world view system.
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Iterator, Optional, Tuple
 
 import tcod
 
@@ -77,6 +78,53 @@ class Camera:
         """
         return self.world_x, self.world_y
     
+    @contextmanager
+    def override(
+        self,
+        screen_width: Optional[int] = None,
+        screen_height: Optional[int] = None,
+        crosshair_x: Optional[int] = None,
+        crosshair_y: Optional[int] = None,
+    ) -> Iterator["Camera"]:
+        """
+        Temporarily override the screen dimensions and crosshair position.
+        
+        The original values are snapshotted once on entry and restored on
+        exit, even if rendering raises.
+        
+        Args:
+            screen_width: Screen width to use inside the block (None keeps current)
+            screen_height: Screen height to use inside the block (None keeps current)
+            crosshair_x: Crosshair X to use inside the block (None keeps current)
+            crosshair_y: Crosshair Y to use inside the block (None keeps current)
+            
+        Yields:
+            This camera, with the overrides applied
+        """
+        saved = (
+            self.screen_width,
+            self.screen_height,
+            self.config.crosshair_x,
+            self.config.crosshair_y,
+        )
+        if screen_width is not None:
+            self.screen_width = screen_width
+        if screen_height is not None:
+            self.screen_height = screen_height
+        if crosshair_x is not None:
+            self.config.crosshair_x = crosshair_x
+        if crosshair_y is not None:
+            self.config.crosshair_y = crosshair_y
+        try:
+            yield self
+        finally:
+            (
+                self.screen_width,
+                self.screen_height,
+                self.config.crosshair_x,
+                self.config.crosshair_y,
+            ) = saved
+    
     def screen_to_world(self, screen_x: int, screen_y: int) -> Tuple[int, int]:
         """
         Convert screen coordinates to world coordinates.
@@ -3,6 +3,11 @@ import tcod
 import tcod.event
 import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
 
 # NEW: Multi-scale world generation imports
 from .world.generators.world_scale import WorldScaleGenerator
@@ -14,14 +19,83 @@ from .world.data.config import get_world_config, create_world_config_file
 # Legacy imports for Local scale integration (Phase 5)
 from .camera.viewport import create_viewport_system
 from .world.generator import create_default_world_generator
+from .world.chunks import ChunkCoordinate
 from .commands import CommandRegistry, CommandPalette, register_layer_commands
 from .ui import create_instructions_panel, create_status_bar
 from .ui.zoomed_map import ZoomedMapRenderer
 
 
+@dataclass(slots=True)
+class RenderContext:
+    """Per-frame camera state, read once at the start of a frame and shared by the render helpers."""
+
+    scale: ViewScale
+    cam_x: int
+    cam_y: int
+    world_x: int
+    world_y: int
+
+
 class Game:
     """Main game class that handles the multi-scale game loop and state."""
 
+    __slots__ = (
+        # Console and screen
+        'screen_width', 'screen_height', 'min_width', 'min_height', 'console', '_console_buffer',
+        'running',
+        # World, camera and rendering systems
+        'config', 'world_scale_generator', 'multi_scale_camera', 'multi_scale_renderer',
+        'world_generator', 'legacy_camera', 'legacy_viewport', 'map_renderer',
+        # UI and commands
+        'instructions_panel', 'status_bar', 'command_registry', 'command_palette',
+        # Background chunk loading
+        '_preload_executor', '_preload_future', '_local_ready', '_world_lock',
+        '_prefetch_executor', '_pending_prefetch', '_max_pending_prefetch',
+        # Simulation timing
+        '_sim_dt', '_sim_max_steps', '_sim_accum', '_sim_last',
+        # Performance monitoring and resize handling
+        'frame_count', 'last_fps_time', 'fps',
+        'last_resize_time', 'resize_debounce_delay', 'stable_size',
+        # Multi-scale UI state
+        'show_world_info', 'last_scale_switch_time',
+        '_scene_renderers', '_ui_renderers', '_current_scale', '_current_render', '_current_ui',
+        '_nav_instructions', '_nav_instructions_len', '_last_status_key', '_last_status_text',
+        '_last_status_len', '_world_info_lines',
+    )
+
+    # Key dispatch tables, built once instead of walking an if/elif ladder per keypress
+    _PALETTE_MODIFIERS = (
+        tcod.event.Modifier.LCTRL | tcod.event.Modifier.RCTRL |
+        tcod.event.Modifier.LGUI | tcod.event.Modifier.RGUI
+    )
+    _SCALE_KEYS = {
+        tcod.event.KeySym.N1: ViewScale.WORLD,
+        tcod.event.KeySym.N2: ViewScale.REGIONAL,
+        tcod.event.KeySym.N3: ViewScale.LOCAL,
+    }
+    _MOVEMENT_KEYS = {
+        tcod.event.KeySym.W: (0, -1),
+        tcod.event.KeySym.UP: (0, -1),
+        tcod.event.KeySym.S: (0, 1),
+        tcod.event.KeySym.DOWN: (0, 1),
+        tcod.event.KeySym.A: (-1, 0),
+        tcod.event.KeySym.LEFT: (-1, 0),
+        tcod.event.KeySym.D: (1, 0),
+        tcod.event.KeySym.RIGHT: (1, 0),
+    }
+    _DRILL_KEYS = frozenset({tcod.event.KeySym.RETURN, tcod.event.KeySym.KP_ENTER})
+    _DRILL_DOWN = {
+        ViewScale.WORLD: ViewScale.REGIONAL,
+        ViewScale.REGIONAL: ViewScale.LOCAL,
+    }
+    _OVERVIEW_SCALES = frozenset(_DRILL_DOWN)  # Scales above LOCAL, with the info panel
+    _LAYER_HOTKEYS = {
+        tcod.event.KeySym.Z: 'z',
+        tcod.event.KeySym.X: 'x',
+        tcod.event.KeySym.C: 'c',
+    }
+    _QUIT_KEYS = frozenset({tcod.event.KeySym.ESCAPE, tcod.event.KeySym.Q})
+
     def __init__(self):
         # Get terminal size for responsive design
         self.screen_width, self.screen_height = self._get_terminal_size()
@@ -35,8 +109,10 @@ class Game:
         self.screen_width = max(self.screen_width, self.min_width)
         self.screen_height = max(self.screen_height, self.min_height)
 
-        # Initialize the console with detected size
-        self.console = tcod.console.Console(self.screen_width, self.screen_height)
+        # Initialize the console with detected size. Consoles are views into one
+        # grow-only backing buffer, so resizing does not reallocate every time.
+        self._console_buffer = np.zeros(400 * 200, dtype=tcod.console.Console.DTYPE)
+        self.console = self._allocate_console(self.screen_width, self.screen_height)
 
         # Game state
         self.running = True
@@ -78,8 +154,27 @@ class Game:
         # Update multi-scale renderer with current console size
         self.multi_scale_renderer.update_console_size(self.screen_width, self.screen_height)
 
-        # Preload initial chunks around spawn point (for Local scale)
-        self.world_generator.preload_chunks_around(0, 0)
+        # Preload initial chunks around spawn point (for Local scale) in the background,
+        # so world/regional views can render while the local chunks stream in
+        self._preload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chunk-preload")
+        self._preload_future = self._preload_executor.submit(self.world_generator.preload_chunks_around, 0, 0)
+        self._local_ready: bool = False
+
+        # Look-ahead chunk prefetching while moving in the local scale. The world
+        # generator is not thread-safe: the prefetch worker takes this lock per chunk,
+        # and the main loop takes it around camera updates, the local render, the
+        # status bar and the simulation. Other paths, such as the layer hotkeys
+        # (camera_3d.change_layer), do not take it and must not touch the chunk cache.
+        self._world_lock = threading.RLock()
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chunk-prefetch")
+        self._pending_prefetch = set()
+        self._max_pending_prefetch = 2
+
+        # Fixed-timestep animal simulation, decoupled from the render rate
+        self._sim_dt = 1.0 / 20.0  # 20 Hz simulation
+        self._sim_max_steps = 5  # Cap catch-up work after a slow frame
+        self._sim_accum = 0.0
+        self._sim_last = time.monotonic()
 
         # Performance monitoring
         self.frame_count = 0
@@ -95,8 +190,31 @@ class Game:
         self.show_world_info = False
         self.last_scale_switch_time = time.time()
 
+        # Navigation UI text; the status line is only re-formatted when its inputs change
+        self._nav_instructions = "1=World  2=Regional  3=Local  |  WASD=Move  Enter=Drill  I=Info  ESC=Quit"
+        self._nav_instructions_len = len(self._nav_instructions)
+        self._last_status_key = None
+        self._last_status_text = ""
+        self._last_status_len = 0
+
+        # World info overlay lines, built once the world generation is complete
+        self._world_info_lines = None
+
+        # Per-scale render dispatch, re-selected only when the scale changes
+        self._scene_renderers = {
+            ViewScale.WORLD: self._render_multi_scale_scene,
+            ViewScale.REGIONAL: self._render_multi_scale_scene,
+            ViewScale.LOCAL: self._render_local_scene,
+        }
+        self._ui_renderers = {
+            ViewScale.WORLD: self._render_scale_navigation_ui,
+            ViewScale.REGIONAL: self._render_scale_navigation_ui,
+            ViewScale.LOCAL: self._render_local_ui,
+        }
+        self._select_scale_renderers(self.multi_scale_camera.get_current_scale())
+
         print(f"Game initialized with {self.screen_width}×{self.screen_height} console")
-        print(f"Starting in {self.multi_scale_camera.get_current_scale().value} scale")
+        print(f"Starting in {self._current_scale.value} scale")
 
     def _get_terminal_size(self):
         """Get the current terminal size, with fallback to default."""
@@ -118,20 +236,41 @@ class Game:
 
         if new_width != self.screen_width or new_height != self.screen_height:
             # Terminal has been resized
-            self.screen_width = new_width
-            self.screen_height = new_height
+            self._resize_console(new_width, new_height)
+            return True
+        return False
 
-            # Update multi-scale renderer with new dimensions
-            self.multi_scale_renderer.update_console_size(new_width, new_height)
+    def _allocate_console(self, width: int, height: int) -> tcod.console.Console:
+        """Create a console of the given size backed by the shared console buffer."""
+        needed = width * height
+        if needed > self._console_buffer.size:
+            # Grow with headroom so drag-resizing past the capacity reallocates rarely
+            capacity = max(needed, int(self._console_buffer.size * 1.5))
+            self._console_buffer = np.zeros(capacity, dtype=tcod.console.Console.DTYPE)
 
-            # Create new console with updated dimensions
-            self.console = tcod.console.Console(self.screen_width, self.screen_height)
+        buffer = self._console_buffer[:needed].reshape(height, width)
+        return tcod.console.Console(width, height, order="C", buffer=buffer)
 
-            # Update camera dimensions
-            self._update_camera_dimensions()
+    def _resize_console(self, width: int, height: int) -> None:
+        """Switch to a new console size and update everything that depends on it."""
+        self.screen_width = width
+        self.screen_height = height
+        self.console = self._allocate_console(width, height)
 
-            return True
-        return False
+        # Update renderers with the new dimensions
+        self.multi_scale_renderer.update_console_size(width, height)
+        self.map_renderer.update_console_size(width, height)
+
+        self._update_camera_dimensions()
+
+    def _update_camera_dimensions(self) -> None:
+        """Update the legacy camera to match the current screen size."""
+        self.legacy_camera.screen_width = self.screen_width
+        self.legacy_camera.screen_height = self.screen_height
+
+        # Keep the crosshair at the center of the screen
+        self.legacy_camera.config.crosshair_x = self.screen_width // 2
+        self.legacy_camera.config.crosshair_y = self.screen_height // 2
 
     def _handle_window_resize(self, event, context):
         """Handle window resize events by expanding the character grid."""
@@ -152,15 +291,8 @@ class Game:
                 if new_columns != self.screen_width or new_rows != self.screen_height:
                     print(f"Window resized: {pixel_width}x{pixel_height} pixels -> {new_columns}x{new_rows} characters")
 
-                    self.screen_width = new_columns
-                    self.screen_height = new_rows
-
-                    # Create new console with expanded grid
-                    old_console = self.console
-                    self.console = tcod.console.Console(self.screen_width, self.screen_height)
-
-                    # Update camera dimensions to match new grid size
-                    self._update_camera_dimensions()
+                    # Switch to the expanded grid
+                    self._resize_console(new_columns, new_rows)
 
                     return True
         except Exception as e:
@@ -181,125 +313,116 @@ class Game:
         key = event.sym
 
         # Command palette toggle (CMD+K or CTRL+K)
-        if ((event.mod & tcod.event.Modifier.LCTRL or event.mod & tcod.event.Modifier.RCTRL or
-             event.mod & tcod.event.Modifier.LGUI or event.mod & tcod.event.Modifier.RGUI) and
-            key == tcod.event.KeySym.K):
+        if event.mod & self._PALETTE_MODIFIERS and key == tcod.event.KeySym.K:
             self.command_palette.open()
             return
 
         # Scale switching (always available)
-        if key == tcod.event.KeySym.N1:
-            self.multi_scale_camera.change_scale(ViewScale.WORLD)
-            self.last_scale_switch_time = time.time()
-            return
-        elif key == tcod.event.KeySym.N2:
-            old_scale = self.multi_scale_camera.get_current_scale()
-            self.multi_scale_camera.change_scale(ViewScale.REGIONAL)
-
-            # When switching to regional, center on the current world position
-            if old_scale == ViewScale.WORLD:
-                # Get world camera position and convert to regional coordinates
-                world_cam_x, world_cam_y = self.multi_scale_camera.get_camera_position()
-                # Center regional camera (16,16 is center of 32x32 regional view)
-                self.multi_scale_camera.set_camera_position(16, 16)
-
-            self.last_scale_switch_time = time.time()
-            return
-        elif key == tcod.event.KeySym.N3:
-            old_scale = self.multi_scale_camera.get_current_scale()
-            self.multi_scale_camera.change_scale(ViewScale.LOCAL)
-            # Sync legacy camera when switching to local scale
-            if old_scale != ViewScale.LOCAL:
-                self._sync_legacy_to_multi_scale_camera()
-            self.last_scale_switch_time = time.time()
+        new_scale = self._SCALE_KEYS.get(key)
+        if new_scale is not None:
+            self._switch_scale(new_scale)
             return
 
-        current_scale = self.multi_scale_camera.get_current_scale()
+        current_scale = self._current_scale
 
         # Movement keys (WASD and arrow keys)
-        dx, dy = 0, 0
-        if key in [tcod.event.KeySym.W, tcod.event.KeySym.UP]:
-            dy = -1
-        elif key in [tcod.event.KeySym.S, tcod.event.KeySym.DOWN]:
-            dy = 1
-        elif key in [tcod.event.KeySym.A, tcod.event.KeySym.LEFT]:
-            dx = -1
-        elif key in [tcod.event.KeySym.D, tcod.event.KeySym.RIGHT]:
-            dx = 1
-
-        if dx != 0 or dy != 0:
-            if current_scale == ViewScale.LOCAL:
-                # Use existing camera system for detailed view
-                self.legacy_camera.move(dx, dy)
-                # Update world generator with new camera position
-                world_x, world_y = self.legacy_camera.get_position()
-                self.world_generator.update_camera_position(world_x, world_y)
-
-                # Sync multi-scale camera to match legacy camera position
-                self._sync_multi_scale_to_legacy_camera()
-            else:
-                # Use multi-scale camera for world/regional
-                self.multi_scale_camera.move_camera(dx, dy)
+        move = self._MOVEMENT_KEYS.get(key)
+        if move is not None:
+            self._apply_movement(*move)
             return
 
         # Drill down functionality
-        if key == tcod.event.KeySym.RETURN or key == tcod.event.KeySym.KP_ENTER:
-            if current_scale == ViewScale.WORLD:
-                # Drill down to regional view, centered on current world position
-                self.multi_scale_camera.change_scale(ViewScale.REGIONAL)
-                # Center regional camera
-                self.multi_scale_camera.set_camera_position(16, 16)
-            elif current_scale == ViewScale.REGIONAL:
-                # Drill down to local view
-                self.multi_scale_camera.change_scale(ViewScale.LOCAL)
-                self._sync_legacy_to_multi_scale_camera()
+        if key in self._DRILL_KEYS:
+            drill_scale = self._DRILL_DOWN.get(current_scale)
+            if drill_scale is not None:
+                self._switch_scale(drill_scale)
             return
 
         # Info toggle for world/regional scales
         if key == tcod.event.KeySym.I:
-            if current_scale in [ViewScale.WORLD, ViewScale.REGIONAL]:
+            if current_scale in self._OVERVIEW_SCALES:
                 self.show_world_info = not self.show_world_info
                 return
 
         # Legacy controls (only in LOCAL scale)
         if current_scale == ViewScale.LOCAL:
-            # Layer switching hotkeys
-            hotkey_char = None
-            if key == tcod.event.KeySym.Z:
-                hotkey_char = 'z'
-            elif key == tcod.event.KeySym.X:
-                hotkey_char = 'x'
-            elif key == tcod.event.KeySym.C:
-                hotkey_char = 'c'
-            elif key == tcod.event.KeySym.M:
+            if key == tcod.event.KeySym.M:
                 # Toggle map mode
                 self.map_renderer.toggle_map_mode()
                 mode_name = "Overview" if self.map_renderer.is_overview_mode() else "Detailed"
                 print(f"Switched to {mode_name} mode")
                 return
 
+            # Layer switching hotkeys
+            hotkey_char = self._LAYER_HOTKEYS.get(key)
             if hotkey_char:
                 hotkey_handled = self.command_registry.execute_hotkey(hotkey_char)
                 if hotkey_handled:
                     return
 
         # Quit key (ESC or Q)
-        if key == tcod.event.KeySym.ESCAPE or key == tcod.event.KeySym.Q:
+        if key in self._QUIT_KEYS:
             self.running = False
 
+    def _movement_delta(self, event: tcod.event.KeyDown):
+        """Return the (dx, dy) of a movement keypress, or None for any other key."""
+        # An open command palette consumes all keys, including movement keys
+        if self.command_palette.is_open:
+            return None
+        return self._MOVEMENT_KEYS.get(event.sym)
+
+    def _apply_movement(self, dx: int, dy: int) -> None:
+        """Move the camera of the current scale by (dx, dy) tiles."""
+        if self._current_scale == ViewScale.LOCAL:
+            # Use existing camera system for detailed view
+            self.legacy_camera.move(dx, dy)
+            # Update world generator with new camera position (deferred while preloading)
+            if self._is_local_view_ready():
+                world_x, world_y = self.legacy_camera.get_position()
+                with self._world_lock:
+                    self.world_generator.update_camera_position(world_x, world_y)
+                self._request_prefetch(world_x, world_y, dx, dy)
+
+            # Sync multi-scale camera to match legacy camera position
+            self._sync_multi_scale_to_legacy_camera()
+        else:
+            # Use multi-scale camera for world/regional
+            self.multi_scale_camera.move_camera(dx, dy)
+
+    def _switch_scale(self, new_scale: ViewScale) -> None:
+        """Change the active scale and re-center the relevant camera."""
+        old_scale = self._current_scale
+        self.multi_scale_camera.change_scale(new_scale)
+        self._select_scale_renderers(new_scale)
+
+        if new_scale == ViewScale.REGIONAL and old_scale == ViewScale.WORLD:
+            # Center regional camera (16,16 is center of 32x32 regional view)
+            self.multi_scale_camera.set_camera_position(16, 16)
+        elif new_scale == ViewScale.LOCAL and old_scale != ViewScale.LOCAL:
+            # Sync legacy camera when switching to local scale
+            self._sync_legacy_to_multi_scale_camera()
+
+        self.last_scale_switch_time = time.time()
+
+    def _select_scale_renderers(self, scale: ViewScale) -> None:
+        """Specialize the per-frame scene and UI renderers for the given scale."""
+        self._current_scale = scale
+        self._current_render = self._scene_renderers[scale]
+        self._current_ui = self._ui_renderers[scale]
+
     def _sync_multi_scale_to_legacy_camera(self) -> None:
         """Sync multi-scale camera position to match legacy camera (less aggressive)."""
         world_x, world_y = self.legacy_camera.get_position()
 
         # Update local scale position in multi-scale camera (only for local scale)
-        if self.multi_scale_camera.get_current_scale() == ViewScale.LOCAL:
+        if self._current_scale == ViewScale.LOCAL:
             local_x = world_x // 32  # Convert to chunk coordinates
             local_y = world_y // 32
             self.multi_scale_camera.set_camera_position(local_x, local_y)
 
     def _sync_legacy_to_multi_scale_camera(self) -> None:
         """Sync legacy camera position to match multi-scale camera when switching to local."""
-        if self.multi_scale_camera.get_current_scale() == ViewScale.LOCAL:
+        if self._current_scale == ViewScale.LOCAL:
             # Get the center of the current multi-scale local chunk
             world_x, world_y = self.multi_scale_camera.get_current_world_coordinates()
 
@@ -309,25 +432,104 @@ class Game:
 
             self.legacy_camera.set_position(centered_x, centered_y)
 
-            # Update world generator
-            self.world_generator.update_camera_position(centered_x, centered_y)
+            # Update world generator (deferred while preloading)
+            if self._is_local_view_ready():
+                with self._world_lock:
+                    self.world_generator.update_camera_position(centered_x, centered_y)
+
+    def _is_local_view_ready(self) -> bool:
+        """Check whether the background spawn preload has finished."""
+        if not self._local_ready and self._preload_future.done():
+            # Surface any preload error, then catch the generator up with camera moves
+            # that happened while loading
+            self._preload_future.result()
+            self._local_ready = True
+            world_x, world_y = self.legacy_camera.get_position()
+            with self._world_lock:
+                self.world_generator.update_camera_position(world_x, world_y)
+        return self._local_ready
+
+    def _request_prefetch(self, world_x: int, world_y: int, dx: int, dy: int) -> None:
+        """Queue generation of the chunks ahead of the camera in its direction of travel."""
+        # Only the direction matters; coalesced moves can be more than one tile
+        step_x = (dx > 0) - (dx < 0)
+        step_y = (dy > 0) - (dy < 0)
+        camera_chunk = self.world_generator.chunk_manager.world_to_chunk_coordinate(world_x, world_y)
+        key = (camera_chunk.x, camera_chunk.y, step_x, step_y)
+
+        # Skip duplicates and bound the backlog so fast movement cannot run away
+        if key in self._pending_prefetch or len(self._pending_prefetch) >= self._max_pending_prefetch:
+            return
+
+        self._pending_prefetch.add(key)
+        self._prefetch_executor.submit(self._prefetch_chunks, camera_chunk, step_x, step_y, key)
+
+    def _prefetch_chunks(self, camera_chunk: ChunkCoordinate, step_x: int, step_y: int, key) -> None:
+        """
+        Generate the leading edge of chunks one step ahead of the camera (runs on the prefetch thread).
+
+        Only chunks that enter the load radius on the next chunk step are generated, and
+        never more than the chunk cache has room for next to the chunks around the
+        camera, so prefetching cannot evict chunks that are still being drawn.
+        """
+        try:
+            chunk_manager = self.world_generator.chunk_manager
+            chunk_size = self.world_generator.chunk_size
+            radius = self.world_generator.load_radius
+
+            around_camera = chunk_manager.get_chunks_in_radius(camera_chunk, radius)
+            ahead = ChunkCoordinate(camera_chunk.x + step_x, camera_chunk.y + step_y)
+            leading_edge = chunk_manager.get_chunks_in_radius(ahead, radius) - around_camera
+
+            budget = chunk_manager.cache_size - len(around_camera)
+            for chunk_coord in sorted(leading_edge, key=lambda c: (c.y, c.x))[:max(0, budget)]:
+                if not self.running:
+                    return
+                # Lock one chunk at a time so the main loop is never blocked for long
+                with self._world_lock:
+                    self.world_generator.preload_chunks_around(
+                        chunk_coord.x * chunk_size, chunk_coord.y * chunk_size, radius=0
+                    )
+        finally:
+            self._pending_prefetch.discard(key)
+
+    def _update_simulation(self) -> None:
+        """Advance the animal simulation in fixed steps, independent of frame rate."""
+        now = time.monotonic()
+        self._sim_accum += now - self._sim_last
+        self._sim_last = now
+
+        # Animals only live in the detailed local view
+        if (self._current_scale != ViewScale.LOCAL or
+                not self._is_local_view_ready()):
+            self._sim_accum = 0.0
+            return
+
+        steps = 0
+        while self._sim_accum >= self._sim_dt and steps < self._sim_max_steps:
+            with self._world_lock:
+                self.world_generator.update_animals_continuous()
+            self._sim_accum -= self._sim_dt
+            steps += 1
+
+        # Drop any backlog we could not catch up on rather than spiralling
+        if steps == self._sim_max_steps:
+            self._sim_accum = 0.0
 
     def render(self) -> None:
         """Render the game using the multi-scale system."""
         # Clear the console
         self.console.clear(fg=(255, 255, 255), bg=(0, 0, 0))
 
-        current_scale = self.multi_scale_camera.get_current_scale()
+        # Read the camera state once for this frame
+        camera = self.multi_scale_camera
+        cam_x, cam_y = camera.get_camera_position()
+        world_x, world_y = camera.get_current_world_coordinates()
+        ctx = RenderContext(self._current_scale, cam_x, cam_y, world_x, world_y)
 
-        if current_scale == ViewScale.LOCAL:
-            # Use existing detailed rendering system for Local scale
-            self._render_detailed_local_view()
-        else:
-            # Use new multi-scale rendering for World/Regional scales
-            self.multi_scale_renderer.render_current_scale(self.console)
-
-        # Always render UI elements
-        self._render_ui_elements()
+        # Scene and UI renderers were selected for the current scale on scale change
+        self._current_render(ctx)
+        self._current_ui(ctx)
 
         # Render command palette (if open)
         self.command_palette.render(self.console)
@@ -335,6 +537,18 @@ class Game:
         # Update FPS counter
         self._update_fps()
 
+    def _render_local_scene(self, ctx: RenderContext) -> None:
+        """Render the Local scale using the existing detailed rendering system."""
+        if self._is_local_view_ready():
+            with self._world_lock:
+                self._render_detailed_local_view()
+        else:
+            self._render_loading_message()
+
+    def _render_multi_scale_scene(self, ctx: RenderContext) -> None:
+        """Render the World/Regional scales with the multi-scale renderer."""
+        self.multi_scale_renderer.render_current_scale(self.console)
+
     def _render_detailed_local_view(self) -> None:
         """Render detailed local view using existing systems."""
         # Use the legacy camera position directly - don't sync from multi-scale
@@ -342,71 +556,63 @@ class Game:
         camera_x, camera_y = self.legacy_camera.get_position()
         self.map_renderer.set_camera_position(camera_x, camera_y)
 
-        # Update animals continuously (every frame)
-        self.world_generator.update_animals_continuous()
-
-        # Store original camera settings for full screen rendering
-        original_width = self.legacy_camera.screen_width
-        original_height = self.legacy_camera.screen_height
-        original_crosshair_x = self.legacy_camera.config.crosshair_x
-        original_crosshair_y = self.legacy_camera.config.crosshair_y
-
-        # Set camera to full screen dimensions
-        self.legacy_camera.screen_width = self.console.width
-        self.legacy_camera.screen_height = self.console.height
-        self.legacy_camera.config.crosshair_x = self.console.width // 2
-        self.legacy_camera.config.crosshair_y = self.console.height // 2
-
-        # Render world and crosshair
-        self.legacy_viewport.render_world(self.console, self.world_generator)
-        self.legacy_viewport.render_crosshair(self.console, self.world_generator)
-
-        # Restore original camera settings
-        self.legacy_camera.screen_width = original_width
-        self.legacy_camera.screen_height = original_height
-        self.legacy_camera.config.crosshair_x = original_crosshair_x
-        self.legacy_camera.config.crosshair_y = original_crosshair_y
-
-    def _render_ui_elements(self) -> None:
-        """Render UI elements appropriate for current scale."""
-        current_scale = self.multi_scale_camera.get_current_scale()
+        # Render world and crosshair with the camera temporarily set to full screen
+        width, height = self.console.width, self.console.height
+        with self.legacy_camera.override(
+            screen_width=width,
+            screen_height=height,
+            crosshair_x=width // 2,
+            crosshair_y=height // 2,
+        ):
+            self.legacy_viewport.render_world(self.console, self.world_generator)
+            self.legacy_viewport.render_crosshair(self.console, self.world_generator)
+
+    def _render_loading_message(self) -> None:
+        """Render a placeholder while spawn chunks are still being generated."""
+        message = "Loading chunks…"
+        x = max(0, (self.console.width - len(message)) // 2)
+        self.console.print(x, self.console.height // 2, message, fg=(200, 200, 200), bg=(0, 0, 0))
+
+    def _render_local_ui(self, ctx: RenderContext) -> None:
+        """Render the full UI for the detailed Local view."""
+        if not self._is_local_view_ready():
+            return
 
-        if current_scale == ViewScale.LOCAL:
-            # Full UI for detailed view
-            camera_x, camera_y = self.legacy_camera.get_position()
-            cursor_world_pos = (camera_x, camera_y)
+        camera_x, camera_y = self.legacy_camera.get_position()
+        cursor_world_pos = (camera_x, camera_y)
+        with self._world_lock:
             self.status_bar.render(self.console, self.world_generator, cursor_world_pos)
-            self.instructions_panel.render(self.console)
-        else:
-            # Simplified UI for world/regional views
-            self._render_scale_navigation_ui()
+        self.instructions_panel.render(self.console)
 
-    def _render_scale_navigation_ui(self) -> None:
+    def _render_scale_navigation_ui(self, ctx: RenderContext) -> None:
         """Render UI for world/regional scales."""
-        current_scale = self.multi_scale_camera.get_current_scale()
-        camera_x, camera_y = self.multi_scale_camera.get_camera_position()
-        world_x, world_y = self.multi_scale_camera.get_current_world_coordinates()
-
-        # Top status bar with scale info
-        status_text = f"Scale: {current_scale.value.title()} | Pos: {camera_x},{camera_y} | World: {world_x},{world_y}"
-        if len(status_text) < self.console.width - 4:
-            self.console.print(2, 2, status_text, fg=(255, 255, 255), bg=(60, 60, 60))
+        # Top status bar with scale info (re-formatted only when position or scale changes)
+        status_key = (ctx.scale, ctx.cam_x, ctx.cam_y, ctx.world_x, ctx.world_y)
+        if status_key != self._last_status_key:
+            self._last_status_text = f"Scale: {ctx.scale.value.title()} | Pos: {ctx.cam_x},{ctx.cam_y} | World: {ctx.world_x},{ctx.world_y}"
+            self._last_status_len = len(self._last_status_text)
+            self._last_status_key = status_key
+        status_len = self._last_status_len
+        if status_len < self.console.width - 4:
+            self.console.print(2, 2, self._last_status_text, fg=(255, 255, 255), bg=(60, 60, 60))
 
         # Show world info if requested
         if self.show_world_info:
             self._render_world_info()
 
         # Bottom instructions
-        instructions = "1=World  2=Regional  3=Local  |  WASD=Move  Enter=Drill  I=Info  ESC=Quit"
-        if len(instructions) < self.console.width - 4:
-            self.console.print(2, self.console.height - 3, instructions, fg=(200, 200, 200), bg=(60, 60, 60))
+        if self._nav_instructions_len < self.console.width - 4:
+            self.console.print(2, self.console.height - 3, self._nav_instructions, fg=(200, 200, 200), bg=(60, 60, 60))
 
     def _render_world_info(self) -> None:
         """Render world generation information."""
-        world_info = self.world_scale_generator.get_world_info()
+        if self._world_info_lines is None:
+            # World stats never change after generation, so format them only once
+            world_info = self.world_scale_generator.get_world_info()
+            if world_info["status"] != "complete":
+                return
 
-        if world_info["status"] == "complete":
-            info_lines = [
+            self._world_info_lines = [
                 f"World Seed: {world_info['seed']}",
                 f"Size: {world_info['world_size'][0]}×{world_info['world_size'][1]} sectors",
                 f"Avg Elevation: {world_info['average_elevation']:.1f}m",
@@ -415,11 +621,11 @@ class Game:
                 f"Generation Time: {world_info['generation_time']:.2f}s"
             ]
 
-            # Render info box
-            start_y = 5
-            for i, line in enumerate(info_lines):
-                if start_y + i < self.console.height - 5:
-                    self.console.print(2, start_y + i, line, fg=(200, 200, 200), bg=(40, 40, 40))
+        # Render info box
+        start_y = 5
+        for i, line in enumerate(self._world_info_lines):
+            if start_y + i < self.console.height - 5:
+                self.console.print(2, start_y + i, line, fg=(200, 200, 200), bg=(40, 40, 40))
 
     def _update_fps(self) -> None:
         """Update FPS counter for performance monitoring."""
@@ -464,25 +670,30 @@ class Game:
 
                             print(f"Console resized: {self.screen_width}x{self.screen_height} -> {new_width}x{new_height}")
 
-                            self.screen_width = new_width
-                            self.screen_height = new_height
                             self.stable_size = (new_width, new_height)
                             self.last_resize_time = current_time
 
-                            # Create new console with new dimensions
-                            self.console = tcod.console.Console(self.screen_width, self.screen_height)
-
-                            # Update camera dimensions
-                            self._update_camera_dimensions()
+                            # Switch to the new console dimensions
+                            self._resize_console(new_width, new_height)
 
-                # Handle events
+                # Handle events, coalescing all movement keys of this frame into one move
+                frame_dx = frame_dy = 0
                 for event in tcod.event.get():
                     if event.type == "QUIT":
                         self.running = False
-                    elif event.type == "KEYDOWN":
-                        self.handle_keydown(event)
-
-                # Render the game
+                    elif isinstance(event, tcod.event.KeyDown):
+                        move = self._movement_delta(event)
+                        if move is not None:
+                            frame_dx += move[0]
+                            frame_dy += move[1]
+                        else:
+                            self.handle_keydown(event)
+
+                if frame_dx or frame_dy:
+                    self._apply_movement(frame_dx, frame_dy)
+
+                # Advance the simulation, then render the game
+                self._update_simulation()
                 self.render()
 
                 # Present to screen
@@ -494,6 +705,8 @@ class Game:
             # Cleanup map renderer background processing
             if hasattr(self, 'map_renderer'):
                 self.map_renderer.cleanup()
+            self._preload_executor.shutdown(wait=False)
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
             context.close()
 
 
@@ -0,0 +1,91 @@
+"""
+Console buffer kernels for UI rendering.
+
+These write glyphs and colors straight into a tcod console's ``ch``/``fg``/``bg``
+arrays instead of issuing one ``console.print`` call per cell. They are
+JIT-compiled when Numba is available; the slice-based bodies are fast on
+plain NumPy as well.
+"""
+
+from .._jit import njit
+
+# Rounded box-drawing codepoints used by floating panels
+BOX_HORIZONTAL = 0x2500  # ─
+BOX_VERTICAL = 0x2502  # │
+BOX_TOP_LEFT = 0x256D  # ╭
+BOX_TOP_RIGHT = 0x256E  # ╮
+BOX_BOTTOM_RIGHT = 0x256F  # ╯
+BOX_BOTTOM_LEFT = 0x2570  # ╰
+SPACE = 0x20
+
+
+@njit(cache=True)
+def blit_panel(ch, fg, bg, y, x, height, width, border_fg, panel_bg):
+    """
+    Draw a filled panel with a rounded border into console buffers.
+
+    The interior is cleared to spaces on ``panel_bg`` (foreground untouched)
+    and the border is drawn with ``border_fg`` on ``panel_bg``. The caller
+    must ensure the rectangle lies inside the console.
+
+    Args:
+        ch: Console codepoint array, shape (height, width)
+        fg: Console foreground array, shape (height, width, 3)
+        bg: Console background array, shape (height, width, 3)
+        y: Top row of the panel
+        x: Left column of the panel
+        height: Panel height including border
+        width: Panel width including border
+        border_fg: Border color as a uint8 array of shape (3,)
+        panel_bg: Background color as a uint8 array of shape (3,)
+    """
+    bottom = y + height - 1
+    right = x + width - 1
+
+    # Panel background
+    ch[y:y + height, x:x + width] = SPACE
+    bg[y:y + height, x:x + width] = panel_bg
+
+    # Border lines
+    ch[y, x + 1:right] = BOX_HORIZONTAL
+    ch[bottom, x + 1:right] = BOX_HORIZONTAL
+    ch[y + 1:bottom, x] = BOX_VERTICAL
+    ch[y + 1:bottom, right] = BOX_VERTICAL
+
+    # Corners
+    ch[y, x] = BOX_TOP_LEFT
+    ch[y, right] = BOX_TOP_RIGHT
+    ch[bottom, x] = BOX_BOTTOM_LEFT
+    ch[bottom, right] = BOX_BOTTOM_RIGHT
+
+    fg[y, x:x + width] = border_fg
+    fg[bottom, x:x + width] = border_fg
+    fg[y + 1:bottom, x] = border_fg
+    fg[y + 1:bottom, right] = border_fg
+
+
+@njit(cache=True)
+def blit_text(ch, fg, bg, y, x, codes, text_fg, text_bg):
+    """
+    Write a pre-encoded line of text into console buffers.
+
+    Text running past the right edge of the console is clipped, matching
+    ``console.print``.
+
+    Args:
+        ch: Console codepoint array, shape (height, width)
+        fg: Console foreground array, shape (height, width, 3)
+        bg: Console background array, shape (height, width, 3)
+        y: Row to write to
+        x: Column of the first character
+        codes: Codepoints of the text as an int32 array
+        text_fg: Text color as a uint8 array of shape (3,)
+        text_bg: Background color as a uint8 array of shape (3,)
+    """
+    n = min(codes.shape[0], ch.shape[1] - x)
+    if n <= 0 or y < 0 or y >= ch.shape[0]:
+        return
+
+    ch[y, x:x + n] = codes[:n]
+    fg[y, x:x + n] = text_fg
+    bg[y, x:x + n] = text_bg
@@ -0,0 +1,73 @@
+"""
+Console buffer kernel for the zoomed map overview.
+
+Expands a grid of chunk summaries into 4x4 blocks written straight into a
+tcod console's ``ch``/``fg``/``bg`` arrays, one pixel at a time. This is
+only fast when JIT-compiled, so callers should check ``HAS_NUMBA`` and use
+their vectorized NumPy path otherwise.
+"""
+
+from .._jit import HAS_NUMBA, njit
+
+# Flag bits of the chunk summary table
+FLAG_WATER = 0x01
+FLAG_RESOURCES = 0x02
+
+MARKER_RESOURCE = 0x25CF  # ●
+MARKER_POPULATION_HIGH = 0x25A0  # ■
+MARKER_POPULATION = 0x25A1  # □
+
+__all__ = ["HAS_NUMBA", "FLAG_WATER", "FLAG_RESOURCES", "blit_overview"]
+
+
+@njit(cache=True)
+def blit_overview(ch, fg, bg, y, x, height, width, terrain_id, color, flags, pop,
+                  lut_ch, lut_bg, fg_variation):
+    """
+    Draw chunk blocks into console buffers.
+
+    Each chunk becomes a block using its terrain's character and background
+    pattern, its own color shifted by ``fg_variation``, and a resource or
+    population marker in the cell at (1, 1) of land blocks. The caller must
+    ensure the rectangle lies inside the console.
+
+    Args:
+        ch: Console codepoint array
+        fg: Console foreground array
+        bg: Console background array
+        y: Top row of the first block
+        x: Left column of the first block
+        height: Rows to draw
+        width: Columns to draw
+        terrain_id: Terrain id per chunk, shape (rows, cols)
+        color: Foreground color per chunk, shape (rows, cols, 3)
+        flags: Summary flag bits per chunk, shape (rows, cols)
+        pop: Population level per chunk, shape (rows, cols)
+        lut_ch: Codepoint pattern per terrain id, shape (terrains, size, size)
+        lut_bg: Background pattern per terrain id, shape (terrains, size, size, 3)
+        fg_variation: Foreground shift per block cell, shape (size, size)
+    """
+    size = lut_ch.shape[1]
+    for dy in range(height):
+        row = dy // size
+        sy = dy - row * size
+        for dx in range(width):
+            col = dx // size
+            sx = dx - col * size
+            tid = terrain_id[row, col]
+
+            code = lut_ch[tid, sy, sx]
+            if sy == 1 and sx == 1 and not flags[row, col] & FLAG_WATER:
+                if flags[row, col] & FLAG_RESOURCES:
+                    code = MARKER_RESOURCE
+                elif pop[row, col] > 2:
+                    code = MARKER_POPULATION_HIGH
+                elif pop[row, col] > 0:
+                    code = MARKER_POPULATION
+            ch[y + dy, x + dx] = code
+
+            shift = fg_variation[sy, sx]
+            for c in range(3):
+                value = color[row, col, c] + shift
+                fg[y + dy, x + dx, c] = min(max(value, 0), 255)
+                bg[y + dy, x + dx, c] = lut_bg[tid, sy, sx, c]
@@ -5,17 +5,36 @@ This module provides a clean 3-line panel at the bottom of the screen
 showing essential commands and instructions.
 """
 
+import numpy as np
 import tcod
 
+from ._kernels import blit_panel, blit_text
+
 
 class InstructionsPanel:
     """A 3-line panel at the bottom showing current instructions."""
+
+    __slots__ = ('is_visible', 'content_height', 'height', '_panel_bg', '_border_fg', '_lines')
     
     def __init__(self):
         """Initialize the instructions panel."""
         self.is_visible = True
         self.content_height = 3  # 3 lines of content
         self.height = 5  # 3 content + 2 border = 5 total
+
+        # Panel colors as arrays for the console buffer blits
+        self._panel_bg = np.array((60, 60, 60), dtype=np.uint8)  # Dark gray
+        self._border_fg = np.array((120, 120, 120), dtype=np.uint8)  # Light gray for border
+        text_fg = np.array((255, 255, 255), dtype=np.uint8)  # White text on dark background
+        text_fg_blue = np.array((150, 200, 255), dtype=np.uint8)  # Light blue text for variety
+        text_fg_gray = np.array((180, 180, 180), dtype=np.uint8)  # Light gray text
+
+        # Content lines, pre-encoded as codepoints with their text color
+        self._lines = [
+            (_encode("⌘ CMD+K or CTRL+K to open command palette"), text_fg),
+            (_encode("🔄 Layers: [Z] Surface | [X] Underground | [C] Mountains"), text_fg_blue),
+            (_encode("📖 Press [H] to toggle this help panel"), text_fg_gray),
+        ]
     
     def toggle_visibility(self) -> None:
         """Toggle the visibility of the instructions panel."""
@@ -36,60 +55,29 @@ class InstructionsPanel:
         panel_width = console.width - 4  # 2 chars margin on each side
         panel_x = 2  # Left margin
 
-        # Background color for the floating panel
-        panel_bg = (60, 60, 60)  # Dark gray
-        border_fg = (120, 120, 120)  # Light gray for border
-        text_fg = (255, 255, 255)  # White text on dark background
+        # Panel must fit inside the console
+        if panel_y < 0 or panel_width < 2:
+            return
 
         # No need to clear margins - the world renders behind and panels render on top
 
-        # Draw panel background (only the panel area)
-        for y in range(panel_y, panel_y + self.height):
-            for x in range(panel_x, panel_x + panel_width):
-                console.print(x, y, " ", bg=panel_bg)
-
-        # Draw rounded border
-        # Top border
-        console.print(panel_x, panel_y, "╭", fg=border_fg, bg=panel_bg)  # Top-left corner
-        for x in range(panel_x + 1, panel_x + panel_width - 1):
-            console.print(x, panel_y, "─", fg=border_fg, bg=panel_bg)  # Top line
-        console.print(panel_x + panel_width - 1, panel_y, "╮", fg=border_fg, bg=panel_bg)  # Top-right corner
-
-        # Side borders
-        for y in range(panel_y + 1, panel_y + self.height - 1):
-            console.print(panel_x, y, "│", fg=border_fg, bg=panel_bg)  # Left side
-            console.print(panel_x + panel_width - 1, y, "│", fg=border_fg, bg=panel_bg)  # Right side
-
-        # Bottom border
-        console.print(panel_x, panel_y + self.height - 1, "╰", fg=border_fg, bg=panel_bg)  # Bottom-left corner
-        for x in range(panel_x + 1, panel_x + panel_width - 1):
-            console.print(x, panel_y + self.height - 1, "─", fg=border_fg, bg=panel_bg)  # Bottom line
-        console.print(panel_x + panel_width - 1, panel_y + self.height - 1, "╯", fg=border_fg, bg=panel_bg)  # Bottom-right corner
+        # Draw panel background and rounded border directly into the console buffers
+        blit_panel(
+            console.ch, console.fg, console.bg,
+            panel_y, panel_x, self.height, panel_width,
+            self._border_fg, self._panel_bg,
+        )
 
         # Content area starts at panel_y + 1 (inside the border)
         content_y = panel_y + 1
         content_x = panel_x + 2  # 2 chars inside the border for padding
 
-        # Line 1: Command palette instruction
-        console.print(
-            content_x, content_y,
-            "⌘ CMD+K or CTRL+K to open command palette",
-            fg=text_fg, bg=panel_bg
-        )
-
-        # Line 2: Layer switching instructions
-        console.print(
-            content_x, content_y + 1,
-            "🔄 Layers: [Z] Surface | [X] Underground | [C] Mountains",
-            fg=(150, 200, 255), bg=panel_bg  # Light blue text for variety
-        )
-
-        # Line 3: Help instruction
-        console.print(
-            content_x, content_y + 2,
-            "📖 Press [H] to toggle this help panel",
-            fg=(180, 180, 180), bg=panel_bg  # Light gray text
-        )
+        # Command palette, layer switching and help instruction lines
+        for i, (codes, text_fg) in enumerate(self._lines):
+            blit_text(
+                console.ch, console.fg, console.bg,
+                content_y + i, content_x, codes, text_fg, self._panel_bg,
+            )
     
     def get_height(self) -> int:
         """
@@ -101,6 +89,11 @@ class InstructionsPanel:
         return (self.height + 1) if self.is_visible else 0  # +1 for bottom margin
 
 
+def _encode(text: str) -> np.ndarray:
+    """Encode text as an array of codepoints for blit_text."""
+    return np.array([ord(char) for char in text], dtype=np.int32)
+
+
 def create_instructions_panel() -> InstructionsPanel:
     """
     Create a default instructions panel.
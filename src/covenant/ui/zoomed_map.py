@@ -9,17 +9,117 @@ MAIN PERFORMANCE FIXES:
 5. Fast noise-based terrain classification
 """
 
+import logging
+import queue
 import threading
 import time
+from array import array
 from typing import Dict, Tuple, Optional, Set
 from dataclasses import dataclass
-from enum import Enum
-from concurrent.futures import ThreadPoolExecutor
+from enum import Enum, IntEnum
+import numpy as np
 import tcod
 
 from ..world.layered import WorldLayer
 from ..world.terrain import TerrainType
 from ..world.chunks import ChunkCoordinate
+from ._overview_kernels import HAS_NUMBA, FLAG_RESOURCES, FLAG_WATER, blit_overview
+
+log = logging.getLogger(__name__)
+
+
+# Open-addressed chunk summary table, indexed by the Morton code of the low
+# 8 bits of each chunk coordinate so neighbouring chunks land in nearby slots
+_SUMMARY_CAPACITY = 1 << 16
+_SUMMARY_MASK = _SUMMARY_CAPACITY - 1
+_MAX_PROBE = 32  # Linear probe window; the stalest entry in it is evicted when full
+
+# Fields of a chunk summary. Freshly sampled summaries are built as records of
+# this dtype; the table stores one column per field (structure of arrays).
+_SUMMARY_ROW_DTYPE = np.dtype([
+    ("key", np.int64),  # Chunk coordinates packed by _pack_key
+    ("elevation", np.float16),
+    ("terrain_id", np.int16),
+    ("flags", np.uint8),
+    ("pop", np.uint8),
+    ("color", np.uint8, (3,)),
+    ("char_id", np.uint32),
+])
+
+_FLAG_USED = 0x80  # Slot holds a summary (other flag bits come from the kernels)
+
+_PENDING_TS = -np.inf  # Timestamp of slots reserved for a queued background summary
+
+# Background generation ring of packed chunk keys (power of two)
+_RING_CAPACITY = 1024
+_RING_MASK = _RING_CAPACITY - 1
+
+_DEFAULT_BG_COLOR = (5, 10, 5)  # Overview background of terrains without their own
+
+# Bits 0-7 spread to the even bit positions, for 16-bit Morton codes
+_MORTON_SPREAD = np.zeros(256, dtype=np.int64)
+for _bit in range(8):
+    _MORTON_SPREAD |= ((np.arange(256) >> _bit) & 1) << (2 * _bit)
+del _bit
+
+
+def _morton2d(x, y):
+    """Interleave the low 8 bits of x and y (ints or integer arrays) into a 16-bit code."""
+    return _MORTON_SPREAD[x & 0xFF] | (_MORTON_SPREAD[y & 0xFF] << 1)
+
+
+def _pack_key(x, y):
+    """Pack 32-bit chunk coordinates (ints or int64 arrays) into one 64-bit key, x in the high half."""
+    return (x << 32) | (y & 0xFFFFFFFF)
+
+
+def _unpack_key(key):
+    """Split packed keys (ints or int64 arrays) back into chunk coordinates."""
+    return key >> 32, ((key & 0xFFFFFFFF) ^ 0x80000000) - 0x80000000
+
+
+def _pack_rgb(colors: np.ndarray) -> np.ndarray:
+    """Pack uint8 RGB colors (any leading shape) into a flat array of native 32-bit RGBX words."""
+    packed = np.zeros((colors.size // 3, 4), dtype=np.uint8)
+    packed[:, :3] = colors.reshape(-1, 3)
+    return packed.view(np.uint32).ravel()
+
+
+def _home_slot(key):
+    """Get the first table slot probed for packed keys (the low coordinate bits sit in both halves)."""
+    return _morton2d(key >> 32, key)
+
+
+class TerrainId(IntEnum):
+    """Overview terrain classes, used as indices into the terrain lookup tables."""
+    WATER = 0
+    SHALLOW_WATER = 1
+    DEEP_WATER = 2
+    GRASS = 3
+    GRASSLAND = 4
+    LIGHT_GRASS = 5
+    DARK_GRASS = 6
+    FOREST = 7
+    HILLS = 8
+    MOUNTAINS = 9
+    DESERT = 10
+    SWAMP = 11
+    FERTILE = 12
+    SAND = 13
+    CAVES = 14
+    UNKNOWN = 15  # Fallback without a pre-computed appearance
+
+
+_WATER_TERRAIN = frozenset({TerrainId.WATER, TerrainId.SHALLOW_WATER, TerrainId.DEEP_WATER})
+
+# Characters cycled through by (dx + dy) % 3 across plain overview blocks
+_TERRAIN_VARIATION_CHARS = {
+    TerrainId.GRASSLAND: (".", "·", ","),
+    TerrainId.FOREST: ("♠", "♣", "T"),
+    TerrainId.HILLS: ("^", "▲", "∩"),
+    TerrainId.DESERT: ("·", "∘", "°"),
+    TerrainId.MOUNTAINS: ("▲", "⩙", "∩"),
+}
 
 
 class MapMode(Enum):
@@ -31,7 +131,7 @@ class MapMode(Enum):
 @dataclass
 class ChunkSummary:
     """Compact representation of a chunk for overview rendering."""
-    dominant_terrain: str
+    terrain_id: TerrainId
     average_elevation: float
     has_water: bool
     has_resources: bool
@@ -59,48 +159,156 @@ class ZoomedMapRenderer:
         self.last_detailed_cursor_y = 0
 
         # PERFORMANCE FIX 1: Aggressive caching with expiration
-        self.chunk_summaries: Dict[Tuple[int, int], ChunkSummary] = {}
-        self.summary_timestamps: Dict[Tuple[int, int], float] = {}
+        self._summary_columns: Dict[str, np.ndarray] = {
+            name: np.zeros((_SUMMARY_CAPACITY, *field.shape), dtype=field.base)
+            for name, (field, _) in _SUMMARY_ROW_DTYPE.fields.items()
+        }
+        self._summary_ts = np.zeros(_SUMMARY_CAPACITY, dtype=np.float64)
+        # Only the main thread writes the table; the worker hands results back
         self.cache_ttl = 60.0  # Cache for 60 seconds
-
-        # PERFORMANCE FIX 2: Pre-computed terrain lookup
-        self.terrain_colors = self._precompute_terrain_colors()
+        # Monotonic clock reading shared by every TTL check of the current frame
+        self._frame_time = time.monotonic()
+
+        # PERFORMANCE FIX 2: Pre-computed terrain lookup, one row per terrain id
+        # (structure of arrays; the source dicts are not kept)
+        terrain_colors = self._precompute_terrain_colors()
+        terrain_bg_colors = self._precompute_terrain_bg_colors()
+        appearances = [terrain_colors.get(terrain, (".", (100, 150, 100))) for terrain in TerrainId]
+        self._fg_base = np.array([color for _, color in appearances], dtype=np.uint8)
+        self._bg_base = np.array([terrain_bg_colors.get(terrain, _DEFAULT_BG_COLOR) for terrain in TerrainId],
+                                 dtype=np.uint8)
+        self._char_codes = np.array([ord(char) for char, _ in appearances], dtype=np.uint32)
 
         # PERFORMANCE FIX 3: Batch generation queue
-        self.background_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MapGen")
         self.generation_queue: Set[Tuple[int, int]] = set()
-        self.currently_generating: Set[Tuple[int, int]] = set()
 
         # Settings
         self.overview_chunk_size = 4  # 4x4 pixels per chunk in overview
         self.background_radius = 2    # Reduced for less background work
-
-        # PERFORMANCE FIX 4: Reduce lock contention
-        self._generation_lock = threading.Lock()  # Only lock generation queue
+        # World tiles per chunk, resolved once rather than per sample or key press
+        self._world_chunk_size = getattr(getattr(world_generator, 'chunk_manager', None), 'chunk_size', 32)
+        self._recompute_overview_metrics()
+
+        # PERFORMANCE FIX 4: No locks - the main thread pushes packed chunk keys
+        # into a single-producer/single-consumer ring read by a long-lived worker,
+        # which returns sampled rows on a queue drained by the main thread. Each
+        # index is only ever advanced by one thread, so the GIL is all it needs.
+        self._ring = array("q", bytes(8 * _RING_CAPACITY))
+        self._ring_head = 0  # Next write, advanced by the main thread only
+        self._ring_tail = 0  # Next read, advanced by the worker only
+        self._ring_ready = threading.Event()
+        self._ring_closed = False
+        self._queued_region: Optional[Tuple[int, int, int, int]] = None  # Last fully queued view
+        self._done_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._bg_worker = threading.Thread(target=self._background_worker, name="MapGen", daemon=True)
+        self._bg_worker.start()
 
         # PERFORMANCE FIX 5: Fast noise samplers
         self._setup_fast_noise_samplers()
 
-    def _precompute_terrain_colors(self) -> Dict[str, Tuple[str, Tuple[int, int, int]]]:
+        # PERFORMANCE FIX 6: Pre-built 4x4 block patterns for bulk console writes,
+        # indexed by terrain id
+        self._water_terrain = np.array([terrain in _WATER_TERRAIN for terrain in TerrainId])
+        self._lut_ch = np.stack([self._build_block_pattern(terrain) for terrain in TerrainId])
+        self._variation_chars = np.full((len(TerrainId), 3), "", dtype="<U1")
+        for terrain, chars in _TERRAIN_VARIATION_CHARS.items():
+            self._variation_chars[terrain] = chars
+        size = self.overview_chunk_size
+        dy, dx = np.indices((size, size))
+        # Background shift of -3..+3 per cell, kept within the dark 0-50 range
+        bg_variation = (dx * 2 + dy * 3) % 7 - 3
+        self._lut_bg = np.clip(self._bg_base[:, None, None, :] + bg_variation[:, :, None], 0, 50).astype(np.uint8)
+        self._lut_bg_packed = _pack_rgb(self._lut_bg)
+        # Foreground shift of -5/0/+5 per cell, added to each chunk's color
+        self._fg_levels = np.array([-5, 0, 5], dtype=np.int16)
+        self._fg_level_index = (dx + dy) % 3
+        self._fg_variation = self._fg_levels[self._fg_level_index][:, :, np.newaxis]
+        # Finer -5..+5 shift of the character-based overview (get_overview_color)
+        self._color_variation = ((dx * 3 + dy * 7) % 11 - 5).astype(np.int16)[:, :, np.newaxis]
+
+        # Compile the overview kernel now rather than on the first overview frame
+        if HAS_NUMBA:
+            self._blit_overview(tcod.console.Console(size, size), *self._summary_grid(np.zeros((1, 1), dtype=np.intp)))
+
+        # PERFORMANCE FIX 7: Overview frame specialized for the current console size
+        self._render_fn = self._compile_render(self.console_width, self.console_height, self.overview_chunk_size)
+
+    def update_console_size(self, width: int, height: int) -> None:
+        """
+        Update console dimensions and rebuild the size-specialized overview renderer.
+
+        Args:
+            width: New console width
+            height: New console height
+        """
+        self.console_width = width
+        self.console_height = height
+        self._recompute_overview_metrics()
+        self._render_fn = self._compile_render(width, height, self.overview_chunk_size)
+
+    def _recompute_overview_metrics(self) -> None:
+        """Cache the offset from the overview's top-left chunk to its center chunk."""
+        self._half_visible_x = self.console_width // self.overview_chunk_size // 2
+        self._half_visible_y = self.console_height // self.overview_chunk_size // 2
+
+    def _precompute_terrain_colors(self) -> Dict[TerrainId, Tuple[str, Tuple[int, int, int]]]:
         """Pre-compute terrain appearances to avoid repeated calculations."""
         return {
-            "water": ("~", (100, 150, 255)),
-            "shallow_water": ("~", (120, 170, 255)),
-            "deep_water": ("~", (80, 130, 255)),
-            "grass": (".", (50, 120, 50)),
-            "grassland": (".", (50, 120, 50)),
-            "light_grass": (".", (60, 140, 60)),
-            "dark_grass": (".", (40, 100, 40)),
-            "forest": ("♠", (0, 100, 0)),
-            "hills": ("^", (139, 99, 49)),
-            "mountains": ("▲", (120, 100, 80)),
-            "desert": ("·", (218, 165, 32)),
-            "swamp": ("≈", (100, 120, 80)),
-            "fertile": ("*", (50, 200, 50)),
-            "sand": (".", (194, 178, 128)),
-            "caves": ("○", (100, 100, 100)),
+            TerrainId.WATER: ("~", (100, 150, 255)),
+            TerrainId.SHALLOW_WATER: ("~", (120, 170, 255)),
+            TerrainId.DEEP_WATER: ("~", (80, 130, 255)),
+            TerrainId.GRASS: (".", (50, 120, 50)),
+            TerrainId.GRASSLAND: (".", (50, 120, 50)),
+            TerrainId.LIGHT_GRASS: (".", (60, 140, 60)),
+            TerrainId.DARK_GRASS: (".", (40, 100, 40)),
+            TerrainId.FOREST: ("♠", (0, 100, 0)),
+            TerrainId.HILLS: ("^", (139, 99, 49)),
+            TerrainId.MOUNTAINS: ("▲", (120, 100, 80)),
+            TerrainId.DESERT: ("·", (218, 165, 32)),
+            TerrainId.SWAMP: ("≈", (100, 120, 80)),
+            TerrainId.FERTILE: ("*", (50, 200, 50)),
+            TerrainId.SAND: (".", (194, 178, 128)),
+            TerrainId.CAVES: ("○", (100, 100, 100)),
+        }
+
+    def _precompute_terrain_bg_colors(self) -> Dict[TerrainId, Tuple[int, int, int]]:
+        """Pre-compute overview background colors, darker versions of the terrain colors."""
+        return {
+            # Water types - darker blues
+            TerrainId.WATER: (20, 40, 80),
+            TerrainId.SHALLOW_WATER: (25, 45, 85),
+            TerrainId.DEEP_WATER: (15, 35, 75),
+
+            # Land types - darker versions of terrain colors
+            TerrainId.GRASS: (10, 25, 10),
+            TerrainId.GRASSLAND: (10, 25, 10),
+            TerrainId.LIGHT_GRASS: (12, 28, 12),
+            TerrainId.DARK_GRASS: (8, 20, 8),
+            TerrainId.FOREST: (0, 20, 0),
+            TerrainId.HILLS: (25, 18, 8),
+            TerrainId.MOUNTAINS: (20, 15, 12),
+            TerrainId.DESERT: (35, 25, 5),
+            TerrainId.SWAMP: (15, 20, 12),
+            TerrainId.FERTILE: (8, 30, 8),
+            TerrainId.SAND: (30, 25, 18),
+            TerrainId.CAVES: (15, 15, 15),
         }
 
+    def _build_block_pattern(self, terrain: TerrainId) -> np.ndarray:
+        """Build the character pattern of a chunk block for a terrain."""
+        char = chr(self._char_codes[terrain])
+        has_water = terrain in _WATER_TERRAIN
+
+        size = self.overview_chunk_size
+        pattern_ch = np.empty((size, size), dtype=np.int32)
+        for dy in range(size):
+            for dx in range(size):
+                if has_water:
+                    pattern_ch[dy, dx] = ord("~" if (dx + dy) % 2 == 0 else "≈")
+                else:
+                    pattern_ch[dy, dx] = ord(char)
+        return pattern_ch
+
     def _setup_fast_noise_samplers(self):
         """Setup optimized noise sampling for fast terrain determination."""
         # Cache references to avoid repeated attribute lookups
@@ -113,6 +321,30 @@ class ZoomedMapRenderer:
             self.noise_gen = self.world_generator.noise_generator
         else:
             self.noise_gen = None
+
+        # Check once which generators can sample grids and bind the matching
+        # samplers, so summary generation needs no per-call fallback handling
+        probe = np.zeros(1)
+        noise_ok = self.noise_gen is not None and self._can_sample(self.noise_gen.generate_grid, probe)
+        env_ok = self.env_gen is not None and self._can_sample(self.env_gen.generate_elevation_grid, probe)
+
+        if env_ok:
+            self._sample_terrain = self._sample_terrain_env if noise_ok else self._sample_terrain_env_plain
+        elif noise_ok:
+            self._sample_terrain = self._sample_terrain_noise
+        else:
+            self._sample_terrain = self._sample_terrain_const
+        self._sample_resources = self._sample_resources_noise if noise_ok else self._sample_resources_none
+
+    @staticmethod
+    def _can_sample(sample_grid, probe: np.ndarray) -> bool:
+        """Check whether a grid sampler works, by sampling the origin once."""
+        try:
+            sample_grid(probe, probe)
+        except Exception as e:
+            log.warning("Overview sampler unavailable, using fallback: %s", e)
+            return False
+        return True
     
     def toggle_map_mode(self):
         """Switch between detailed and overview modes."""
@@ -123,17 +355,12 @@ class ZoomedMapRenderer:
 
             self.current_mode = MapMode.OVERVIEW
             # Convert current camera position to overview coordinates
-            chunk_size = self.world_generator.chunk_manager.chunk_size
-            chunk_x = self.camera_x // chunk_size
-            chunk_y = self.camera_y // chunk_size
-
-            # Center the overview view on the current camera position
-            visible_chunks_x = self.console_width // self.overview_chunk_size
-            visible_chunks_y = self.console_height // self.overview_chunk_size
+            chunk_x = self.camera_x // self._world_chunk_size
+            chunk_y = self.camera_y // self._world_chunk_size
 
             # Position view so camera is in center
-            self.zoom_camera_x = (chunk_x - visible_chunks_x // 2) * self.overview_chunk_size
-            self.zoom_camera_y = (chunk_y - visible_chunks_y // 2) * self.overview_chunk_size
+            self.zoom_camera_x = (chunk_x - self._half_visible_x) * self.overview_chunk_size
+            self.zoom_camera_y = (chunk_y - self._half_visible_y) * self.overview_chunk_size
         else:
             self.current_mode = MapMode.DETAILED
             # Don't change camera position when switching back to detailed mode
@@ -195,88 +422,191 @@ class ZoomedMapRenderer:
     def render_overview_mode(self, console: tcod.console.Console):
         """OPTIMIZED: Overview rendering with batch operations."""
         console.clear()
-
-        visible_chunks_x = self.console_width // self.overview_chunk_size
-        visible_chunks_y = self.console_height // self.overview_chunk_size
+        self._frame_time = time.monotonic()
 
         start_chunk_x = self.zoom_camera_x // self.overview_chunk_size
         start_chunk_y = self.zoom_camera_y // self.overview_chunk_size
 
-        # OPTIMIZATION: Pre-calculate which chunks are visible
-        visible_summaries = {}
-        for chunk_y in range(visible_chunks_y + 1):
-            for chunk_x in range(visible_chunks_x + 1):
-                world_chunk_x = start_chunk_x + chunk_x
-                world_chunk_y = start_chunk_y + chunk_y
-                summary = self.get_or_generate_chunk_summary(world_chunk_x, world_chunk_y)
-                visible_summaries[(chunk_x, chunk_y)] = summary
-
-        # OPTIMIZATION: Batch render chunks
-        for (local_x, local_y), summary in visible_summaries.items():
-            self._render_chunk_block(console, summary, local_x, local_y)
+        self._render_fn(console, start_chunk_x, start_chunk_y, self._frame_time)
 
         # UI elements
         self.render_overview_cursor(console, start_chunk_x, start_chunk_y)
         self.render_camera_marker(console, start_chunk_x, start_chunk_y)
         self.render_overview_ui(console)
 
-        # Queue background generation after rendering
-        self._queue_background_generation(start_chunk_x, start_chunk_y, visible_chunks_x, visible_chunks_y)
+    def _compile_render(self, console_width: int, console_height: int, chunk_size: int):
+        """
+        Build the overview frame renderer for one console size.
+
+        The visible chunk counts, the chunk grid offsets and the clipped blit
+        rectangle only change with the console size, so they are computed here
+        once and captured by the returned closure instead of every frame.
+
+        Args:
+            console_width: Console width in cells
+            console_height: Console height in cells
+            chunk_size: Cells per chunk block side
+
+        Returns:
+            Function drawing the chunk blocks of a frame, given the console, the
+            top-left visible chunk and the frame time
+        """
+        visible_x = console_width // chunk_size
+        visible_y = console_height // chunk_size
+        # Only the chunks that reach the console, including partial blocks at the
+        # right and bottom edges when the size is not a multiple of the block size
+        offset_x, offset_y = np.meshgrid(np.arange(-(-console_width // chunk_size)),
+                                         np.arange(-(-console_height // chunk_size)))
+        lookup_slots = self._lookup_slots
+        generate_slots = self._generate_slots
+        drain_results = self._drain_background_results
+        summary_grid = self._summary_grid
+        queue_background = self._queue_background_generation
+
+        if HAS_NUMBA:
+            lut_ch, lut_bg, fg_variation = self._lut_ch, self._lut_bg, self._fg_variation[:, :, 0]
+
+            def blit(console, terrain_id, color, flags, pop):
+                blit_overview(console.ch, console.fg, console.bg, 0, 0, console_height, console_width,
+                              terrain_id, color, flags, pop, lut_ch, lut_bg, fg_variation)
+        else:
+            # Pixel to chunk/cell tables, so the blit is a pure gather
+            pixel_tables = self._pixel_tables(console_height, console_width, offset_x.shape[1])
+            gather_blocks = self._gather_blocks
+            screen = slice(None)
+
+            def blit(console, terrain_id, color, flags, pop):
+                gather_blocks(console, screen, screen, pixel_tables, terrain_id, color, flags, pop)
+
+        def render(console: tcod.console.Console, start_chunk_x: int, start_chunk_y: int, now: float):
+            # OPTIMIZATION: Resolve the visible chunks to summary slots in one batch,
+            # generating only the missing ones, then blit them in one pass
+            grid_x = offset_x + start_chunk_x
+            grid_y = offset_y + start_chunk_y
+            drain_results(now)
+            slots = lookup_slots(grid_x, grid_y, now)
+            missing = slots < 0
+            if missing.any():
+                slots[missing] = generate_slots(grid_x[missing], grid_y[missing], now)
+
+            blit(console, *summary_grid(slots))
+
+            # Queue background generation after rendering
+            queue_background(start_chunk_x, start_chunk_y, visible_x, visible_y)
+
+        return render
+
+    def _blit_overview(self, console: tcod.console.Console, terrain_id: np.ndarray, color: np.ndarray,
+                       flags: np.ndarray, pop: np.ndarray, base_x: int = 0, base_y: int = 0):
+        """Expand grids of chunk terrain ids, colors, flags and population into 4x4 blocks.
+
+        Uses the JIT-compiled kernel when Numba is available, otherwise writes the
+        blocks to the console with a single vectorized store per buffer. Either way
+        the blocks are clipped against the console edges.
+        """
+        size = self.overview_chunk_size
+        rows, cols = terrain_id.shape
+        width = min(cols * size, self.console_width - base_x)
+        height = min(rows * size, self.console_height - base_y)
+        if width <= 0 or height <= 0:
+            return
+
+        if HAS_NUMBA:
+            blit_overview(console.ch, console.fg, console.bg, base_y, base_x, height, width,
+                          terrain_id, color, flags, pop, self._lut_ch, self._lut_bg, self._fg_variation[:, :, 0])
+            return
+
+        screen_rows = slice(base_y, base_y + height)
+        screen_cols = slice(base_x, base_x + width)
+        self._gather_blocks(console, screen_rows, screen_cols, self._pixel_tables(height, width, cols),
+                            terrain_id, color, flags, pop)
+
+    def _pixel_tables(self, height: int, width: int, cols: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Map every pixel of a block grid area to flat gather indices.
+
+        For a grid ``cols`` chunks wide, returns per pixel the index of its chunk,
+        of its cell within a block pattern, and of its chunk's foreground color
+        at the pixel's variation level.
+        """
+        size = self.overview_chunk_size
+        chunk_row, cell_row = np.divmod(np.arange(height)[:, np.newaxis], size)
+        chunk_col, cell_col = np.divmod(np.arange(width), size)
+        chunk_index = chunk_row * cols + chunk_col
+        fg_index = chunk_index * len(self._fg_levels) + self._fg_level_index[cell_row, cell_col]
+        return chunk_index, cell_row * size + cell_col, fg_index
+
+    def _gather_blocks(self, console: tcod.console.Console, screen_rows: slice, screen_cols: slice,
+                       pixel_tables: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                       terrain_id: np.ndarray, color: np.ndarray, flags: np.ndarray, pop: np.ndarray):
+        """Write chunk blocks to a console area with one gather per buffer (NumPy path)."""
+        chunk_index, cell_index, fg_index = pixel_tables
+        cells = self._lut_ch.shape[1] * self._lut_ch.shape[2]
+        pattern_index = terrain_id.ravel().take(chunk_index, mode="clip") * cells + cell_index
+        ch = self._lut_ch.ravel().take(pattern_index, mode="clip")
+
+        # Every chunk color at every variation level is only chunks x 3 entries,
+        # so shift and clamp those, then gather them as packed 32-bit RGBX words
+        shifted = color.reshape(-1, 1, 3).astype(np.int16) + self._fg_levels[:, np.newaxis]
+        fg_colors = _pack_rgb(np.clip(shifted, 0, 255).astype(np.uint8))
+        fg = fg_colors.take(fg_index, mode="clip").view(np.uint8).reshape(*fg_index.shape, 4)
+        bg = self._lut_bg_packed.take(pattern_index, mode="clip").view(np.uint8).reshape(*pattern_index.shape, 4)
+
+        # Resource/population markers go in the center cell of their block
+        size = self.overview_chunk_size
+        centers = ch[1::size, 1::size]
+        marker = self._block_markers(flags, pop)[:centers.shape[0], :centers.shape[1]]
+        np.copyto(centers, marker, where=marker != 0)
+
+        console.ch[screen_rows, screen_cols] = ch
+        console.fg[screen_rows, screen_cols] = fg[..., :3]
+        console.bg[screen_rows, screen_cols] = bg[..., :3]
+
+    def _summary_grid(self, slots: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Gather the summary columns _blit_overview takes for a grid of table slots."""
+        columns = self._summary_columns
+        return columns["terrain_id"][slots], columns["color"][slots], columns["flags"][slots], columns["pop"][slots]
+
+    @staticmethod
+    def _block_markers(flags: np.ndarray, pop: np.ndarray) -> np.ndarray:
+        """Get the codepoints drawn in the center of chunk blocks, 0 for none."""
+        return np.select(
+            [(flags & FLAG_WATER) != 0, (flags & FLAG_RESOURCES) != 0, pop > 2, pop > 0],
+            [0, ord("●"), ord("■"), ord("□")],
+            default=0,
+        ).astype(np.int32)
 
     def _render_chunk_block(self, console: tcod.console.Console, summary: ChunkSummary, local_x: int, local_y: int):
-        """OPTIMIZED: Fast 4x4 block rendering."""
-        base_x = local_x * self.overview_chunk_size
-        base_y = local_y * self.overview_chunk_size
-
-        # Simple pattern for the 4x4 block
-        for dy in range(self.overview_chunk_size):
-            for dx in range(self.overview_chunk_size):
-                screen_x = base_x + dx
-                screen_y = base_y + dy
-
-                if 0 <= screen_x < self.console_width and 0 <= screen_y < self.console_height:
-                    # Simple character variation
-                    if summary.has_water:
-                        char = "~" if (dx + dy) % 2 == 0 else "≈"
-                    elif summary.has_resources and dx == 1 and dy == 1:
-                        char = "●"
-                    elif summary.population_level > 0 and dx == 1 and dy == 1:
-                        char = "■" if summary.population_level > 2 else "□"
-                    else:
-                        char = summary.char
-
-                    # Simple color variation
-                    r, g, b = summary.color
-                    variation = ((dx + dy) % 3) - 1  # -1, 0, 1
-                    fg_color = (
-                        max(0, min(255, r + variation * 5)),
-                        max(0, min(255, g + variation * 5)),
-                        max(0, min(255, b + variation * 5))
-                    )
-
-                    # Simple background color
-                    bg_color = self.get_overview_bg_color(summary, dx, dy)
-
-                    console.print(screen_x, screen_y, char, fg=fg_color, bg=bg_color)
+        """OPTIMIZED: Fast 4x4 block rendering with one slice store per buffer."""
+        self._blit_overview(
+            console,
+            np.array([[summary.terrain_id]], dtype=np.int16),
+            np.array([[summary.color]], dtype=np.uint8),
+            np.array([[FLAG_WATER * summary.has_water | FLAG_RESOURCES * summary.has_resources]], dtype=np.uint8),
+            np.array([[summary.population_level]], dtype=np.uint8),
+            local_x * self.overview_chunk_size,
+            local_y * self.overview_chunk_size,
+        )
     
     def render_chunk_overview(self, console: tcod.console.Console, summary: ChunkSummary, local_x: int, local_y: int):
         """Render a single chunk as a 4x4 pixel block."""
-        base_x = local_x * self.overview_chunk_size
-        base_y = local_y * self.overview_chunk_size
-        
-        # Fill the 4x4 area with the chunk's dominant characteristics
-        for dy in range(self.overview_chunk_size):
-            for dx in range(self.overview_chunk_size):
-                screen_x = base_x + dx
-                screen_y = base_y + dy
-                
-                if screen_x < self.console_width and screen_y < self.console_height:
-                    # Use different patterns for variety within the chunk
-                    char = self.get_overview_char(summary, dx, dy)
-                    fg_color = self.get_overview_color(summary, dx, dy)
-                    bg_color = self.get_overview_bg_color(summary, dx, dy)
-
-                    console.print(screen_x, screen_y, char, fg=fg_color, bg=bg_color)
+        size = self.overview_chunk_size
+        base_x = local_x * size
+        base_y = local_y * size
+        width = min(size, self.console_width - base_x)
+        height = min(size, self.console_height - base_y)
+        if width <= 0 or height <= 0:
+            return
+
+        # Fill the 4x4 area with the chunk's dominant characteristics, using
+        # different characters for variety and clamping all colors at once
+        chars = [[ord(self.get_overview_char(summary, dx, dy)) for dx in range(width)] for dy in range(height)]
+        fg = np.clip(self._color_variation[:height, :width] + np.array(summary.color, dtype=np.int16), 0, 255)
+
+        screen_rows = slice(base_y, base_y + height)
+        screen_cols = slice(base_x, base_x + width)
+        console.ch[screen_rows, screen_cols] = chars
+        console.fg[screen_rows, screen_cols] = fg
+        console.bg[screen_rows, screen_cols] = self._lut_bg[summary.terrain_id, :height, :width]
     
     def get_overview_char(self, summary: ChunkSummary, dx: int, dy: int) -> str:
         """Get character for specific position within 4x4 chunk representation."""
@@ -291,16 +621,8 @@ class ZoomedMapRenderer:
             else:
                 return summary.char
         else:
-            # Terrain variation
-            variations = {
-                "grassland": [".", "·", ","],
-                "forest": ["♠", "♣", "T"],
-                "hills": ["^", "▲", "∩"],
-                "desert": ["·", "∘", "°"],
-                "mountains": ["▲", "⩙", "∩"]
-            }
-            chars = variations.get(summary.dominant_terrain, [summary.char])
-            return chars[(dx + dy) % len(chars)]
+            # Terrain variation, empty for terrains that always use their own character
+            return self._variation_chars[summary.terrain_id, (dx + dy) % 3] or summary.char
     
     def get_overview_color(self, summary: ChunkSummary, dx: int, dy: int) -> Tuple[int, int, int]:
         """Get color with slight variation for visual texture."""
@@ -316,145 +638,199 @@ class ZoomedMapRenderer:
         return (r, g, b)
 
     def get_overview_bg_color(self, summary: ChunkSummary, dx: int, dy: int) -> Tuple[int, int, int]:
-        """Get background color for overview tiles."""
-        # Background colors based on terrain type
-        bg_colors = {
-            # Water types - darker blues
-            "water": (20, 40, 80),
-            "shallow_water": (25, 45, 85),
-            "deep_water": (15, 35, 75),
-
-            # Land types - darker versions of terrain colors
-            "grass": (10, 25, 10),
-            "grassland": (10, 25, 10),
-            "light_grass": (12, 28, 12),
-            "dark_grass": (8, 20, 8),
-            "forest": (0, 20, 0),
-            "hills": (25, 18, 8),
-            "mountains": (20, 15, 12),
-            "desert": (35, 25, 5),
-            "swamp": (15, 20, 12),
-            "fertile": (8, 30, 8),
-            "sand": (30, 25, 18),
-            "caves": (15, 15, 15),
-        }
-
-        base_bg = bg_colors.get(summary.dominant_terrain, (5, 10, 5))
-
-        # Add slight variation based on position
-        variation = ((dx * 2 + dy * 3) % 7) - 3  # -3 to +3 variation
-
-        r, g, b = base_bg
-        r = max(0, min(50, r + variation))
-        g = max(0, min(50, g + variation))
-        b = max(0, min(50, b + variation))
+        """Get background color for a position within a chunk block.
 
+        Reads the block background table, which already carries the clamped
+        per-cell variation of each terrain's base background.
+        """
+        r, g, b = self._lut_bg[summary.terrain_id, dy, dx].tolist()
         return (r, g, b)
     
-    def get_or_generate_chunk_summary(self, chunk_x: int, chunk_y: int) -> ChunkSummary:
-        """Get chunk summary, generating if needed."""
-        key = (chunk_x, chunk_y)
-        
-        with self._cache_lock:
-            if key not in self.chunk_summaries:
-                # Create fast summary without generating full detail
-                self.chunk_summaries[key] = self.create_fast_chunk_summary(chunk_x, chunk_y)
-        
-        return self.chunk_summaries[key]
-
     def create_fast_chunk_summary(self, chunk_x: int, chunk_y: int) -> ChunkSummary:
         """OPTIMIZED: Create chunk summary using minimal sampling."""
-        chunk_size = getattr(self.world_generator.chunk_manager, 'chunk_size', 32)
+        rows = self._sample_summaries(np.array([chunk_x]), np.array([chunk_y]))
+        return self._summary_from_row(rows[0])
+
+    def _sample_summaries(self, chunk_x: np.ndarray, chunk_y: np.ndarray) -> np.ndarray:
+        """OPTIMIZED: Build summary table rows for arrays of chunks in one batch.
+
+        The returned records carry the chunk keys; they are stamped when stored.
+        """
+        chunk_size = self._world_chunk_size
         center_x = chunk_x * chunk_size + chunk_size // 2
         center_y = chunk_y * chunk_size + chunk_size // 2
 
-        # OPTIMIZATION: Single center sample instead of 9 samples
-        dominant_terrain, average_elevation = self._fast_terrain_sample(center_x, center_y)
+        # OPTIMIZATION: Single center sample per chunk, all chunks at once
+        terrain_id, elevation = self._sample_terrain(center_x, center_y)
 
         # OPTIMIZATION: Quick estimates without complex calculations
-        has_water = "water" in dominant_terrain
-        has_resources = self._quick_resource_check(center_x, center_y)
-        population_level = self._quick_population_check(chunk_x, chunk_y)
-
-        # OPTIMIZATION: Use pre-computed colors
-        char, color = self._get_cached_terrain_appearance(dominant_terrain, average_elevation)
-
+        has_water = self._water_terrain[terrain_id]
+        has_resources = self._sample_resources(center_x, center_y)
+
+        rows = np.zeros(chunk_x.shape, dtype=_SUMMARY_ROW_DTYPE)
+        rows["key"] = _pack_key(chunk_x.astype(np.int64), chunk_y.astype(np.int64))
+        rows["elevation"] = elevation
+        rows["terrain_id"] = terrain_id
+        rows["flags"] = _FLAG_USED | FLAG_WATER * has_water | FLAG_RESOURCES * has_resources
+        rows["pop"] = [self._quick_population_check(x, y) for x, y in zip(chunk_x.tolist(), chunk_y.tolist())]
+
+        # OPTIMIZATION: Use pre-computed colors, shifted by elevation
+        elevation_mod = np.trunc((elevation - 0.5) * 30).astype(np.int16)
+        rows["color"] = np.clip(self._fg_base[terrain_id] + elevation_mod[..., np.newaxis], 0, 255)
+        rows["char_id"] = self._char_codes[terrain_id]
+        return rows
+
+    # Terrain samplers, bound to _sample_terrain by _setup_fast_noise_samplers.
+    # Each classifies arrays of positions with one vectorized noise call per
+    # layer and returns terrain ids and elevations normalized to 0-1.
+
+    def _sample_terrain_env(self, world_x: np.ndarray, world_y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """OPTIMIZED: Environmental elevation, with noise for variety in lowlands."""
+        variety = self.noise_gen.generate_grid(world_x * 0.01, world_y * 0.01)
+        return self._classify_elevation(world_x, world_y, variety)
+
+    def _sample_terrain_env_plain(self, world_x: np.ndarray, world_y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Environmental elevation without a noise generator (all lowland is grassland)."""
+        return self._classify_elevation(world_x, world_y, None)
+
+    def _classify_elevation(self, world_x: np.ndarray, world_y: np.ndarray,
+                            variety: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Classify terrain from environmental elevation and optional lowland variety noise."""
+        elevation = (self.env_gen.generate_elevation_grid(world_x, world_y) + 200) / 3200  # Normalize
+
+        lowland = np.full(elevation.shape, TerrainId.GRASSLAND, dtype=np.int16)
+        if variety is not None:
+            lowland[variety > 0.3] = TerrainId.FOREST
+            lowland[variety < -0.3] = TerrainId.DESERT
+
+        # Simple terrain classification
+        terrain_id = np.select(
+            [elevation < 0.25, elevation > 0.75, elevation > 0.55],
+            [TerrainId.WATER, TerrainId.MOUNTAINS, TerrainId.HILLS],
+            default=lowland,
+        ).astype(np.int16)
+        return terrain_id, elevation
+
+    def _sample_terrain_noise(self, world_x: np.ndarray, world_y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """BACKUP: Simple noise-based terrain (no complex generation)."""
+        elevation_noise = self.noise_gen.generate_grid(world_x * 0.003, world_y * 0.003)
+        elevation = (elevation_noise + 1) * 0.5  # 0-1 range
+
+        terrain_id = np.where(
+            elevation < 0.3, TerrainId.WATER, np.where(elevation > 0.7, TerrainId.HILLS, TerrainId.GRASSLAND)
+        ).astype(np.int16)
+        return terrain_id, elevation
+
+    def _sample_terrain_const(self, world_x: np.ndarray, world_y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """ULTIMATE FALLBACK: Plain grassland at mid elevation."""
+        shape = np.broadcast_shapes(np.shape(world_x), np.shape(world_y))
+        return np.full(shape, TerrainId.GRASSLAND, dtype=np.int16), np.full(shape, 0.5)
+
+    def get_or_generate_chunk_summary(self, chunk_x: int, chunk_y: int, now: Optional[float] = None) -> ChunkSummary:
+        """OPTIMIZED: Get chunk summary with smart caching.
+
+        ``now`` is the ``time.monotonic()`` reading to check the cache TTL
+        against; pass the frame time when looking up many chunks in one frame.
+        """
+        if now is None:
+            now = time.monotonic()
+        slot = self._get_or_generate_slot(chunk_x, chunk_y, now)
+        return self._summary_from_row({name: column[slot] for name, column in self._summary_columns.items()})
+
+    def _get_or_generate_slot(self, chunk_x: int, chunk_y: int, now: float) -> int:
+        """Get the table slot of a fresh summary for a chunk, generating it if needed."""
+        slot = self._find_slot(chunk_x, chunk_y)
+        if slot >= 0 and now - self._summary_ts[slot] < self.cache_ttl:
+            return slot
+
+        rows = self._sample_summaries(np.array([chunk_x]), np.array([chunk_y]))
+        return self._store_row(rows[0], now)
+
+    def _generate_slots(self, chunk_x: np.ndarray, chunk_y: np.ndarray, now: float) -> np.ndarray:
+        """Generate summaries for arrays of chunks in one batch and return their slots."""
+        rows = self._sample_summaries(chunk_x, chunk_y)
+        return np.array([self._store_row(row, now) for row in rows], dtype=np.intp)
+
+    def _find_slot(self, chunk_x: int, chunk_y: int) -> int:
+        """Find the table slot holding a chunk's summary, or -1 if it is not cached."""
+        columns = self._summary_columns
+        keys, flags = columns["key"], columns["flags"]
+        key = _pack_key(chunk_x, chunk_y)
+        home = int(_home_slot(key))
+        for probe in range(_MAX_PROBE):
+            slot = (home + probe) & _SUMMARY_MASK
+            if not flags[slot] & _FLAG_USED:
+                return -1
+            if keys[slot] == key:
+                return slot
+        return -1
+
+    def _lookup_slots(self, chunk_x: np.ndarray, chunk_y: np.ndarray, now: Optional[float] = None) -> np.ndarray:
+        """Find the table slots for arrays of chunk coordinates in one batch.
+
+        Chunks that are not cached, or whose summary is older than the TTL when
+        ``now`` is given, map to -1.
+        """
+        columns = self._summary_columns
+        keys, flags = columns["key"], columns["flags"]
+        key = _pack_key(np.asarray(chunk_x, dtype=np.int64), np.asarray(chunk_y, dtype=np.int64))
+        home = _home_slot(key)
+        slots = np.full(home.shape, -1, dtype=np.intp)
+        pending = np.ones(home.shape, dtype=bool)
+        for probe in range(_MAX_PROBE):
+            probe_slots = (home + probe) & _SUMMARY_MASK
+            empty = (flags[probe_slots] & _FLAG_USED) == 0
+            match = ~empty & (keys[probe_slots] == key)
+            hit = match if now is None else match & ((now - self._summary_ts[probe_slots]) < self.cache_ttl)
+            np.copyto(slots, probe_slots, where=pending & hit)
+            pending &= ~(empty | match)
+            if not pending.any():
+                break
+        return slots
+
+    def _store_row(self, row: np.void, now: float) -> int:
+        """Write a summary record into the table columns, stamped with ``now``, and return its slot."""
+        columns = self._summary_columns
+        keys, flags = columns["key"], columns["flags"]
+        timestamps = self._summary_ts
+        key = int(row["key"])
+        home = int(_home_slot(key))
+
+        # First empty or matching slot in the probe window, else evict the stalest
+        target = -1
+        oldest = float("inf")
+        for probe in range(_MAX_PROBE):
+            slot = (home + probe) & _SUMMARY_MASK
+            if not flags[slot] & _FLAG_USED or keys[slot] == key:
+                target = slot
+                break
+            if timestamps[slot] < oldest:
+                oldest = timestamps[slot]
+                target = slot
+
+        for name, column in columns.items():
+            column[target] = row[name]
+        timestamps[target] = now
+        return target
+
+    def _summary_from_row(self, row) -> ChunkSummary:
+        """Build a ChunkSummary from a summary record (or a mapping of its fields)."""
+        flags = int(row["flags"])
+        red, green, blue = (int(c) for c in row["color"])
         return ChunkSummary(
-            dominant_terrain=dominant_terrain,
-            average_elevation=average_elevation,
-            has_water=has_water,
-            has_resources=has_resources,
-            population_level=population_level,
-            char=char,
-            color=color
+            terrain_id=TerrainId(row["terrain_id"]),
+            average_elevation=float(row["elevation"]),
+            has_water=bool(flags & FLAG_WATER),
+            has_resources=bool(flags & FLAG_RESOURCES),
+            population_level=int(row["pop"]),
+            char=chr(row["char_id"]),
+            color=(red, green, blue),
         )
 
-    def _fast_terrain_sample(self, world_x: int, world_y: int) -> Tuple[str, float]:
-        """OPTIMIZED: Single fast terrain sample without full generation."""
-
-        # Try environmental generator first (should be fastest)
-        if self.env_gen:
-            try:
-                env_data = self.env_gen.generate_environmental_data(world_x, world_y)
-                elevation = (env_data.elevation + 200) / 3200  # Normalize
-
-                # Simple terrain classification
-                if elevation < 0.25:
-                    return "water", elevation
-                elif elevation > 0.75:
-                    return "mountains", elevation
-                elif elevation > 0.55:
-                    return "hills", elevation
-                else:
-                    # Use noise for variety in lowlands
-                    if self.noise_gen:
-                        variety = self.noise_gen.generate(world_x * 0.01, world_y * 0.01)
-                        if variety > 0.3:
-                            return "forest", elevation
-                        elif variety < -0.3:
-                            return "desert", elevation
-                    return "grassland", elevation
-
-            except Exception:
-                pass  # Fall through to backup method
-
-        # BACKUP: Simple noise-based terrain (no complex generation)
-        if self.noise_gen:
-            elevation_noise = self.noise_gen.generate(world_x * 0.003, world_y * 0.003)
-            elevation = (elevation_noise + 1) * 0.5  # 0-1 range
-
-            if elevation < 0.3:
-                return "water", elevation
-            elif elevation > 0.7:
-                return "hills", elevation
-            else:
-                return "grassland", elevation
-
-        # ULTIMATE FALLBACK
-        return "grassland", 0.5
-
-    def get_or_generate_chunk_summary(self, chunk_x: int, chunk_y: int) -> ChunkSummary:
-        """OPTIMIZED: Get chunk summary with smart caching."""
-        key = (chunk_x, chunk_y)
-        current_time = time.time()
-
-        # Check if we have a valid cached summary
-        if key in self.chunk_summaries:
-            if key in self.summary_timestamps:
-                age = current_time - self.summary_timestamps[key]
-                if age < self.cache_ttl:
-                    return self.chunk_summaries[key]
-
-        # Generate new summary
-        summary = self.create_fast_chunk_summary(chunk_x, chunk_y)
-        self.chunk_summaries[key] = summary
-        self.summary_timestamps[key] = current_time
-
-        return summary
-
-    def _get_cached_terrain_appearance(self, terrain_type: str, elevation: float) -> Tuple[str, Tuple[int, int, int]]:
+    def _get_cached_terrain_appearance(self, terrain_type: TerrainId, elevation: float) -> Tuple[str, Tuple[int, int, int]]:
         """OPTIMIZED: Use pre-computed terrain colors."""
-        char, base_color = self.terrain_colors.get(terrain_type, (".", (100, 150, 100)))
+        char = chr(self._char_codes[terrain_type])
+        base_color = self._fg_base[terrain_type].tolist()
 
         # Quick elevation modification
         elevation_mod = int((elevation - 0.5) * 30)
@@ -466,17 +842,14 @@ class ZoomedMapRenderer:
 
         return char, color
 
-    def _quick_resource_check(self, world_x: int, world_y: int) -> bool:
-        """OPTIMIZED: Quick resource estimation."""
-        if not self.noise_gen:
-            return False
+    def _sample_resources_noise(self, world_x: np.ndarray, world_y: np.ndarray) -> np.ndarray:
+        """OPTIMIZED: Quick resource estimation for arrays of positions (single noise sample)."""
+        resource_noise: np.ndarray = self.noise_gen.generate_grid(world_x * 0.01, world_y * 0.01)
+        return np.abs(resource_noise) > 0.6
 
-        # Single noise sample
-        try:
-            resource_noise = self.noise_gen.generate(world_x * 0.01, world_y * 0.01)
-            return abs(resource_noise) > 0.6
-        except:
-            return False
+    def _sample_resources_none(self, world_x: np.ndarray, world_y: np.ndarray) -> np.ndarray:
+        """Resource fallback without a noise generator: no resources anywhere."""
+        return np.zeros(np.broadcast_shapes(np.shape(world_x), np.shape(world_y)), dtype=bool)
 
     def _quick_population_check(self, chunk_x: int, chunk_y: int) -> int:
         """OPTIMIZED: Quick population check."""
@@ -486,46 +859,83 @@ class ZoomedMapRenderer:
 
     def _queue_background_generation(self, start_x: int, start_y: int, width: int, height: int):
         """OPTIMIZED: Background generation with limits."""
-        with self._generation_lock:
-            # Limit concurrent generations
-            if len(self.currently_generating) > 5:
+        # Nothing to do while the view stays on a region whose chunks are all queued
+        region = (start_x, start_y, width, height)
+        if region == self._queued_region:
+            return
+
+        # Limit queued generations
+        if self._ring_head - self._ring_tail > 5:
+            return
+
+        # Queue nearby chunks (skip every other for performance)
+        grid_x, grid_y = np.meshgrid(
+            np.arange(start_x - self.background_radius, start_x + width + self.background_radius, 2),
+            np.arange(start_y - self.background_radius, start_y + height + self.background_radius, 2),
+        )
+        # Queued chunks hold a reserved slot, so the table itself dedupes them
+        missing = self._lookup_slots(grid_x, grid_y) < 0
+        reserved = np.zeros(1, dtype=_SUMMARY_ROW_DTYPE)[0]
+        reserved["flags"] = _FLAG_USED
+        self._queued_region = region
+        for x, y in zip(grid_x[missing].tolist(), grid_y[missing].tolist()):
+            if self._ring_head - self._ring_tail >= _RING_CAPACITY:
+                self._queued_region = None  # Ring full, retry the rest next frame
+                break
+            key = _pack_key(x, y)
+            self._ring[self._ring_head & _RING_MASK] = key
+            self._ring_head += 1
+
+            # Stale timestamp: found when queueing, but a miss for rendering
+            reserved["key"] = key
+            self._store_row(reserved, _PENDING_TS)
+        self._ring_ready.set()
+
+    def _background_worker(self):
+        """Worker thread: sample queued chunks in batches and hand the rows back."""
+        while True:
+            self._ring_ready.wait()
+            self._ring_ready.clear()
+
+            # Take everything queued so far so it is sampled in one batch
+            head = self._ring_head
+            keys = np.array([self._ring[i & _RING_MASK] for i in range(self._ring_tail, head)], dtype=np.int64)
+            self._ring_tail = head
+
+            if keys.size:
+                chunk_x, chunk_y = _unpack_key(keys)
+                try:
+                    self._done_queue.put(self._sample_summaries(chunk_x, chunk_y))
+                except Exception:
+                    log.exception("Background generation error")
+            if self._ring_closed:
                 return
 
-            # Queue nearby chunks (skip every other for performance)
-            for y in range(start_y - self.background_radius, start_y + height + self.background_radius, 2):
-                for x in range(start_x - self.background_radius, start_x + width + self.background_radius, 2):
-                    key = (x, y)
-
-                    if key not in self.chunk_summaries and key not in self.currently_generating:
-                        self.currently_generating.add(key)
-                        self.background_executor.submit(self._generate_summary_background, x, y)
+    def _drain_background_results(self, now: float):
+        """Store summaries finished by the worker (main thread only, never blocks)."""
+        while True:
+            try:
+                rows = self._done_queue.get_nowait()
+            except queue.Empty:
+                return
 
-    def _generate_summary_background(self, chunk_x: int, chunk_y: int):
-        """Background summary generation."""
-        try:
-            summary = self.create_fast_chunk_summary(chunk_x, chunk_y)
-            self.chunk_summaries[(chunk_x, chunk_y)] = summary
-            self.summary_timestamps[(chunk_x, chunk_y)] = time.time()
-        except Exception as e:
-            print(f"Background generation error: {e}")
-        finally:
-            with self._generation_lock:
-                self.currently_generating.discard((chunk_x, chunk_y))
+            for row in rows:
+                self._store_row(row, now)
 
-    def _determine_fast_terrain(self, elevation: float, moisture: float, temperature: float) -> str:
+    def _determine_fast_terrain(self, elevation: float, moisture: float, temperature: float) -> TerrainId:
         """Fast terrain determination without full chunk generation."""
         if elevation > 0.8:
-            return "mountains"
+            return TerrainId.MOUNTAINS
         elif elevation > 0.6:
-            return "hills"
+            return TerrainId.HILLS
         elif temperature > 0.7 and moisture < 0.3:
-            return "desert"
+            return TerrainId.DESERT
         elif moisture > 0.6 and 0.3 < temperature < 0.8:
-            return "forest"
+            return TerrainId.FOREST
         elif moisture > 0.7:
-            return "swamp"
+            return TerrainId.SWAMP
         else:
-            return "grassland"
+            return TerrainId.GRASSLAND
 
     def _estimate_resources(self, world_x: int, world_y: int) -> bool:
         """Estimate if chunk has resources using noise sampling."""
@@ -554,7 +964,7 @@ class ZoomedMapRenderer:
         if not hasattr(self.world_generator, 'animal_manager'):
             return 0
 
-        chunk_size = self.world_generator.chunk_manager.chunk_size
+        chunk_size = self._world_chunk_size
         chunk_world_x = chunk_x * chunk_size
         chunk_world_y = chunk_y * chunk_size
 
@@ -586,37 +996,6 @@ class ZoomedMapRenderer:
         else:
             return 0  # Empty
 
-    def _get_terrain_appearance(self, terrain_type: str, elevation: float) -> Tuple[str, Tuple[int, int, int]]:
-        """Get representative character and color for terrain type."""
-        appearances = {
-            # Water types
-            "water": ("~", (100, 150, 255)),
-            "shallow_water": ("~", (120, 170, 255)),
-            "deep_water": ("~", (80, 130, 255)),
-
-            # Land types
-            "grass": (".", (50, 120, 50)),
-            "grassland": (".", (50, 120, 50)),
-            "light_grass": (".", (60, 140, 60)),
-            "dark_grass": (".", (40, 100, 40)),
-            "forest": ("♠", (0, 100, 0)),
-            "hills": ("^", (139, 99, 49)),
-            "mountains": ("▲", (120, 100, 80)),
-            "desert": ("·", (218, 165, 32)),
-            "swamp": ("≈", (100, 120, 80)),
-            "fertile": ("*", (50, 200, 50)),
-            "sand": (".", (194, 178, 128)),
-            "caves": ("○", (100, 100, 100)),
-        }
-
-        char, base_color = appearances.get(terrain_type, (".", (100, 150, 100)))
-
-        # Modify color based on elevation
-        elevation_mod = int((elevation - 0.5) * 30)
-        color = tuple(max(0, min(255, c + elevation_mod)) for c in base_color)
-
-        return char, color
-
     def render_overview_cursor(self, console: tcod.console.Console, start_chunk_x: int, start_chunk_y: int):
         """No cursor in overview mode - camera moves freely."""
         # No cursor rendering - the view moves directly with arrow keys
@@ -625,9 +1004,8 @@ class ZoomedMapRenderer:
     def render_camera_marker(self, console: tcod.console.Console, start_chunk_x: int, start_chunk_y: int):
         """Render marker showing where the detailed cursor was last positioned."""
         # Calculate which chunk the last detailed cursor is in
-        chunk_size = getattr(self.world_generator.chunk_manager, 'chunk_size', 32)
-        cursor_chunk_x = self.last_detailed_cursor_x // chunk_size
-        cursor_chunk_y = self.last_detailed_cursor_y // chunk_size
+        cursor_chunk_x = self.last_detailed_cursor_x // self._world_chunk_size
+        cursor_chunk_y = self.last_detailed_cursor_y // self._world_chunk_size
 
         # Convert to screen coordinates
         screen_x = (cursor_chunk_x - start_chunk_x) * self.overview_chunk_size + self.overview_chunk_size // 2
@@ -649,23 +1027,6 @@ class ZoomedMapRenderer:
         console.print(1, console.height - 3, "@ = Last detailed position", fg=(150, 150, 150))
         console.print(1, console.height - 2, "WASD = Move camera view", fg=(150, 150, 150))
 
-    def queue_nearby_chunk_summaries(self, start_x: int, start_y: int, width: int, height: int):
-        """Queue nearby chunk summaries for background generation."""
-        for y in range(start_y - self.background_radius, start_y + height + self.background_radius):
-            for x in range(start_x - self.background_radius, start_x + width + self.background_radius):
-                key = (x, y)
-                if key not in self.chunk_summaries:
-                    self.background_executor.submit(self._generate_summary_background, x, y)
-
-    def _generate_summary_background(self, chunk_x: int, chunk_y: int):
-        """Background thread summary generation."""
-        try:
-            summary = self.create_fast_chunk_summary(chunk_x, chunk_y)
-            with self._cache_lock:
-                self.chunk_summaries[(chunk_x, chunk_y)] = summary
-        except Exception as e:
-            print(f"Background summary generation error for chunk ({chunk_x}, {chunk_y}): {e}")
-
     def handle_movement(self, dx: int, dy: int):
         """Handle camera movement in current mode."""
         if self.current_mode == MapMode.DETAILED:
@@ -679,13 +1040,8 @@ class ZoomedMapRenderer:
             self.zoom_camera_y += dy * move_speed
 
             # Update cursor position to match center of view
-            visible_chunks_x = self.console_width // self.overview_chunk_size
-            visible_chunks_y = self.console_height // self.overview_chunk_size
-            center_chunk_x = self.zoom_camera_x // self.overview_chunk_size + visible_chunks_x // 2
-            center_chunk_y = self.zoom_camera_y // self.overview_chunk_size + visible_chunks_y // 2
-
-            self.overview_cursor_x = center_chunk_x
-            self.overview_cursor_y = center_chunk_y
+            self.overview_cursor_x = self.zoom_camera_x // self.overview_chunk_size + self._half_visible_x
+            self.overview_cursor_y = self.zoom_camera_y // self.overview_chunk_size + self._half_visible_y
 
     def get_current_mode(self) -> MapMode:
         """Get the current map mode."""
@@ -719,14 +1075,11 @@ class ZoomedMapRenderer:
         """Fast travel the detailed camera to the center of current overview view."""
         if self.current_mode == MapMode.OVERVIEW:
             # Calculate center of current view
-            visible_chunks_x = self.console_width // self.overview_chunk_size
-            visible_chunks_y = self.console_height // self.overview_chunk_size
-
-            center_chunk_x = self.zoom_camera_x // self.overview_chunk_size + visible_chunks_x // 2
-            center_chunk_y = self.zoom_camera_y // self.overview_chunk_size + visible_chunks_y // 2
+            center_chunk_x = self.zoom_camera_x // self.overview_chunk_size + self._half_visible_x
+            center_chunk_y = self.zoom_camera_y // self.overview_chunk_size + self._half_visible_y
 
             # Convert to world coordinates
-            chunk_size = getattr(self.world_generator.chunk_manager, 'chunk_size', 32)
+            chunk_size = self._world_chunk_size
             target_world_x = center_chunk_x * chunk_size + chunk_size // 2
             target_world_y = center_chunk_y * chunk_size + chunk_size // 2
 
@@ -734,8 +1087,10 @@ class ZoomedMapRenderer:
             self.camera_x = target_world_x
             self.camera_y = target_world_y
 
-            print(f"Fast traveled to chunk ({center_chunk_x}, {center_chunk_y})")
+            log.debug("Fast traveled to chunk (%d, %d)", center_chunk_x, center_chunk_y)
 
     def cleanup(self):
         """Cleanup background threads."""
-        self.background_executor.shutdown(wait=True)
+        self._ring_closed = True
+        self._ring_ready.set()
+        self._bg_worker.join()
@@ -0,0 +1,212 @@
+"""
+Numeric kernels for organic chunk generation.
+
+These fill whole chunk grids of Perlin noise samples in one call instead of
+one Python ``octave_noise`` call per cell, and reproduce
+``OrganicNoiseGenerator`` exactly so generated worlds do not change. They are
+only fast when JIT-compiled, so callers should check ``HAS_NUMBA`` and keep
+their per-cell Python path otherwise.
+"""
+
+import math
+
+from .._jit import HAS_NUMBA, njit
+
+__all__ = [
+    "HAS_NUMBA",
+    "fill_octave_noise",
+    "fill_river_mask",
+    "fill_climate_samples",
+    "fill_water_proximity",
+]
+
+
+@njit(cache=True)
+def _fade(t):
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+
+@njit(cache=True)
+def _lerp(t, a, b):
+    return a + t * (b - a)
+
+
+@njit(cache=True)
+def _grad(hash_val, x, y):
+    h = hash_val & 15
+    u = x if h < 8 else y
+    if h < 4:
+        v = y
+    elif h == 12 or h == 14:
+        v = x
+    else:
+        v = 0.0
+    return (u if (h & 1) == 0 else -u) + (v if (h & 2) == 0 else -v)
+
+
+@njit(cache=True)
+def perlin_noise(permutation, x, y):
+    """2D Perlin noise, identical to ``OrganicNoiseGenerator.noise``."""
+    floor_x = math.floor(x)
+    floor_y = math.floor(y)
+    X = int(floor_x) & 255
+    Y = int(floor_y) & 255
+    x -= floor_x
+    y -= floor_y
+
+    u = _fade(x)
+    v = _fade(y)
+
+    A = permutation[X] + Y
+    B = permutation[X + 1] + Y
+
+    return _lerp(v,
+                 _lerp(u, _grad(permutation[A], x, y),
+                       _grad(permutation[B], x - 1, y)),
+                 _lerp(u, _grad(permutation[A + 1], x, y - 1),
+                       _grad(permutation[B + 1], x - 1, y - 1)))
+
+
+@njit(cache=True)
+def octave_noise(permutation, x, y, octaves, persistence, lacunarity):
+    """Multi-octave noise, identical to ``OrganicNoiseGenerator.octave_noise``."""
+    value = 0.0
+    amplitude = 1.0
+    frequency = 1.0
+    max_value = 0.0
+
+    for _ in range(octaves):
+        value += perlin_noise(permutation, x * frequency, y * frequency) * amplitude
+        max_value += amplitude
+        amplitude *= persistence
+        frequency *= lacunarity
+
+    return value / max_value
+
+
+@njit(cache=True)
+def fill_octave_noise(out, permutation, world_x, world_y, scale, octaves, persistence, lacunarity):
+    """
+    Sample multi-octave noise for every cell of a chunk grid.
+
+    Cell (y, x) is sampled at ``((world_x + x) * scale, (world_y + y) * scale)``.
+
+    Args:
+        out: Float64 output array, shape (size, size)
+        permutation: Doubled permutation table of the noise generator
+        world_x: World X coordinate of the grid's first column
+        world_y: World Y coordinate of the grid's first row
+        scale: Noise coordinates per world tile
+        octaves: Number of octaves
+        persistence: Amplitude multiplier per octave
+        lacunarity: Frequency multiplier per octave
+    """
+    height, width = out.shape
+    for y in range(height):
+        pos_y = (world_y + y) * scale
+        for x in range(width):
+            out[y, x] = octave_noise(permutation, (world_x + x) * scale, pos_y,
+                                     octaves, persistence, lacunarity)
+
+
+@njit(cache=True)
+def fill_river_mask(out, water_permutation, detail_permutation, world_x, world_y, scale):
+    """
+    Mark river cells where two single-octave channel noises and a rarity noise line up.
+
+    Mirrors ``OrganicWorldGenerator._generate_river_system``.
+
+    Args:
+        out: Boolean output array, shape (size, size)
+        water_permutation: Permutation table of the water noise
+        detail_permutation: Permutation table of the detail noise
+        world_x: World X coordinate of the grid's first column
+        world_y: World Y coordinate of the grid's first row
+        scale: River noise coordinates per world tile
+    """
+    height, width = out.shape
+    for y in range(height):
+        pos_y = (world_y + y) * scale
+        for x in range(width):
+            pos_x = (world_x + x) * scale
+            out[y, x] = False
+            if abs(octave_noise(water_permutation, pos_x, pos_y, 1, 0.5, 2.0)) >= 0.05:
+                continue
+            if abs(octave_noise(water_permutation, pos_x * 3, pos_y * 3, 1, 0.5, 2.0)) >= 0.05:
+                continue
+            out[y, x] = abs(perlin_noise(detail_permutation, pos_x * 5, pos_y * 5)) < 0.1
+
+
+@njit(cache=True)
+def fill_climate_samples(temp_out, moisture_out, temp_permutation, moisture_permutation,
+                         world_x, world_y, scale):
+    """
+    Sample the large-scale climate at each cell and its eight transition neighbors.
+
+    Sample 0 is the cell itself; samples 1-8 are offset by half a noise unit
+    in the order ``for dx in (-1, 0, 1): for dy in (-1, 0, 1)`` (skipping the
+    center), matching ``_calculate_biome_transitions``. Values are normalized
+    to 0-1.
+
+    Args:
+        temp_out: Float64 temperature output, shape (size, size, 9)
+        moisture_out: Float64 moisture output, shape (size, size, 9)
+        temp_permutation: Permutation table of the temperature noise
+        moisture_permutation: Permutation table of the moisture noise
+        world_x: World X coordinate of the grid's first column
+        world_y: World Y coordinate of the grid's first row
+        scale: Biome noise coordinates per world tile
+    """
+    height, width = temp_out.shape[0], temp_out.shape[1]
+    for y in range(height):
+        pos_y = (world_y + y) * scale
+        for x in range(width):
+            pos_x = (world_x + x) * scale
+            temp_out[y, x, 0] = (octave_noise(temp_permutation, pos_x, pos_y, 2, 0.6, 2.0) + 1) / 2
+            moisture_out[y, x, 0] = (octave_noise(moisture_permutation, pos_x, pos_y, 2, 0.6, 2.0) + 1) / 2
+
+            sample = 1
+            for dx in range(-1, 2):
+                for dy in range(-1, 2):
+                    if dx == 0 and dy == 0:
+                        continue
+                    neighbor_x = pos_x + dx * 0.5
+                    neighbor_y = pos_y + dy * 0.5
+                    temp_out[y, x, sample] = (octave_noise(
+                        temp_permutation, neighbor_x, neighbor_y, 2, 0.6, 2.0) + 1) / 2
+                    moisture_out[y, x, sample] = (octave_noise(
+                        moisture_permutation, neighbor_x, neighbor_y, 2, 0.6, 2.0) + 1) / 2
+                    sample += 1
+
+
+@njit(cache=True)
+def fill_water_proximity(out, water_mask, radius):
+    """
+    Compute the distance-weighted share of water cells around each cell.
+
+    Mirrors ``OrganicWorldGenerator._calculate_water_proximity`` for every
+    cell of the grid; neighbors outside the grid are not counted.
+
+    Args:
+        out: Float64 output array, shape (size, size)
+        water_mask: Boolean water mask, shape (size, size)
+        radius: Neighborhood radius in cells
+    """
+    height, width = water_mask.shape
+    for y in range(height):
+        for x in range(width):
+            water_count = 0.0
+            total_count = 0
+            for dy in range(-radius, radius + 1):
+                ny = y + dy
+                if ny < 0 or ny >= height:
+                    continue
+                for dx in range(-radius, radius + 1):
+                    nx = x + dx
+                    if nx < 0 or nx >= width:
+                        continue
+                    total_count += 1
+                    if water_mask[ny, nx]:
+                        distance = max(1.0, math.sqrt(dx * dx + dy * dy))
+                        water_count += 1.0 / distance
+            out[y, x] = min(1.0, water_count / total_count) if total_count > 0 else 0.0
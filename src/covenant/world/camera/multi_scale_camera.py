@@ -5,14 +5,27 @@ This module manages camera movement and positioning across the three
 viewing scales: World, Regional, and Local.
 """
 
+import logging
 import time
 from typing import Tuple, Optional
 
 from ..data.scale_types import ViewScale, ScaleConfig, get_scale_config
 
+log = logging.getLogger(__name__)
+
+# Index of each scale in the per-scale camera state lists
+_SCALE_SLOT = {ViewScale.WORLD: 0, ViewScale.REGIONAL: 1, ViewScale.LOCAL: 2}
+
 
 class MultiScaleCameraSystem:
     """Manages camera across three viewing scales."""
+
+    __slots__ = (
+        '_current_scale', '_slot', 'scale_configs', 'pixels_per_unit', 'max_x', 'max_y',
+        'camera_x', 'camera_y',
+        'last_movement_time', 'movement_velocity', 'total_distance_moved',
+        'last_scale_change_time', 'scale_change_count',
+    )
     
     def __init__(self, seed: Optional[int] = None):
         """
@@ -21,32 +34,50 @@ class MultiScaleCameraSystem:
         Args:
             seed: Seed for any random camera behavior (currently unused)
         """
-        self.current_scale = ViewScale.LOCAL  # Start at detailed view
-        
         # Scale configurations
         self.scale_configs = {
             ViewScale.WORLD: get_scale_config(ViewScale.WORLD),
             ViewScale.REGIONAL: get_scale_config(ViewScale.REGIONAL), 
             ViewScale.LOCAL: get_scale_config(ViewScale.LOCAL)
         }
-        
-        # Independent camera positions for each scale (in scale units)
-        self.world_camera_x = 4      # Center of 8×6 world
-        self.world_camera_y = 3
-        self.regional_camera_x = 16  # Center of 32×32 region
-        self.regional_camera_y = 16
-        self.local_camera_x = 16     # Center of 32×32 local area
-        self.local_camera_y = 16
-        
-        # Movement tracking
-        self.last_movement_time = time.time()
+        self.current_scale = ViewScale.LOCAL  # Start at detailed view
+
+        # World tiles per scale unit and inclusive position bounds, indexed by scale slot
+        self.pixels_per_unit = [0] * len(_SCALE_SLOT)
+        self.max_x = [0] * len(_SCALE_SLOT)
+        self.max_y = [0] * len(_SCALE_SLOT)
+        for scale, slot in _SCALE_SLOT.items():
+            config = self.scale_configs[scale]
+            self.pixels_per_unit[slot] = config.pixels_per_unit
+            self.max_x[slot] = config.map_size[0] - 1
+            self.max_y[slot] = config.map_size[1] - 1
+        
+        # Independent camera positions for each scale (in scale units), one
+        # entry per scale slot: center of the 8×6 world, 32×32 region and
+        # 32×32 local area
+        self.camera_x = [4, 16, 16]
+        self.camera_y = [3, 16, 16]
+        
+        # Movement tracking (monotonic timestamps, only taken when something changes)
+        self.last_movement_time = time.monotonic()
         self.movement_velocity = 0.0
         self.total_distance_moved = 0.0
         
         # Scale transition tracking
-        self.last_scale_change_time = time.time()
+        self.last_scale_change_time = self.last_movement_time
         self.scale_change_count = 0
     
+    @property
+    def current_scale(self) -> ViewScale:
+        """Current viewing scale."""
+        return self._current_scale
+
+    @current_scale.setter
+    def current_scale(self, scale: ViewScale) -> None:
+        # Every scale change goes through here, so the cached slot never goes stale
+        self._current_scale = scale
+        self._slot = _SCALE_SLOT[scale]  # Index of the scale in the per-scale lists
+
     def get_current_scale(self) -> ViewScale:
         """
         Get current viewing scale.
@@ -54,7 +85,7 @@ class MultiScaleCameraSystem:
         Returns:
             Current ViewScale
         """
-        return self.current_scale
+        return self._current_scale
     
     def change_scale(self, new_scale: ViewScale) -> bool:
         """
@@ -69,10 +100,10 @@ class MultiScaleCameraSystem:
         if new_scale != self.current_scale:
             old_scale = self.current_scale
             self.current_scale = new_scale
-            self.last_scale_change_time = time.time()
+            self.last_scale_change_time = time.monotonic()
             self.scale_change_count += 1
             
-            print(f"Camera scale changed: {old_scale.value} → {new_scale.value}")
+            log.debug("Camera scale changed: %s → %s", old_scale.value, new_scale.value)
             return True
         
         return False
@@ -84,12 +115,8 @@ class MultiScaleCameraSystem:
         Returns:
             Tuple of (x, y) coordinates in current scale units
         """
-        if self.current_scale == ViewScale.WORLD:
-            return self.world_camera_x, self.world_camera_y
-        elif self.current_scale == ViewScale.REGIONAL:
-            return self.regional_camera_x, self.regional_camera_y
-        else:  # LOCAL
-            return self.local_camera_x, self.local_camera_y
+        slot = self._slot
+        return self.camera_x[slot], self.camera_y[slot]
     
     def set_camera_position(self, x: int, y: int) -> None:
         """
@@ -99,19 +126,13 @@ class MultiScaleCameraSystem:
             x: X coordinate in current scale units
             y: Y coordinate in current scale units
         """
-        config = self.scale_configs[self.current_scale]
-        max_x, max_y = config.map_size
-        
+        slot = self._slot
+
         # Clamp to bounds
-        x = max(0, min(max_x - 1, x))
-        y = max(0, min(max_y - 1, y))
-        
-        if self.current_scale == ViewScale.WORLD:
-            self.world_camera_x, self.world_camera_y = x, y
-        elif self.current_scale == ViewScale.REGIONAL:
-            self.regional_camera_x, self.regional_camera_y = x, y
-        else:  # LOCAL
-            self.local_camera_x, self.local_camera_y = x, y
+        max_x = self.max_x[slot]
+        max_y = self.max_y[slot]
+        self.camera_x[slot] = 0 if x < 0 else (max_x if x > max_x else x)
+        self.camera_y[slot] = 0 if y < 0 else (max_y if y > max_y else y)
     
     def move_camera(self, dx: int, dy: int) -> bool:
         """
@@ -124,36 +145,35 @@ class MultiScaleCameraSystem:
         Returns:
             True if camera moved, False if movement was blocked
         """
-        current_time = time.time()
-        
         # Get current position
-        current_x, current_y = self.get_camera_position()
+        slot = self._slot
+        current_x = self.camera_x[slot]
+        current_y = self.camera_y[slot]
         
         # Calculate new position
         new_x = current_x + dx
         new_y = current_y + dy
         
-        # Check bounds
-        config = self.scale_configs[self.current_scale]
-        max_x, max_y = config.map_size
-        
         # Clamp to bounds
-        clamped_x = max(0, min(max_x - 1, new_x))
-        clamped_y = max(0, min(max_y - 1, new_y))
+        max_x = self.max_x[slot]
+        max_y = self.max_y[slot]
+        clamped_x = 0 if new_x < 0 else (max_x if new_x > max_x else new_x)
+        clamped_y = 0 if new_y < 0 else (max_y if new_y > max_y else new_y)
         
         # Check if movement was blocked
         movement_blocked = (clamped_x != new_x or clamped_y != new_y)
         
-        # Update position
-        old_x, old_y = current_x, current_y
-        self.set_camera_position(clamped_x, clamped_y)
+        # Update position (already clamped, so skip set_camera_position)
+        self.camera_x[slot] = clamped_x
+        self.camera_y[slot] = clamped_y
         
         # Calculate actual movement for velocity tracking
-        actual_dx = clamped_x - old_x
-        actual_dy = clamped_y - old_y
+        actual_dx = clamped_x - current_x
+        actual_dy = clamped_y - current_y
         
         if actual_dx != 0 or actual_dy != 0:
             # Update movement tracking
+            current_time = time.monotonic()
             time_delta = current_time - self.last_movement_time
             if time_delta > 0:
                 distance = (actual_dx * actual_dx + actual_dy * actual_dy) ** 0.5
@@ -171,9 +191,8 @@ class MultiScaleCameraSystem:
         Returns:
             Tuple of (min_x, min_y, max_x, max_y)
         """
-        config = self.scale_configs[self.current_scale]
-        max_x, max_y = config.map_size
-        return 0, 0, max_x - 1, max_y - 1
+        slot = self._slot
+        return 0, 0, self.max_x[slot], self.max_y[slot]
     
     def convert_position_to_world_coordinates(self, scale: ViewScale, 
                                             camera_x: int, camera_y: int) -> Tuple[int, int]:
@@ -188,12 +207,8 @@ class MultiScaleCameraSystem:
         Returns:
             Tuple of (world_x, world_y) in tile coordinates
         """
-        config = self.scale_configs[scale]
-        
-        world_x = camera_x * config.pixels_per_unit
-        world_y = camera_y * config.pixels_per_unit
-        
-        return world_x, world_y
+        factor = self.pixels_per_unit[_SCALE_SLOT[scale]]
+        return camera_x * factor, camera_y * factor
     
     def get_current_world_coordinates(self) -> Tuple[int, int]:
         """
@@ -202,10 +217,9 @@ class MultiScaleCameraSystem:
         Returns:
             Tuple of (world_x, world_y) in tile coordinates
         """
-        camera_x, camera_y = self.get_camera_position()
-        return self.convert_position_to_world_coordinates(
-            self.current_scale, camera_x, camera_y
-        )
+        slot = self._slot
+        factor = self.pixels_per_unit[slot]
+        return self.camera_x[slot] * factor, self.camera_y[slot] * factor
     
     def center_camera_on_world_coordinates(self, world_x: int, world_y: int) -> None:
         """
@@ -215,11 +229,10 @@ class MultiScaleCameraSystem:
             world_x: World X coordinate in tiles
             world_y: World Y coordinate in tiles
         """
-        config = self.scale_configs[self.current_scale]
-        
         # Convert world coordinates to scale coordinates
-        scale_x = world_x // config.pixels_per_unit
-        scale_y = world_y // config.pixels_per_unit
+        factor = self.pixels_per_unit[self._slot]
+        scale_x = world_x // factor
+        scale_y = world_y // factor
         
         self.set_camera_position(scale_x, scale_y)
     
@@ -230,6 +243,7 @@ class MultiScaleCameraSystem:
         Returns:
             Dictionary with movement statistics
         """
+        now = time.monotonic()
         return {
             "current_scale": self.current_scale.value,
             "current_position": self.get_camera_position(),
@@ -237,8 +251,8 @@ class MultiScaleCameraSystem:
             "movement_velocity": self.movement_velocity,
             "total_distance_moved": self.total_distance_moved,
             "scale_changes": self.scale_change_count,
-            "time_since_last_movement": time.time() - self.last_movement_time,
-            "time_since_last_scale_change": time.time() - self.last_scale_change_time
+            "time_since_last_movement": now - self.last_movement_time,
+            "time_since_last_scale_change": now - self.last_scale_change_time
         }
     
     def reset_position(self, scale: Optional[ViewScale] = None) -> None:
@@ -255,14 +269,11 @@ class MultiScaleCameraSystem:
         center_x = config.map_size[0] // 2
         center_y = config.map_size[1] // 2
         
-        if scale == ViewScale.WORLD:
-            self.world_camera_x, self.world_camera_y = center_x, center_y
-        elif scale == ViewScale.REGIONAL:
-            self.regional_camera_x, self.regional_camera_y = center_x, center_y
-        else:  # LOCAL
-            self.local_camera_x, self.local_camera_y = center_x, center_y
+        slot = _SCALE_SLOT[scale]
+        self.camera_x[slot] = center_x
+        self.camera_y[slot] = center_y
         
-        print(f"Camera reset to center for {scale.value} scale: ({center_x}, {center_y})")
+        log.debug("Camera reset to center for %s scale: (%d, %d)", scale.value, center_x, center_y)
     
     def reset_all_positions(self) -> None:
         """Reset all camera positions to their respective centers."""
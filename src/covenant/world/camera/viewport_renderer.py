@@ -5,13 +5,22 @@ This module handles rendering the world at different scales with
 consistent UI layout and visual feedback.
 """
 
+from functools import lru_cache
+from typing import Dict, Tuple, Optional
+
+import numpy as np
 import tcod
-from typing import Tuple, Optional
 
 from ..generators.world_scale import WorldScaleGenerator
 from ..generators.regional_scale import RegionalScaleGenerator
 from .multi_scale_camera import MultiScaleCameraSystem
-from ..data.scale_types import ViewScale
+from ..data.scale_types import ViewScale, SECTOR_SHIFT
+
+
+@lru_cache(maxsize=256)
+def _encode_text(text: str) -> np.ndarray:
+    """Encode a UI label as codepoints (shared between calls, do not modify)."""
+    return np.array([ord(char) for char in text], dtype=np.int32)
 
 
 class MultiScaleViewportRenderer:
@@ -50,6 +59,30 @@ class MultiScaleViewportRenderer:
         # Rendering state
         self.last_rendered_scale = None
         self.last_camera_position = None
+
+        # While the camera pans, sectors without a regional map yet are shown as their
+        # coarse world sector, and only generated once it has been still this many frames
+        self.regional_settle_frames = 4
+        self._frames_since_move = self.regional_settle_frames
+
+        # World view display tiles per sector, built from its regional map
+        self._sector_tiles: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+        # Composed world view frame, keyed by the (console size, origin) it was built for
+        self._world_frame: Optional[Tuple[Tuple[int, int, int, int],
+                                          Tuple[np.ndarray, np.ndarray, np.ndarray]]] = None
+
+        # View renderer per scale, each called with (console, camera_x, camera_y)
+        self._view_renderers = {
+            ViewScale.WORLD: self._render_world_view,
+            ViewScale.REGIONAL: self._render_regional_view,
+            ViewScale.LOCAL: self._render_local_view,
+        }
+
+    def invalidate_world_map(self) -> None:
+        """Drop the cached world view tiles and frame, e.g. after the world data changes."""
+        self._sector_tiles.clear()
+        self._world_frame = None
     
     def update_console_size(self, width: int, height: int) -> None:
         """
@@ -77,19 +110,20 @@ class MultiScaleViewportRenderer:
         """
         current_scale = self.camera_system.get_current_scale()
         camera_x, camera_y = self.camera_system.get_camera_position()
+
+        # Count frames since the camera last moved within this scale
+        if current_scale == self.last_rendered_scale and (camera_x, camera_y) != self.last_camera_position:
+            self._frames_since_move = 0
+        else:
+            self._frames_since_move += 1
         
         # Clear the rendering area first
         self._clear_render_area(console)
         
-        if current_scale == ViewScale.WORLD:
-            self._render_world_view(console, camera_x, camera_y)
-        elif current_scale == ViewScale.REGIONAL:
-            self._render_regional_view(console, camera_x, camera_y)
-        else:  # LOCAL
-            self._render_local_view(console, camera_x, camera_y)
+        self._view_renderers[current_scale](console, camera_x, camera_y)
         
         # Always render scale indicator and UI
-        self._render_scale_ui(console)
+        self._render_scale_ui(console, current_scale, camera_x, camera_y)
         
         # Update rendering state
         self.last_rendered_scale = current_scale
@@ -97,10 +131,11 @@ class MultiScaleViewportRenderer:
     
     def _clear_render_area(self, console: tcod.console.Console) -> None:
         """Clear the main rendering area."""
-        for y in range(self.render_start_y, self.render_end_y):
-            for x in range(self.render_width):
-                if 0 <= x < console.width and 0 <= y < console.height:
-                    console.print(x, y, " ", fg=(0, 0, 0), bg=(0, 0, 0))
+        # One C-level rectangle fill, clipped to the console
+        width = min(self.render_width, console.width)
+        height = min(self.render_end_y, console.height) - self.render_start_y
+        if width > 0 and height > 0:
+            console.draw_rect(0, self.render_start_y, width, height, ord(" "), fg=(0, 0, 0), bg=(0, 0, 0))
     
     def _render_world_view(self, console: tcod.console.Console,
                           camera_x: int, camera_y: int) -> None:
@@ -113,93 +148,141 @@ class MultiScaleViewportRenderer:
             camera_x: Camera X position in world scale
             camera_y: Camera Y position in world scale
         """
-        world_map = self.world_generator.generate_complete_world_map()
-
         # Each sector is rendered as 16×16 characters
         sector_display_size = 16
-        total_width = world_map.world_size_sectors[0] * sector_display_size  # 8 * 16 = 128
-        total_height = world_map.world_size_sectors[1] * sector_display_size  # 6 * 16 = 96
+        width_sectors, height_sectors = self.world_generator.world_size_sectors
+        total_width = width_sectors * sector_display_size  # 8 * 16 = 128
+        total_height = height_sectors * sector_display_size  # 6 * 16 = 96
 
         # Calculate rendering offset (may need scrolling for large displays)
         start_x = max(0, (self.render_width - total_width) // 2)
         start_y = max(self.render_start_y, self.render_start_y + (self.render_height - total_height) // 2)
 
-        # Generate regional data for each sector to fill the 16×16 display
-        for (sector_x, sector_y), sector_data in world_map.sectors.items():
-            # Calculate base position for this sector
-            sector_base_x = start_x + (sector_x * sector_display_size)
-            sector_base_y = start_y + (sector_y * sector_display_size)
+        # Visible part of the world, clipped to the console
+        width = min(total_width, console.width - start_x)
+        height = min(total_height, console.height - start_y)
+        if width <= 0 or height <= 0:
+            return
 
-            # Generate regional map for this sector to get detailed terrain
-            try:
-                regional_map = self.regional_generator.generate_regional_map(sector_x, sector_y)
+        # The composed frame only changes with the console layout
+        key = (console.width, console.height, start_x, start_y)
+        cached = self._world_frame
+        if cached is not None and cached[0] == key:
+            ch, fg, bg = cached[1]
+        else:
+            ch, fg, bg = frame = self._compose_world_frame(width, height, sector_display_size)
+            # Sectors still on their fallback fill are retried next frame
+            if all(coord in self._sector_tiles for coord in self._visible_sectors(width, height, sector_display_size)):
+                self._world_frame = (key, frame)
+
+        rows = slice(start_y, start_y + height)
+        cols = slice(start_x, start_x + width)
+        console.ch[rows, cols] = ch
+        console.fg[rows, cols] = fg
+        console.bg[rows, cols] = bg
+
+        # Highlight current camera sector: brighten it, with a cursor overlay in its center
+        left = camera_x * sector_display_size
+        top = camera_y * sector_display_size
+        if left < width and top < height:
+            right = min(left + sector_display_size, width)
+            bottom = min(top + sector_display_size, height)
+            console.fg[start_y + top:start_y + bottom, start_x + left:start_x + right] = (
+                np.minimum(fg[top:bottom, left:right], 205) + 50
+            )
+
+            center_x = left + sector_display_size // 2
+            center_y = top + sector_display_size // 2
+            if center_x < width and center_y < height:
+                console.ch[start_y + center_y, start_x + center_x] = ord("⊕")
+                console.fg[start_y + center_y, start_x + center_x] = (255, 255, 0)
+                console.bg[start_y + center_y, start_x + center_x] = (120, 120, 0)
+
+    def _visible_sectors(self, width: int, height: int, size: int):
+        """Iterate the coordinates of the sectors overlapping the top-left width×height tiles."""
+        width_sectors, height_sectors = self.world_generator.world_size_sectors
+        for sector_y in range(min(height_sectors, -(-height // size))):
+            for sector_x in range(min(width_sectors, -(-width // size))):
+                yield sector_x, sector_y
+
+    def _compose_world_frame(self, width: int, height: int,
+                             size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compose the visible part of the world view from the sector tiles.
 
-                # Sample 16×16 points from the 32×32 regional map (every other point)
-                for display_y in range(sector_display_size):
-                    for display_x in range(sector_display_size):
-                        # Map display coordinates to regional coordinates (sample every 2nd point)
-                        regional_x = (display_x * 32) // sector_display_size
-                        regional_y = (display_y * 32) // sector_display_size
-
-                        render_x = sector_base_x + display_x
-                        render_y = sector_base_y + display_y
-
-                        # Check if within console bounds
-                        if (0 <= render_x < console.width and
-                            0 <= render_y < console.height):
-
-                            # Get regional block data
-                            block_data = regional_map.get_block(regional_x, regional_y)
-
-                            if block_data:
-                                char = block_data.display_char
-                                fg_color = block_data.display_color
-                                bg_color = block_data.display_bg_color
-                            else:
-                                # Fallback to sector data
-                                char = sector_data.display_char
-                                fg_color = sector_data.display_color
-                                bg_color = sector_data.display_bg_color
-
-                            # Highlight current camera sector
-                            if sector_x == camera_x and sector_y == camera_y:
-                                # Add cursor overlay in center of current sector
-                                if (display_x == sector_display_size // 2 and
-                                    display_y == sector_display_size // 2):
-                                    char = "⊕"
-                                    fg_color = (255, 255, 0)
-                                    bg_color = (120, 120, 0)
-                                else:
-                                    # Brighten the current sector
-                                    fg_color = tuple(min(255, c + 50) for c in fg_color)
-
-                            console.print(render_x, render_y, char, fg=fg_color, bg=bg_color)
+        Args:
+            width: Visible width in tiles
+            height: Visible height in tiles
+            size: Tiles per sector side
 
-            except Exception as e:
-                # Fallback: fill sector with basic terrain pattern
-                for display_y in range(sector_display_size):
-                    for display_x in range(sector_display_size):
-                        render_x = sector_base_x + display_x
-                        render_y = sector_base_y + display_y
-
-                        if (0 <= render_x < console.width and
-                            0 <= render_y < console.height):
-
-                            char = sector_data.display_char
-                            fg_color = sector_data.display_color
-                            bg_color = sector_data.display_bg_color
-
-                            # Highlight current camera sector
-                            if sector_x == camera_x and sector_y == camera_y:
-                                if (display_x == sector_display_size // 2 and
-                                    display_y == sector_display_size // 2):
-                                    char = "⊕"
-                                    fg_color = (255, 255, 0)
-                                    bg_color = (120, 120, 0)
-                                else:
-                                    fg_color = tuple(min(255, c + 50) for c in fg_color)
-
-                            console.print(render_x, render_y, char, fg=fg_color, bg=bg_color)
+        Returns:
+            Tuple of (ch, fg, bg) arrays of shape (height, width) and (height, width, 3)
+        """
+        sector_grid = self.world_generator.generate_complete_world_map().sector_grid
+        ch = np.empty((height, width), dtype=np.int32)
+        fg = np.empty((height, width, 3), dtype=np.uint8)
+        bg = np.empty((height, width, 3), dtype=np.uint8)
+
+        # Only sectors overlapping the visible area are generated
+        for sector_x, sector_y in self._visible_sectors(width, height, size):
+            sector_data = sector_grid[sector_y, sector_x]
+            sector_ch, sector_fg, sector_bg = self._get_sector_tiles(sector_x, sector_y, sector_data, size)
+            left = sector_x * size
+            top = sector_y * size
+            rows = slice(top, min(top + size, height))
+            cols = slice(left, min(left + size, width))
+            ch[rows, cols] = sector_ch[:rows.stop - top, :cols.stop - left]
+            fg[rows, cols] = sector_fg[:rows.stop - top, :cols.stop - left]
+            bg[rows, cols] = sector_bg[:rows.stop - top, :cols.stop - left]
+
+        return ch, fg, bg
+
+    def _get_sector_tiles(self, sector_x: int, sector_y: int, sector_data,
+                          size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the codepoint, foreground and background tiles of a world view sector.
+
+        Tiles sample every other block of the sector's 32×32 regional map and
+        are cached once that map exists; sectors whose regional map cannot be
+        generated are filled with the sector's own appearance.
+
+        Args:
+            sector_x: World sector X coordinate
+            sector_y: World sector Y coordinate
+            sector_data: World sector data, used for blocks without regional data
+            size: Tiles per sector side
+
+        Returns:
+            Tuple of (ch, fg, bg) arrays of shape (size, size) and (size, size, 3)
+        """
+        tiles = self._sector_tiles.get((sector_x, sector_y))
+        if tiles is not None:
+            return tiles
+
+        ch = np.full((size, size), sector_data.display_char_code, dtype=np.int32)
+        fg = np.empty((size, size, 3), dtype=np.uint8)
+        bg = np.empty((size, size, 3), dtype=np.uint8)
+        fg[:] = sector_data.display_fg_array
+        bg[:] = sector_data.display_bg_array
+
+        try:
+            regional_map = self.regional_generator.generate_regional_map(sector_x, sector_y)
+        except Exception:
+            # Fallback: fill sector with basic terrain pattern (retried next frame)
+            return ch, fg, bg
+
+        for display_y in range(size):
+            for display_x in range(size):
+                # Map display coordinates to regional coordinates (sample every 2nd point)
+                block_data = regional_map.get_block((display_x * 32) // size, (display_y * 32) // size)
+                if block_data:
+                    ch[display_y, display_x] = ord(block_data.display_char)
+                    fg[display_y, display_x] = block_data.display_color
+                    bg[display_y, display_x] = block_data.display_bg_color
+
+        tiles = ch, fg, bg
+        self._sector_tiles[(sector_x, sector_y)] = tiles
+        return tiles
     
     def _render_regional_view(self, console: tcod.console.Console,
                              camera_x: int, camera_y: int) -> None:
@@ -213,17 +296,32 @@ class MultiScaleViewportRenderer:
         """
         # Get current world coordinates to determine which sector to show
         world_x, world_y = self.camera_system.get_current_world_coordinates()
-        sector_x = world_x // self.world_generator.sector_size_tiles
-        sector_y = world_y // self.world_generator.sector_size_tiles
-
-        # Generate regional map for current sector
-        try:
-            regional_map = self.regional_generator.generate_regional_map(sector_x, sector_y)
-        except Exception as e:
-            # Fallback to placeholder if generation fails
-            self._render_placeholder_grid(console, "REGIONAL VIEW", f"Error: {str(e)}",
-                                        32, 32, camera_x, camera_y)
-            return
+        sector_x = world_x >> SECTOR_SHIFT
+        sector_y = world_y >> SECTOR_SHIFT
+
+        # Panning into a sector without a regional map: show the coarse world sector
+        # until the camera settles instead of stalling the pan on its generation
+        coarse_sector = None
+        if (self._frames_since_move < self.regional_settle_frames and
+                (sector_x, sector_y) not in self.regional_generator.regional_maps):
+            coarse_sector = self.world_generator.generate_complete_world_map().get_sector(sector_x, sector_y)
+
+        if coarse_sector is not None:
+            regional_map = None
+            size = self.regional_generator.blocks_per_sector
+            ch = np.full((size, size), coarse_sector.display_char_code, dtype=np.int32)
+            fg = np.broadcast_to(coarse_sector.display_fg_array, (size, size, 3))
+            bg = np.broadcast_to(coarse_sector.display_bg_array, (size, size, 3))
+        else:
+            # Generate regional map for current sector
+            try:
+                regional_map = self.regional_generator.generate_regional_map(sector_x, sector_y)
+            except Exception as e:
+                # Fallback to placeholder if generation fails
+                self._render_placeholder_grid(console, "REGIONAL VIEW", f"Error: {str(e)}",
+                                            32, 32, camera_x, camera_y)
+                return
+            ch, fg, bg = regional_map.to_arrays()
 
         # Calculate rendering area - use more space for regional view
         max_display_size = min(self.render_width - 4, self.render_height - 8, 32)
@@ -231,47 +329,32 @@ class MultiScaleViewportRenderer:
         start_x = (self.render_width - max_display_size) // 2
         start_y = self.render_start_y + 4
 
-        # Render regional blocks
-        for y in range(max_display_size):
-            for x in range(max_display_size):
-                if x < 32 and y < 32:  # Within regional map bounds
-                    block_data = regional_map.get_block(x, y)
-
-                    render_x = start_x + x
-                    render_y = start_y + y
-
-                    if (0 <= render_x < console.width and
-                        0 <= render_y < console.height):
-
-                        if block_data:
-                            # Highlight camera position with bright cursor
-                            if x == camera_x and y == camera_y:
-                                char = "⊕"
-                                fg = (255, 255, 0)
-                                bg = (120, 120, 0)
-                            else:
-                                char = block_data.display_char
-                                fg = block_data.display_color
-                                bg = block_data.display_bg_color
-                        else:
-                            # Missing block data
-                            char = "?"
-                            fg = (255, 0, 0)
-                            bg = (100, 0, 0)
-
-                        console.print(render_x, render_y, char, fg=fg, bg=bg)
+        # Blit the visible blocks, clipped to the console
+        width = min(max_display_size, console.width - start_x)
+        height = min(max_display_size, console.height - start_y)
+        if width > 0 and height > 0:
+            rows = slice(start_y, start_y + height)
+            cols = slice(start_x, start_x + width)
+            console.ch[rows, cols] = ch[:height, :width]
+            console.fg[rows, cols] = fg[:height, :width]
+            console.bg[rows, cols] = bg[:height, :width]
+
+            # Highlight camera position with bright cursor (missing blocks keep their marker)
+            if (0 <= camera_x < width and 0 <= camera_y < height and
+                    (regional_map is None or regional_map.get_block(camera_x, camera_y))):
+                console.ch[start_y + camera_y, start_x + camera_x] = ord("⊕")
+                console.fg[start_y + camera_y, start_x + camera_x] = (255, 255, 0)
+                console.bg[start_y + camera_y, start_x + camera_x] = (120, 120, 0)
 
         # Render title and position info
         title = f"REGIONAL VIEW - Sector ({sector_x},{sector_y})"
         title_x = (self.render_width - len(title)) // 2
-        if 0 <= title_x < console.width:
-            console.print(title_x, self.render_start_y + 1, title, fg=(255, 255, 255))
+        self._print_text(console, title_x, self.render_start_y + 1, title, (255, 255, 255))
 
         # Show current regional position
         pos_info = f"Regional Position: ({camera_x},{camera_y})"
         pos_x = (self.render_width - len(pos_info)) // 2
-        if 0 <= pos_x < console.width:
-            console.print(pos_x, self.render_start_y + 2, pos_info, fg=(200, 200, 200))
+        self._print_text(console, pos_x, self.render_start_y + 2, pos_info, (200, 200, 200))
     
     def _render_local_view(self, console: tcod.console.Console,
                           camera_x: int, camera_y: int) -> None:
@@ -310,26 +393,21 @@ class MultiScaleViewportRenderer:
         grid_start_x = (self.render_width - available_width) // 2
         grid_start_y = self.render_start_y + 3
         
-        # Render grid
-        for y in range(available_height):
-            for x in range(available_width):
-                render_x = grid_start_x + x
-                render_y = grid_start_y + y
-                
-                if (0 <= render_x < console.width and 
-                    0 <= render_y < console.height):
-                    
-                    # Highlight camera position
-                    if x == camera_x and y == camera_y:
-                        char = "⊕"
-                        fg = (255, 255, 0)
-                        bg = (60, 60, 0)
-                    else:
-                        char = "·"
-                        fg = (100, 100, 100)
-                        bg = (20, 20, 20)
-                    
-                    console.print(render_x, render_y, char, fg=fg, bg=bg)
+        # Render grid as one fill, clipped to the console, then patch the cursor
+        width = min(available_width, console.width - grid_start_x)
+        height = min(available_height, console.height - grid_start_y)
+        if width > 0 and height > 0:
+            rows = slice(grid_start_y, grid_start_y + height)
+            cols = slice(grid_start_x, grid_start_x + width)
+            console.ch[rows, cols] = ord("·")
+            console.fg[rows, cols] = (100, 100, 100)
+            console.bg[rows, cols] = (20, 20, 20)
+
+            # Highlight camera position
+            if 0 <= camera_x < width and 0 <= camera_y < height:
+                console.ch[grid_start_y + camera_y, grid_start_x + camera_x] = ord("⊕")
+                console.fg[grid_start_y + camera_y, grid_start_x + camera_x] = (255, 255, 0)
+                console.bg[grid_start_y + camera_y, grid_start_x + camera_x] = (60, 60, 0)
         
         # Render title and subtitle
         center_x = self.render_width // 2
@@ -337,63 +415,85 @@ class MultiScaleViewportRenderer:
         
         # Title
         title_x = center_x - len(title) // 2
-        if 0 <= title_x < console.width and 0 <= title_y < console.height:
-            console.print(title_x, title_y, title, fg=(255, 255, 255))
+        self._print_text(console, title_x, title_y, title, (255, 255, 255))
         
         # Subtitle
         subtitle_x = center_x - len(subtitle) // 2
         subtitle_y = title_y + 1
-        if 0 <= subtitle_x < console.width and 0 <= subtitle_y < console.height:
-            console.print(subtitle_x, subtitle_y, subtitle, fg=(150, 150, 150))
+        self._print_text(console, subtitle_x, subtitle_y, subtitle, (150, 150, 150))
     
-    def _render_scale_ui(self, console: tcod.console.Console) -> None:
+    def _render_scale_ui(self, console: tcod.console.Console, current_scale: ViewScale,
+                         camera_x: int, camera_y: int) -> None:
         """
         Render scale indicator and controls.
 
         Args:
             console: tcod console to render to
+            current_scale: Scale being rendered
+            camera_x: Camera X position in the current scale
+            camera_y: Camera Y position in the current scale
         """
-        current_scale = self.camera_system.get_current_scale()
-        camera_x, camera_y = self.camera_system.get_camera_position()
-        world_x, world_y = self.camera_system.get_current_world_coordinates()
-
         # For world view, show different info since it's much larger
         if current_scale == ViewScale.WORLD:
             # Show info at top of screen
             scale_text = f"WORLD VIEW - Sector ({camera_x},{camera_y}) - 128×96 display"
             if len(scale_text) < console.width:
                 info_x = (console.width - len(scale_text)) // 2
-                console.print(info_x, 1, scale_text, fg=(255, 255, 0))
+                self._print_text(console, info_x, 1, scale_text, (255, 255, 0))
 
             # Controls at bottom
             controls_text = "1=World 2=Region 3=Local | WASD=Move | Enter=Drill | I=Info"
             if len(controls_text) < console.width:
                 controls_x = (console.width - len(controls_text)) // 2
-                console.print(controls_x, console.height - 2, controls_text, fg=(120, 120, 120))
+                self._print_text(console, controls_x, console.height - 2, controls_text, (120, 120, 120))
         else:
             # Standard UI for regional/local views
+            world_x, world_y = self.camera_system.get_current_world_coordinates()
             scale_text = f"Scale: {current_scale.value.title()}"
             position_text = f"Pos: {camera_x},{camera_y}"
             world_pos_text = f"World: {world_x},{world_y}"
 
             info_x = max(0, console.width - 30)
-
-            if info_x < console.width:
-                console.print(info_x, self.render_start_y,
-                             scale_text, fg=(255, 255, 0))
-                console.print(info_x, self.render_start_y + 1,
-                             position_text, fg=(200, 200, 200))
-                console.print(info_x, self.render_start_y + 2,
-                             world_pos_text, fg=(150, 150, 150))
+            self._print_text(console, info_x, self.render_start_y,
+                             scale_text, (255, 255, 0))
+            self._print_text(console, info_x, self.render_start_y + 1,
+                             position_text, (200, 200, 200))
+            self._print_text(console, info_x, self.render_start_y + 2,
+                             world_pos_text, (150, 150, 150))
 
             # Controls reminder (bottom of rendering area)
             controls_y = self.render_end_y - 1
             controls_text = "1=World 2=Region 3=Local | WASD=Move | Enter=Drill"
             controls_x = max(0, (console.width - len(controls_text)) // 2)
-
-            if 0 <= controls_y < console.height and controls_x < console.width:
-                console.print(controls_x, controls_y, controls_text, fg=(120, 120, 120))
+            self._print_text(console, controls_x, controls_y, controls_text, (120, 120, 120))
     
+    def _print_text(self, console: tcod.console.Console, x: int, y: int,
+                    text: str, fg: Tuple[int, int, int]) -> None:
+        """
+        Write a single-line label straight into the console buffers.
+
+        Equivalent to ``console.print(x, y, text, fg=fg)``: the label is
+        clipped to the console once, so callers need no bounds checks of
+        their own, and the background is left untouched.
+
+        Args:
+            console: tcod console to render to
+            x: Column of the first character
+            y: Row to write to
+            text: Label text
+            fg: Text color
+        """
+        if not 0 <= y < console.height:
+            return
+        codes = _encode_text(text)
+        skip = max(0, -x)
+        x_lo = x + skip
+        x_hi = min(console.width, x + codes.size)
+        if x_hi <= x_lo:
+            return
+        console.ch[y, x_lo:x_hi] = codes[skip:skip + x_hi - x_lo]
+        console.fg[y, x_lo:x_hi] = fg
+
     def get_render_bounds(self) -> Tuple[int, int, int, int]:
         """
         Get the current rendering bounds.
@@ -5,17 +5,21 @@ This module provides a chunk-based approach to world management, allowing
 for infinite world generation while maintaining reasonable memory usage.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
+from itertools import chain
 from typing import Dict, List, Optional, Set, Tuple, Union, TYPE_CHECKING
 
-from .terrain import TerrainType
+import numpy as np
+
+from .terrain import TERRAIN_BY_ID, TERRAIN_IDS, TerrainType
 
 if TYPE_CHECKING:
     from .environmental import EnvironmentalData
     from .layered import LayeredTerrainData
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkCoordinate:
     """Represents a chunk coordinate in the world."""
     
@@ -44,6 +48,9 @@ class Chunk:
     A chunk is a square section of the world with a fixed size,
     containing terrain information for efficient loading and rendering.
     """
+
+    __slots__ = ('coordinate', 'size', 'terrain_data', 'environmental_data',
+                 'organic_data', 'layered_data', 'is_generated')
     
     def __init__(self, coordinate: ChunkCoordinate, size: int):
         """
@@ -55,12 +62,12 @@ class Chunk:
         """
         self.coordinate = coordinate
         self.size = size
-        self.terrain_data: List[List[TerrainType]] = []
+        # Terrain ids (see TERRAIN_BY_ID) indexed [y, x]; empty until generated
+        self.terrain_data: np.ndarray = np.empty((0, 0), dtype=np.int8)
         self.environmental_data: List[List["EnvironmentalData"]] = []
         self.organic_data: List[List] = []  # Will store OrganicTerrainData
         self.layered_data: List[List["LayeredTerrainData"]] = []  # 3D layered terrain data
         self.is_generated = False
-        self.last_accessed = 0  # For LRU cache management
     
     def set_terrain_data(self, terrain_data: List[List[TerrainType]]) -> None:
         """
@@ -69,10 +76,12 @@ class Chunk:
         Args:
             terrain_data: 2D list of TerrainType values
         """
-        if len(terrain_data) != self.size or len(terrain_data[0]) != self.size:
+        if len(terrain_data) != self.size or any(len(row) != self.size for row in terrain_data):
             raise ValueError(f"Terrain data must be {self.size}x{self.size}")
         
-        self.terrain_data = terrain_data
+        ids = np.fromiter(map(TERRAIN_IDS.__getitem__, chain.from_iterable(terrain_data)),
+                          dtype=np.int8, count=self.size * self.size)
+        self.terrain_data = ids.reshape(self.size, self.size)
         self.is_generated = True
     
     def get_terrain_at(self, local_x: int, local_y: int) -> TerrainType:
@@ -92,7 +101,7 @@ class Chunk:
         if not (0 <= local_x < self.size and 0 <= local_y < self.size):
             raise ValueError(f"Coordinates ({local_x}, {local_y}) out of chunk bounds")
         
-        return self.terrain_data[local_y][local_x]
+        return TERRAIN_BY_ID[int(self.terrain_data[local_y, local_x])]
 
     def set_environmental_data(self, environmental_data: List[List["EnvironmentalData"]]) -> None:
         """
@@ -213,7 +222,9 @@ class ChunkManager:
     Manages chunk loading, unloading, and caching for efficient world management.
     
     This class implements an LRU cache for chunks and handles the loading
-    and unloading of chunks based on camera position.
+    and unloading of chunks based on camera position. Chunks are kept in an
+    OrderedDict from least to most recently used, so every cache operation
+    is O(1).
     """
     
     def __init__(self, chunk_size: int = 32, cache_size: int = 64):
@@ -226,9 +237,9 @@ class ChunkManager:
         """
         self.chunk_size = chunk_size
         self.cache_size = cache_size
-        self._chunks: Dict[ChunkCoordinate, Chunk] = {}
-        self._access_order: List[ChunkCoordinate] = []
-        self._access_counter = 0
+        self._chunks: OrderedDict[ChunkCoordinate, Chunk] = OrderedDict()
+        # (dx, dy) offsets of the square around a center, per radius
+        self._radius_offsets: Dict[int, Tuple[Tuple[int, int], ...]] = {}
     
     def world_to_chunk_coordinate(self, world_x: int, world_y: int) -> ChunkCoordinate:
         """
@@ -241,12 +252,8 @@ class ChunkManager:
         Returns:
             ChunkCoordinate containing the world position
         """
-        # Use floor division to handle negative coordinates correctly
-        import math
-        chunk_x = math.floor(world_x / self.chunk_size)
-        chunk_y = math.floor(world_y / self.chunk_size)
-        
-        return ChunkCoordinate(chunk_x, chunk_y)
+        # Integer floor division rounds toward -inf, so negative coordinates map correctly
+        return ChunkCoordinate(world_x // self.chunk_size, world_y // self.chunk_size)
     
     def get_chunk(self, coordinate: ChunkCoordinate) -> Optional[Chunk]:
         """
@@ -258,10 +265,10 @@ class ChunkManager:
         Returns:
             Chunk if it exists in cache, None otherwise
         """
-        if coordinate in self._chunks:
-            self._update_access(coordinate)
-            return self._chunks[coordinate]
-        return None
+        chunk = self._chunks.get(coordinate)
+        if chunk is not None:
+            self._chunks.move_to_end(coordinate)
+        return chunk
     
     def add_chunk(self, chunk: Chunk) -> None:
         """
@@ -275,18 +282,15 @@ class ChunkManager:
         # If chunk already exists, update it
         if coordinate in self._chunks:
             self._chunks[coordinate] = chunk
-            self._update_access(coordinate)
+            self._chunks.move_to_end(coordinate)
             return
         
         # If cache is full, evict least recently used chunk
         if len(self._chunks) >= self.cache_size:
             self._evict_lru_chunk()
         
-        # Add the new chunk
+        # Add the new chunk as the most recently used
         self._chunks[coordinate] = chunk
-        self._access_order.append(coordinate)
-        chunk.last_accessed = self._access_counter
-        self._access_counter += 1
     
     def remove_chunk(self, coordinate: ChunkCoordinate) -> bool:
         """
@@ -298,12 +302,7 @@ class ChunkManager:
         Returns:
             True if chunk was removed, False if it wasn't in cache
         """
-        if coordinate in self._chunks:
-            del self._chunks[coordinate]
-            if coordinate in self._access_order:
-                self._access_order.remove(coordinate)
-            return True
-        return False
+        return self._chunks.pop(coordinate, None) is not None
     
     def get_chunks_in_radius(self, center: ChunkCoordinate, radius: int) -> Set[ChunkCoordinate]:
         """
@@ -316,12 +315,15 @@ class ChunkManager:
         Returns:
             Set of ChunkCoordinate objects within the radius
         """
-        chunks = set()
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                chunk_coord = ChunkCoordinate(center.x + dx, center.y + dy)
-                chunks.add(chunk_coord)
-        return chunks
+        offsets = self._radius_offsets.get(radius)
+        if offsets is None:
+            offsets = tuple(
+                (dx, dy) for dx in range(-radius, radius + 1) for dy in range(-radius, radius + 1)
+            )
+            self._radius_offsets[radius] = offsets
+
+        center_x, center_y = center.x, center.y
+        return {ChunkCoordinate(center_x + dx, center_y + dy) for dx, dy in offsets}
     
     def get_loaded_chunks(self) -> Set[ChunkCoordinate]:
         """
@@ -345,30 +347,7 @@ class ChunkManager:
             'cache_usage': len(self._chunks) / self.cache_size
         }
     
-    def _update_access(self, coordinate: ChunkCoordinate) -> None:
-        """Update the access time for a chunk."""
-        if coordinate in self._chunks:
-            self._chunks[coordinate].last_accessed = self._access_counter
-            self._access_counter += 1
-            
-            # Move to end of access order
-            if coordinate in self._access_order:
-                self._access_order.remove(coordinate)
-            self._access_order.append(coordinate)
-    
     def _evict_lru_chunk(self) -> None:
         """Evict the least recently used chunk from the cache."""
-        if not self._access_order:
-            return
-        
-        # Find the least recently used chunk
-        lru_coordinate = self._access_order[0]
-        lru_time = self._chunks[lru_coordinate].last_accessed
-        
-        for coordinate in self._access_order:
-            if self._chunks[coordinate].last_accessed < lru_time:
-                lru_coordinate = coordinate
-                lru_time = self._chunks[coordinate].last_accessed
-        
-        # Remove the LRU chunk
-        self.remove_chunk(lru_coordinate)
+        if self._chunks:
+            self._chunks.popitem(last=False)
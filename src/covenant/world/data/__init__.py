@@ -5,8 +5,15 @@ This package contains the data structures and configuration systems
 for the three-tier world generation system.
 """
 
-from .scale_types import ViewScale, WorldLayer, ScaleConfig, get_scale_config
-from .world_data import WorldSectorData, WorldMapData, WORLD_TERRAIN_TYPES
+from .scale_types import (
+    ViewScale, WorldLayer, ScaleConfig, get_scale_config,
+    SECTOR_SIZE_TILES, BLOCK_SIZE_TILES, CHUNK_SIZE_TILES,
+    SECTOR_SHIFT, BLOCK_SHIFT, CHUNK_SHIFT, SECTOR_MASK
+)
+from .world_data import (
+    WorldSectorData, WorldMapData, WORLD_TERRAIN_TYPES, WORLD_TERRAIN_NAMES, WORLD_TERRAIN_IDS,
+    WORLD_TERRAIN_CHAR_LUT, WORLD_TERRAIN_FG_LUT, WORLD_TERRAIN_BG_LUT
+)
 from .config import WorldConfig, get_world_config
 
 __all__ = [
@@ -14,9 +21,21 @@ __all__ = [
     'WorldLayer', 
     'ScaleConfig',
     'get_scale_config',
+    'SECTOR_SIZE_TILES',
+    'BLOCK_SIZE_TILES',
+    'CHUNK_SIZE_TILES',
+    'SECTOR_SHIFT',
+    'BLOCK_SHIFT',
+    'CHUNK_SHIFT',
+    'SECTOR_MASK',
     'WorldSectorData',
     'WorldMapData',
     'WORLD_TERRAIN_TYPES',
+    'WORLD_TERRAIN_NAMES',
+    'WORLD_TERRAIN_IDS',
+    'WORLD_TERRAIN_CHAR_LUT',
+    'WORLD_TERRAIN_FG_LUT',
+    'WORLD_TERRAIN_BG_LUT',
     'WorldConfig',
     'get_world_config'
 ]
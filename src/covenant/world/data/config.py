@@ -8,19 +8,41 @@ default values for world generation parameters including seeds.
 import os
 import random
 import time
-from typing import Optional, Dict, Any
+import tomllib
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Tuple
 
-# Try to import toml, fall back to basic config if not available
-try:
-    import toml
-    HAS_TOML = True
-except ImportError:
-    HAS_TOML = False
-    print("Warning: toml module not found. Using basic configuration fallback.")
+
+# Cache settings used when world.toml has no [cache] table
+_DEFAULT_CACHE_SETTINGS: Dict[str, Any] = {
+    "world_lifetime": 300.0,
+    "regional_lifetime": 60.0,
+    "local_lifetime": 10.0,
+    "max_world_maps": 1,
+    "max_regional_maps": 4,
+    "max_local_chunks": 64
+}
+
+
+# Shared read-only stand-in for missing TOML tables (never returned to callers)
+_EMPTY: Dict[str, Any] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class _ResolvedConfig:
+    """Configuration values resolved once from the loaded files."""
+    seed: int
+    size: Tuple[int, int]
+    noise: Dict[str, Any]
+    environmental_mapping: Dict[str, Any]
+    development: bool
+    cache: Dict[str, Any]
 
 
 class WorldConfig:
     """Configuration manager for world generation system."""
+
+    __slots__ = ('config_dir', '_config_cache', '_resolved')
     
     def __init__(self, config_dir: str = "config"):
         """
@@ -30,32 +52,85 @@ class WorldConfig:
             config_dir: Directory containing configuration files
         """
         self.config_dir = config_dir
-        self._config_cache: Dict[str, Any] = {}
-        self._load_configs()
+        # Parsed files by name, filled on first access ({} if missing or unreadable)
+        self._config_cache: Dict[str, Dict[str, Any]] = {}
+        # Values returned by the getters, resolved on first use
+        self._resolved: Optional[_ResolvedConfig] = None
     
-    def _load_configs(self) -> None:
-        """Load all configuration files from config directory."""
-        if not HAS_TOML:
-            # Use basic fallback configuration
-            print("Using basic configuration fallback (no TOML support)")
-            return
-
-        config_files = [
-            "environmental.toml",
-            "visual.toml",
-            "world.toml"  # New config file for world generation
-        ]
-
-        for config_file in config_files:
-            config_path = os.path.join(self.config_dir, config_file)
-            if os.path.exists(config_path):
-                try:
-                    with open(config_path, 'r') as f:
-                        config_data = toml.load(f)
-                        self._config_cache[config_file] = config_data
-                except Exception as e:
-                    print(f"Warning: Could not load {config_file}: {e}")
+    def _get_config(self, config_file: str) -> Dict[str, Any]:
+        """
+        Get a parsed configuration file, loading it on first access.
+        
+        Args:
+            config_file: File name inside the config directory
+            
+        Returns:
+            Parsed configuration, or an empty dict if it is unavailable
+        """
+        config_data = self._config_cache.get(config_file)
+        if config_data is not None:
+            return config_data
+
+        config_data = {}
+        config_path = os.path.join(self.config_dir, config_file)
+        try:
+            with open(config_path, 'rb') as f:
+                config_data = tomllib.load(f)
+        except FileNotFoundError:
+            pass  # Missing files just use defaults
+        except Exception as e:
+            print(f"Warning: Could not load {config_file}: {e}")
+        self._config_cache[config_file] = config_data
+        return config_data
     
+    def _resolve(self) -> "_ResolvedConfig":
+        """
+        Get the settings the getters return, resolving them on first use.
+        
+        Returns:
+            Resolved configuration values
+        """
+        resolved = self._resolved
+        if resolved is not None:
+            return resolved
+
+        world_config = self._get_config("world.toml")
+        env_config = self._get_config("environmental.toml")
+        world_section = world_config.get("world", _EMPTY)
+        env_development = env_config.get("development", _EMPTY)
+
+        # World seed, then dev seed in environmental config, then a time-based seed
+        if "seed" in world_section:
+            seed = world_section["seed"]
+        elif "seed" in env_development:
+            seed = env_development["seed"]
+        else:
+            seed = int(time.time() * 1000) % (2**31 - 1)
+
+        # Default world size - 8×6 sectors for better aspect ratio
+        size = world_section.get("size")
+        if isinstance(size, list) and len(size) == 2:
+            size = (int(size[0]), int(size[1]))
+        else:
+            size = (8, 6)
+
+        # world.toml decides development mode, environmental config is the fallback
+        if "development" in world_config:
+            development = world_config["development"].get("enabled", False)
+        else:
+            development = env_development.get("enabled", False)
+
+        resolved = _ResolvedConfig(
+            seed=seed,
+            size=size,
+            noise=env_config.get("noise", {}),
+            environmental_mapping=env_config.get("environmental_mapping", {}),
+            development=development,
+            cache=dict(world_config.get("cache", _DEFAULT_CACHE_SETTINGS)),
+        )
+        self._resolved = resolved
+        return resolved
+
     def get_world_seed(self) -> int:
         """
         Get world generation seed from config or generate random one.
@@ -63,18 +138,7 @@ class WorldConfig:
         Returns:
             Seed value for world generation
         """
-        # Check if world.toml exists and has a seed
-        world_config = self._config_cache.get("world.toml", {})
-        if "world" in world_config and "seed" in world_config["world"]:
-            return world_config["world"]["seed"]
-        
-        # Check for dev seed in environmental config
-        env_config = self._config_cache.get("environmental.toml", {})
-        if "development" in env_config and "seed" in env_config["development"]:
-            return env_config["development"]["seed"]
-        
-        # Generate random seed based on current time
-        return int(time.time() * 1000) % (2**31 - 1)
+        return self._resolve().seed
     
     def get_world_size(self) -> tuple[int, int]:
         """
@@ -83,14 +147,7 @@ class WorldConfig:
         Returns:
             Tuple of (width, height) in sectors
         """
-        world_config = self._config_cache.get("world.toml", {})
-        if "world" in world_config and "size" in world_config["world"]:
-            size = world_config["world"]["size"]
-            if isinstance(size, list) and len(size) == 2:
-                return tuple(size)
-        
-        # Default world size - 8×6 sectors for better aspect ratio
-        return (8, 6)
+        return self._resolve().size
     
     def get_noise_config(self) -> Dict[str, Any]:
         """
@@ -99,8 +156,7 @@ class WorldConfig:
         Returns:
             Dictionary of noise configuration parameters
         """
-        env_config = self._config_cache.get("environmental.toml", {})
-        return env_config.get("noise", {})
+        return self._resolve().noise
     
     def get_environmental_mapping(self) -> Dict[str, Any]:
         """
@@ -109,8 +165,7 @@ class WorldConfig:
         Returns:
             Dictionary of environmental mapping rules
         """
-        env_config = self._config_cache.get("environmental.toml", {})
-        return env_config.get("environmental_mapping", {})
+        return self._resolve().environmental_mapping
     
     def is_development_mode(self) -> bool:
         """
@@ -119,16 +174,7 @@ class WorldConfig:
         Returns:
             True if development mode is enabled
         """
-        world_config = self._config_cache.get("world.toml", {})
-        if "development" in world_config:
-            return world_config["development"].get("enabled", False)
-        
-        # Check environmental config as fallback
-        env_config = self._config_cache.get("environmental.toml", {})
-        if "development" in env_config:
-            return env_config["development"].get("enabled", False)
-        
-        return False
+        return self._resolve().development
     
     def get_cache_settings(self) -> Dict[str, Any]:
         """
@@ -137,46 +183,11 @@ class WorldConfig:
         Returns:
             Dictionary of cache settings
         """
-        world_config = self._config_cache.get("world.toml", {})
-        return world_config.get("cache", {
-            "world_lifetime": 300.0,
-            "regional_lifetime": 60.0,
-            "local_lifetime": 10.0,
-            "max_world_maps": 1,
-            "max_regional_maps": 4,
-            "max_local_chunks": 64
-        })
-
+        return self._resolve().cache
 
-# Global configuration instance
-_global_config: Optional[WorldConfig] = None
 
-
-def get_world_config() -> WorldConfig:
-    """
-    Get the global world configuration instance.
-    
-    Returns:
-        WorldConfig instance
-    """
-    global _global_config
-    if _global_config is None:
-        _global_config = WorldConfig()
-    return _global_config
-
-
-def create_world_config_file() -> None:
-    """Create a default world.toml configuration file if it doesn't exist."""
-    if not HAS_TOML:
-        print("Skipping config file creation (no TOML support)")
-        return
-
-    config_path = os.path.join("config", "world.toml")
-
-    if not os.path.exists(config_path):
-        os.makedirs("config", exist_ok=True)
-        
-        default_config = """# World Generation Configuration
+# Contents of the default world.toml written by create_world_config_file
+_DEFAULT_WORLD_TOML = b"""# World Generation Configuration
 
 [world]
 # World seed for reproducible generation (comment out for random)
@@ -210,18 +221,34 @@ enable_multithreading = false
 chunk_generation_batch_size = 4
 background_generation = true
 """
+
+
+# Global configuration instance
+_global_config: Optional[WorldConfig] = None
+
+
+def get_world_config() -> WorldConfig:
+    """
+    Get the global world configuration instance.
+    
+    Returns:
+        WorldConfig instance
+    """
+    global _global_config
+    if _global_config is None:
+        _global_config = WorldConfig()
+    return _global_config
+
+
+def create_world_config_file() -> None:
+    """Create a default world.toml configuration file if it doesn't exist."""
+    config_path = os.path.join("config", "world.toml")
+
+    if not os.path.exists(config_path):
+        if not os.path.isdir("config"):
+            os.makedirs("config", exist_ok=True)
         
-        with open(config_path, 'w') as f:
-            f.write(default_config)
+        with open(config_path, 'wb') as f:
+            f.write(_DEFAULT_WORLD_TOML)
         
         print(f"Created default world configuration at {config_path}")
-
-
-# Initialize config file on import if in development
-if __name__ != "__main__":
-    try:
-        config = get_world_config()
-        if config.is_development_mode():
-            create_world_config_file()
-    except Exception:
-        pass  # Ignore errors during import
@@ -24,7 +24,7 @@ class WorldLayer(Enum):
     MOUNTAINS = 2
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScaleConfig:
     """Configuration for each viewing scale."""
     name: str
@@ -49,6 +49,24 @@ DEFAULT_SCALE_CONFIGS = {
     ViewScale.LOCAL: ScaleConfig("Local", 32, (32, 32), 10.0)
 }
 
+# World tiles per unit of each scale, precomputed for the coordinate conversions
+SECTOR_SIZE_TILES = DEFAULT_SCALE_CONFIGS[ViewScale.WORLD].pixels_per_unit      # 16,384
+BLOCK_SIZE_TILES = DEFAULT_SCALE_CONFIGS[ViewScale.REGIONAL].pixels_per_unit    # 1,024
+CHUNK_SIZE_TILES = DEFAULT_SCALE_CONFIGS[ViewScale.LOCAL].pixels_per_unit       # 32
+
+# The tile sizes are powers of two, so integer conversions can shift and mask
+# (floor semantics for negative coordinates match // and %)
+SECTOR_SHIFT = SECTOR_SIZE_TILES.bit_length() - 1    # 14
+BLOCK_SHIFT = BLOCK_SIZE_TILES.bit_length() - 1      # 10
+CHUNK_SHIFT = CHUNK_SIZE_TILES.bit_length() - 1      # 5
+SECTOR_MASK = SECTOR_SIZE_TILES - 1
+
+# log2 of the tiles per unit of each scale, for the scale <-> world conversions
+_SHIFT_PER_UNIT = {
+    scale: config.pixels_per_unit.bit_length() - 1
+    for scale, config in DEFAULT_SCALE_CONFIGS.items()
+}
+
 
 def get_scale_config(scale: ViewScale) -> ScaleConfig:
     """
@@ -66,34 +84,36 @@ def get_scale_config(scale: ViewScale) -> ScaleConfig:
 def get_world_coordinates_for_scale(scale: ViewScale, x: int, y: int) -> Tuple[int, int]:
     """
     Convert scale-specific coordinates to world tile coordinates.
+
+    Works element-wise on integer NumPy arrays as well, converting a whole
+    batch of coordinates in one call.
     
     Args:
         scale: The viewing scale
-        x: X coordinate in scale units
-        y: Y coordinate in scale units
+        x: X coordinate(s) in scale units
+        y: Y coordinate(s) in scale units
         
     Returns:
         Tuple of (world_x, world_y) in tile coordinates
     """
-    config = get_scale_config(scale)
-    world_x = x * config.pixels_per_unit
-    world_y = y * config.pixels_per_unit
-    return world_x, world_y
+    shift = _SHIFT_PER_UNIT[scale]
+    return x << shift, y << shift
 
 
 def get_scale_coordinates_from_world(scale: ViewScale, world_x: int, world_y: int) -> Tuple[int, int]:
     """
     Convert world tile coordinates to scale-specific coordinates.
+
+    Works element-wise on integer NumPy arrays as well, converting a whole
+    batch of coordinates in one call.
     
     Args:
         scale: The viewing scale
-        world_x: World X coordinate in tiles
-        world_y: World Y coordinate in tiles
+        world_x: World X coordinate(s) in tiles
+        world_y: World Y coordinate(s) in tiles
         
     Returns:
         Tuple of (scale_x, scale_y) in scale units
     """
-    config = get_scale_config(scale)
-    scale_x = world_x // config.pixels_per_unit
-    scale_y = world_y // config.pixels_per_unit
-    return scale_x, scale_y
+    shift = _SHIFT_PER_UNIT[scale]
+    return world_x >> shift, world_y >> shift
@@ -7,7 +7,9 @@ like continents, oceans, mountain ranges, and climate zones.
 
 import time
 from dataclasses import dataclass, field
-from typing import Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional, cast
+
+import numpy as np
 
 
 @dataclass
@@ -34,6 +36,11 @@ class WorldSectorData:
     # Metadata
     generation_time: float = field(default_factory=time.time)  # When this was generated
     parent_seed: int = 0  # World seed used
+
+    # Display codepoint and colors ready for console buffer writes (derived)
+    display_char_code: int = field(init=False, repr=False, compare=False)
+    display_fg_array: np.ndarray = field(init=False, repr=False, compare=False)
+    display_bg_array: np.ndarray = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate data after initialization."""
@@ -48,6 +55,10 @@ class WorldSectorData:
                 0 <= self.display_bg_color[2] <= 255):
             raise ValueError("Display background color values must be 0-255")
 
+        self.display_char_code = ord(self.display_char)
+        self.display_fg_array = np.array(self.display_color, dtype=np.uint8)
+        self.display_bg_array = np.array(self.display_bg_color, dtype=np.uint8)
+
 
 @dataclass
 class WorldMapData:
@@ -58,6 +69,11 @@ class WorldMapData:
     generation_complete: bool = False
     generation_start_time: float = field(default_factory=time.time)
     generation_end_time: Optional[float] = None
+
+    # Dense [y, x] mirrors of ``sectors`` kept in sync by set_sector (derived):
+    # the sector objects (None where missing) and their WORLD_TERRAIN_IDS (-1)
+    sector_grid: np.ndarray = field(init=False, repr=False, compare=False)
+    terrain_ids: np.ndarray = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate world map data after initialization."""
@@ -69,6 +85,11 @@ class WorldMapData:
         for (sector_x, sector_y) in self.sectors.keys():
             if not (0 <= sector_x < max_x and 0 <= sector_y < max_y):
                 raise ValueError(f"Sector ({sector_x}, {sector_y}) is outside world bounds")
+
+        self.sector_grid = np.full((max_y, max_x), None, dtype=object)
+        self.terrain_ids = np.full((max_y, max_x), -1, dtype=np.int16)
+        for sector_data in self.sectors.values():
+            self._store_dense(sector_data)
     
     def get_sector(self, sector_x: int, sector_y: int) -> Optional[WorldSectorData]:
         """
@@ -81,6 +102,10 @@ class WorldMapData:
         Returns:
             WorldSectorData if exists, None otherwise
         """
+        max_x, max_y = self.world_size_sectors
+        if 0 <= sector_x < max_x and 0 <= sector_y < max_y:
+            sector: Optional[WorldSectorData] = self.sector_grid[sector_y, sector_x]
+            return sector
         return self.sectors.get((sector_x, sector_y))
     
     def set_sector(self, sector_data: WorldSectorData) -> None:
@@ -92,6 +117,17 @@ class WorldMapData:
         """
         key = (sector_data.sector_x, sector_data.sector_y)
         self.sectors[key] = sector_data
+        self._store_dense(sector_data)
+
+    def _store_dense(self, sector_data: WorldSectorData) -> None:
+        """Mirror an in-bounds sector into the dense sector and terrain id grids."""
+        max_x, max_y = self.world_size_sectors
+        if not (0 <= sector_data.sector_x < max_x and 0 <= sector_data.sector_y < max_y):
+            return
+        self.sector_grid[sector_data.sector_y, sector_data.sector_x] = sector_data
+        self.terrain_ids[sector_data.sector_y, sector_data.sector_x] = WORLD_TERRAIN_IDS.get(
+            sector_data.dominant_terrain, -1
+        )
     
     def is_complete(self) -> bool:
         """
@@ -179,6 +215,20 @@ WORLD_TERRAIN_TYPES = {
 }
 
 
+# Display lookup tables indexed by world terrain id (position in WORLD_TERRAIN_TYPES)
+WORLD_TERRAIN_NAMES: Tuple[str, ...] = tuple(WORLD_TERRAIN_TYPES)
+WORLD_TERRAIN_IDS: Dict[str, int] = {name: index for index, name in enumerate(WORLD_TERRAIN_NAMES)}
+WORLD_TERRAIN_CHAR_LUT = np.array(
+    [ord(cast(str, props["char"])) for props in WORLD_TERRAIN_TYPES.values()], dtype=np.int32
+)
+WORLD_TERRAIN_FG_LUT = np.array(
+    [props["fg"] for props in WORLD_TERRAIN_TYPES.values()], dtype=np.uint8
+)
+WORLD_TERRAIN_BG_LUT = np.array(
+    [props["bg"] for props in WORLD_TERRAIN_TYPES.values()], dtype=np.uint8
+)
+
+
 def get_terrain_type_for_elevation(elevation: float, climate_zone: str = "temperate") -> str:
     """
     Determine terrain type based on elevation and climate.
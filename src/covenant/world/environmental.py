@@ -10,6 +10,8 @@ import math
 from dataclasses import dataclass
 from typing import List, Optional
 
+import numpy as np
+
 from .environmental_config import EnvironmentalConfig, create_default_environmental_config
 from .noise import NoiseConfig, NoiseGenerator
 
@@ -119,6 +121,35 @@ class EnvironmentalGenerator:
             temperature=temperature
         )
     
+    def generate_elevation_grid(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Generate elevations for arrays of world coordinates at once.
+        
+        Matches the elevation of generate_environmental_data() for each point
+        (up to floating point rounding), without computing moisture and
+        temperature.
+        
+        Args:
+            x: World X coordinates
+            y: World Y coordinates
+            
+        Returns:
+            Array of elevations in meters between -200 and 3000
+        """
+        normalized = (self.elevation_noise.generate_grid(x, y) + 1.0) / 2.0
+        
+        # Same piecewise curve as _normalize_elevation
+        low = np.power(np.clip(normalized, 0.0, 0.3) / 0.3, 1.5) * 0.3
+        middle = (normalized - 0.3) / 0.3
+        high = np.power(np.clip((normalized - 0.6) / 0.4, 0.0, None), 0.7)
+        elevation_meters = np.where(
+            normalized < 0.3,
+            -200 + low * 200,
+            np.where(normalized < 0.6, middle * 800, 800 + high * 2200),
+        )
+        
+        return np.clip(elevation_meters, -200, 3000)
+    
     def _normalize_elevation(self, raw_elevation: float) -> float:
         """
         Convert raw elevation noise to meters with proper distribution.
@@ -15,7 +15,7 @@ from .camera_3d import CameraSystem, create_default_camera_3d
 from .noise import NoiseGenerator, create_terrain_noise_generator
 from .organic import OrganicWorldGenerator, OrganicTerrainData, create_organic_world_generator
 from .terrain import (
-    TerrainMapper, TerrainType, EnvironmentalTerrainMapper, TerrainProperties,
+    TERRAIN_BY_ID, TerrainMapper, TerrainType, EnvironmentalTerrainMapper, TerrainProperties,
     create_default_terrain_mapper, create_environmental_terrain_mapper
 )
 from .animals import AnimalManager, AnimalType
@@ -495,10 +495,11 @@ class WorldGenerator:
                         world_y = chunk_coord.y * self.chunk_size + y
                         suitable_locations.append((world_x, world_y))
 
-        elif chunk.terrain_data:
+        elif chunk.is_generated:
+            terrain_ids = chunk.terrain_data.tolist()
             for y in range(self.chunk_size):
                 for x in range(self.chunk_size):
-                    terrain_type = chunk.terrain_data[y][x]
+                    terrain_type = TERRAIN_BY_ID[terrain_ids[y][x]]
                     if self._is_suitable_for_animals(terrain_type):
                         world_x = chunk_coord.x * self.chunk_size + x
                         world_y = chunk_coord.y * self.chunk_size + y
@@ -672,7 +673,8 @@ class WorldGenerator:
                             world_x = chunk_coord.x * self.chunk_size + x
                             world_y = chunk_coord.y * self.chunk_size + y
                             terrain_data[(world_x, world_y)] = chunk.organic_data[y][x]
-                elif chunk.terrain_data:
+                elif chunk.is_generated:
+                    terrain_ids = chunk.terrain_data.tolist()
                     for y in range(self.chunk_size):
                         for x in range(self.chunk_size):
                             world_x = chunk_coord.x * self.chunk_size + x
@@ -681,7 +683,7 @@ class WorldGenerator:
                             class SimpleTerrain:
                                 def __init__(self, terrain_type):
                                     self.terrain_type = terrain_type
-                            terrain_data[(world_x, world_y)] = SimpleTerrain(chunk.terrain_data[y][x])
+                            terrain_data[(world_x, world_y)] = SimpleTerrain(TERRAIN_BY_ID[terrain_ids[y][x]])
 
         # Update animals with terrain data and camera position for culling
         if self._current_camera_chunk:
@@ -755,7 +757,8 @@ class WorldGenerator:
                             world_x = chunk_coord.x * self.chunk_size + x
                             world_y = chunk_coord.y * self.chunk_size + y
                             terrain_data[(world_x, world_y)] = chunk.organic_data[y][x]
-                elif chunk.terrain_data:
+                elif chunk.is_generated:
+                    terrain_ids = chunk.terrain_data.tolist()
                     for y in range(self.chunk_size):
                         for x in range(self.chunk_size):
                             world_x = chunk_coord.x * self.chunk_size + x
@@ -764,7 +767,7 @@ class WorldGenerator:
                             class SimpleTerrain:
                                 def __init__(self, terrain_type):
                                     self.terrain_type = terrain_type
-                            terrain_data[(world_x, world_y)] = SimpleTerrain(chunk.terrain_data[y][x])
+                            terrain_data[(world_x, world_y)] = SimpleTerrain(TERRAIN_BY_ID[terrain_ids[y][x]])
 
         # Get camera position for culling
         if self._current_camera_chunk:
@@ -8,12 +8,17 @@ regional terrain features like hills, valleys, forests, and local climate variat
 import time
 from typing import Dict, Tuple, Optional
 
+import numpy as np
+
 from ..data.world_data import WorldSectorData
-from ..data.scale_types import ViewScale
+from ..data.scale_types import ViewScale, BLOCK_SIZE_TILES, SECTOR_SHIFT, BLOCK_SHIFT, SECTOR_MASK
 from ..data.config import get_world_config
 from .base_generator import HierarchicalNoiseGenerator
 from .world_scale import WorldScaleGenerator
 
+# Offset from a block's first tile to its center tile
+_BLOCK_CENTER_OFFSET = BLOCK_SIZE_TILES // 2
+
 
 class RegionalBlockData:
     """Data for a single regional block (1024×1024 tiles)."""
@@ -56,6 +61,9 @@ class RegionalMapData:
         self.generation_complete = False
         self.generation_start_time = time.time()
         self.generation_end_time: Optional[float] = None
+
+        # Display arrays built by to_arrays(), dropped whenever a block changes
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
     
     def get_block(self, block_x: int, block_y: int) -> Optional[RegionalBlockData]:
         """Get block data for specific coordinates."""
@@ -65,6 +73,34 @@ class RegionalMapData:
         """Set block data for specific coordinates."""
         key = (block_data.block_x, block_data.block_y)
         self.blocks[key] = block_data
+        self._arrays = None
+
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the map's display codepoints and colors as arrays indexed [y, x].
+
+        Missing blocks are shown as a red "?". The arrays are built once and
+        shared between calls, so callers must not modify them.
+
+        Returns:
+            Tuple of (ch, fg, bg) arrays of shape (height, width) and (height, width, 3)
+        """
+        if self._arrays is None:
+            width, height = self.regional_size_blocks
+            ch = np.full((height, width), ord("?"), dtype=np.int32)
+            fg = np.empty((height, width, 3), dtype=np.uint8)
+            bg = np.empty((height, width, 3), dtype=np.uint8)
+            fg[:] = (255, 0, 0)
+            bg[:] = (100, 0, 0)
+
+            for (block_x, block_y), block_data in self.blocks.items():
+                if 0 <= block_x < width and 0 <= block_y < height:
+                    ch[block_y, block_x] = ord(block_data.display_char)
+                    fg[block_y, block_x] = block_data.display_color
+                    bg[block_y, block_x] = block_data.display_bg_color
+
+            self._arrays = ch, fg, bg
+        return self._arrays
     
     def is_complete(self) -> bool:
         """Check if regional generation is complete."""
@@ -98,7 +134,6 @@ class RegionalScaleGenerator:
         
         # Regional configuration
         self.blocks_per_sector = 32  # 32×32 blocks per sector
-        self.block_size_tiles = 1024  # Each block = 1024×1024 tiles
         
         # Generation cache
         self.regional_maps: Dict[Tuple[int, int], RegionalMapData] = {}
@@ -114,6 +149,11 @@ class RegionalScaleGenerator:
             "barren": {"char": "·", "fg": (160, 140, 100), "bg": (120, 100, 70)},
             "water": {"char": "~", "fg": (60, 120, 200), "bg": (30, 80, 150)}
         }
+
+    @property
+    def block_size_tiles(self) -> int:
+        """Tiles per block side (1,024); read-only, all conversions use BLOCK_SHIFT."""
+        return BLOCK_SIZE_TILES
     
     def generate_regional_map(self, sector_x: int, sector_y: int) -> RegionalMapData:
         """
@@ -175,13 +215,8 @@ class RegionalScaleGenerator:
             RegionalBlockData for the specified block
         """
         # Calculate world coordinates for block center
-        sector_offset_x = sector_x * self.world_generator.sector_size_tiles
-        sector_offset_y = sector_y * self.world_generator.sector_size_tiles
-        block_offset_x = block_x * self.block_size_tiles
-        block_offset_y = block_y * self.block_size_tiles
-        
-        center_world_x = sector_offset_x + block_offset_x + (self.block_size_tiles // 2)
-        center_world_y = sector_offset_y + block_offset_y + (self.block_size_tiles // 2)
+        center_world_x = (sector_x << SECTOR_SHIFT) + (block_x << BLOCK_SHIFT) + _BLOCK_CENTER_OFFSET
+        center_world_y = (sector_y << SECTOR_SHIFT) + (block_y << BLOCK_SHIFT) + _BLOCK_CENTER_OFFSET
         
         # Sample regional noise
         regional_elevation = self.noise.regional_noise(center_world_x, center_world_y)
@@ -309,14 +344,12 @@ class RegionalScaleGenerator:
             RegionalBlockData if available, None otherwise
         """
         # Calculate sector coordinates
-        sector_x = world_x // self.world_generator.sector_size_tiles
-        sector_y = world_y // self.world_generator.sector_size_tiles
+        sector_x = world_x >> SECTOR_SHIFT
+        sector_y = world_y >> SECTOR_SHIFT
         
         # Calculate block coordinates within sector
-        sector_offset_x = world_x % self.world_generator.sector_size_tiles
-        sector_offset_y = world_y % self.world_generator.sector_size_tiles
-        block_x = sector_offset_x // self.block_size_tiles
-        block_y = sector_offset_y // self.block_size_tiles
+        block_x = (world_x & SECTOR_MASK) >> BLOCK_SHIFT
+        block_y = (world_y & SECTOR_MASK) >> BLOCK_SHIFT
         
         # Get regional map
         regional_map = self.regional_maps.get((sector_x, sector_y))
@@ -9,11 +9,15 @@ import time
 from typing import Dict, Tuple, Optional
 
 from ..data.world_data import WorldSectorData, WorldMapData, WORLD_TERRAIN_TYPES, get_terrain_type_for_elevation
-from ..data.scale_types import ViewScale
+from ..data.scale_types import ViewScale, SECTOR_SIZE_TILES, SECTOR_SHIFT
 from ..data.config import get_world_config
 from .base_generator import HierarchicalNoiseGenerator
 
 
+# Offset from a sector's first tile to its center tile
+_SECTOR_CENTER_OFFSET = SECTOR_SIZE_TILES // 2
+
+
 class WorldScaleGenerator:
     """Generates continental-scale world features."""
     
@@ -34,15 +38,19 @@ class WorldScaleGenerator:
         
         # World configuration
         self.world_size_sectors = config.get_world_size()
-        self.sector_size_tiles = 16384  # Each sector = 16,384×16,384 tiles
         
         # Generation cache
         self.world_map_data: Optional[WorldMapData] = None
         
         # Climate configuration
-        self.equator_y = self.world_size_sectors[1] * self.sector_size_tiles // 2
+        self.equator_y = self.world_size_sectors[1] * SECTOR_SIZE_TILES // 2
         self.polar_threshold = 0.7  # Distance from equator for polar climate
         self.tropical_threshold = 0.3  # Distance from equator for tropical climate
+
+    @property
+    def sector_size_tiles(self) -> int:
+        """Tiles per sector side (16,384); read-only, all conversions use SECTOR_SHIFT."""
+        return SECTOR_SIZE_TILES
     
     def generate_complete_world_map(self) -> WorldMapData:
         """
@@ -101,8 +109,8 @@ class WorldScaleGenerator:
             WorldSectorData for the specified sector
         """
         # Calculate world coordinates for sector center
-        center_world_x = sector_x * self.sector_size_tiles + (self.sector_size_tiles // 2)
-        center_world_y = sector_y * self.sector_size_tiles + (self.sector_size_tiles // 2)
+        center_world_x = (sector_x << SECTOR_SHIFT) + _SECTOR_CENTER_OFFSET
+        center_world_y = (sector_y << SECTOR_SHIFT) + _SECTOR_CENTER_OFFSET
         
         # Sample continental features using multiple noise layers
         continental = self.noise.continental_noise(center_world_x, center_world_y)
@@ -119,7 +127,7 @@ class WorldScaleGenerator:
         total_elevation = base_elevation + tectonic_elevation
         
         # Determine climate zone based on latitude
-        latitude_factor = abs(center_world_y - self.equator_y) / (self.world_size_sectors[1] * self.sector_size_tiles // 2)
+        latitude_factor = abs(center_world_y - self.equator_y) / (self.world_size_sectors[1] * SECTOR_SIZE_TILES // 2)
         
         if latitude_factor > self.polar_threshold:
             climate_zone = "polar"
@@ -176,8 +184,8 @@ class WorldScaleGenerator:
         Returns:
             WorldSectorData if available, None otherwise
         """
-        sector_x = world_x // self.sector_size_tiles
-        sector_y = world_y // self.sector_size_tiles
+        sector_x = world_x >> SECTOR_SHIFT
+        sector_y = world_y >> SECTOR_SHIFT
         
         if self.world_map_data:
             return self.world_map_data.get_sector(sector_x, sector_y)
@@ -8,7 +8,13 @@ for generating smooth, natural-looking terrain patterns.
 import math
 import random
 from dataclasses import dataclass
-from typing import List
+from typing import List, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+# Scalar or element-wise array input, shared by the scalar and grid samplers
+_Value = TypeVar("_Value", float, npt.NDArray[np.float64])
 
 
 @dataclass
@@ -58,20 +64,24 @@ class NoiseGenerator:
             (1, 1), (-1, 1), (1, -1), (-1, -1),
             (1, 0), (-1, 0), (0, 1), (0, -1)
         ]
+
+        # Array copies of the tables for vectorized sampling
+        self._permutation_array = np.array(self._permutation, dtype=np.intp)
+        self._gradient_array = np.array(self._gradients, dtype=np.float64)
     
-    def _fade(self, t: float) -> float:
+    def _fade(self, t: _Value) -> _Value:
         """
         Fade function for smooth interpolation.
         
         Args:
-            t: Input value between 0 and 1
+            t: Input value(s) between 0 and 1
             
         Returns:
             Smoothed value using 6t^5 - 15t^4 + 10t^3
         """
         return t * t * t * (t * (t * 6 - 15) + 10)
     
-    def _lerp(self, a: float, b: float, t: float) -> float:
+    def _lerp(self, a: _Value, b: _Value, t: _Value) -> _Value:
         """
         Linear interpolation between two values.
         
@@ -170,6 +180,75 @@ class NoiseGenerator:
         # Normalize to [-1, 1] range
         return total / max_value
     
+    def generate_grid(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Generate multi-octave Perlin noise for arrays of coordinates at once.
+        
+        Produces the same values as calling generate() for each point.
+        
+        Args:
+            x: X coordinates in world space (any shape)
+            y: Y coordinates in world space (broadcastable with x)
+            
+        Returns:
+            Array of noise values between -1 and 1
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        total = np.zeros(np.broadcast_shapes(x.shape, y.shape))
+        frequency = self.config.frequency
+        amplitude = self.config.amplitude
+        max_value = 0.0
+        
+        for _ in range(self.config.octaves):
+            total += self._noise_2d_grid(x * frequency, y * frequency) * amplitude
+            max_value += amplitude
+            
+            amplitude *= self.config.persistence
+            frequency *= self.config.lacunarity
+        
+        # Normalize to [-1, 1] range
+        return total / max_value
+    
+    def _noise_2d_grid(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of _noise_2d over arrays of coordinates.
+        
+        Args:
+            x: X coordinates
+            y: Y coordinates
+            
+        Returns:
+            Array of noise values between -1 and 1
+        """
+        perm = self._permutation_array
+        gradients = self._gradient_array
+        
+        # Unit squares containing the points and the relative positions within
+        floor_x = np.floor(x)
+        floor_y = np.floor(y)
+        xi = floor_x.astype(np.intp) & 255
+        yi = floor_y.astype(np.intp) & 255
+        xf = x - floor_x
+        yf = y - floor_y
+        
+        u = self._fade(xf)
+        v = self._fade(yf)
+        
+        # Hash coordinates of square corners
+        aa = perm[perm[xi] + yi]
+        ab = perm[perm[xi] + yi + 1]
+        ba = perm[perm[xi + 1] + yi]
+        bb = perm[perm[xi + 1] + yi + 1]
+        
+        def gradient(hash_val, gx, gy):
+            grad = gradients[hash_val & 7]
+            return grad[..., 0] * gx + grad[..., 1] * gy
+        
+        x1 = self._lerp(gradient(aa, xf, yf), gradient(ba, xf - 1, yf), u)
+        x2 = self._lerp(gradient(ab, xf, yf - 1), gradient(bb, xf - 1, yf - 1), u)
+        return self._lerp(x1, x2, v)
+    
     def generate_chunk(self, chunk_x: int, chunk_y: int, chunk_size: int) -> List[List[float]]:
         """
         Generate noise values for an entire chunk.
@@ -12,6 +12,11 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+
+from ._kernels import (
+    HAS_NUMBA, fill_climate_samples, fill_octave_noise, fill_river_mask, fill_water_proximity
+)
 from .terrain import TerrainType
 
 
@@ -107,6 +112,8 @@ class OrganicNoiseGenerator:
         self.permutation = list(range(256))
         random.shuffle(self.permutation)
         self.permutation *= 2
+        # Array copy of the table for the compiled chunk kernels
+        self.permutation_array = np.array(self.permutation, dtype=np.int64)
     
     def fade(self, t: float) -> float:
         """Fade function for smooth interpolation."""
@@ -187,6 +194,10 @@ class OrganicWorldGenerator:
         self.water_scale = 0.003       # Water body scale
         self.transition_scale = 0.005  # Biome transition smoothing
         self.river_scale = 0.0002      # River network scale
+
+        # Compile the chunk kernels now rather than on the first chunk
+        if HAS_NUMBA:
+            self.generate_chunk_data(0, 0, 1)
     
     def generate_chunk_data(self, chunk_x: int, chunk_y: int, chunk_size: int) -> Dict[Tuple[int, int], OrganicTerrainData]:
         """Generate organic terrain data for a chunk with large-scale features."""
@@ -243,6 +254,9 @@ class OrganicWorldGenerator:
 
     def _generate_large_scale_biome_map(self, world_x: int, world_y: int, size: int) -> List[List[Dict]]:
         """Generate large-scale biome influences that span multiple chunks."""
+        if HAS_NUMBA:
+            return self._generate_large_scale_biome_map_compiled(world_x, world_y, size)
+
         biome_map = []
 
         for y in range(size):
@@ -283,6 +297,30 @@ class OrganicWorldGenerator:
 
         return biome_map
 
+    def _generate_large_scale_biome_map_compiled(self, world_x: int, world_y: int, size: int) -> List[List[Dict]]:
+        """Compiled-kernel version of _generate_large_scale_biome_map with identical output."""
+        temp_samples = np.empty((size, size, 9))
+        moisture_samples = np.empty((size, size, 9))
+        fill_climate_samples(
+            temp_samples, moisture_samples,
+            self.noise_temperature.permutation_array, self.noise_moisture.permutation_array,
+            world_x, world_y, self.biome_scale
+        )
+
+        determine_biome = self._determine_primary_biome
+        biome_map = []
+        for temp_row, moisture_row in zip(temp_samples.tolist(), moisture_samples.tolist()):
+            row = []
+            for temps, moistures in zip(temp_row, moisture_row):
+                # Sample 0 is the cell itself, samples 1-8 its transition neighbors
+                neighbors = [determine_biome(t, m) for t, m in zip(temps[1:], moistures[1:])]
+                row.append(self._weigh_biome_transitions(
+                    determine_biome(temps[0], moistures[0]), temps[0], moistures[0], neighbors
+                ))
+            biome_map.append(row)
+
+        return biome_map
+
     def _determine_primary_biome(self, temperature: float, moisture: float) -> TerrainType:
         """Determine the primary biome based on temperature and moisture."""
         # Logical biome progression based on climate
@@ -338,6 +376,11 @@ class OrganicWorldGenerator:
                 neighbor_biome = self._determine_primary_biome(neighbor_temp, neighbor_moisture)
                 neighbors.append(neighbor_biome)
 
+        return self._weigh_biome_transitions(primary_biome, temp, moisture, neighbors)
+
+    def _weigh_biome_transitions(self, primary_biome: TerrainType, temp: float, moisture: float,
+                                 neighbors: List[TerrainType]) -> Dict:
+        """Weigh the primary biome against the biomes of its sampled neighbors."""
         # Calculate transition weights
         biome_weights = {primary_biome: 0.7}  # Primary biome has strongest influence
 
@@ -356,6 +399,14 @@ class OrganicWorldGenerator:
 
     def _generate_river_system(self, world_x: int, world_y: int, size: int) -> List[List[bool]]:
         """Generate river system independent of terrain."""
+        if HAS_NUMBA:
+            river_mask = np.empty((size, size), dtype=np.bool_)
+            fill_river_mask(
+                river_mask, self.noise_water.permutation_array, self.noise_detail.permutation_array,
+                world_x, world_y, self.river_scale
+            )
+            return river_mask.tolist()
+
         river_map = [[False for _ in range(size)] for _ in range(size)]
 
         for y in range(size):
@@ -392,23 +443,35 @@ class OrganicWorldGenerator:
 
         return river_map
 
+    def _octave_noise_grid(self, noise: OrganicNoiseGenerator, world_x: int, world_y: int, size: int,
+                           scale: float, octaves: int, persistence: float) -> List[List[float]]:
+        """Sample octave noise (lacunarity 2) over a chunk grid, indexed [y][x]."""
+        if HAS_NUMBA:
+            grid = np.empty((size, size))
+            fill_octave_noise(grid, noise.permutation_array, world_x, world_y, scale, octaves, persistence, 2.0)
+            return grid.tolist()
+
+        return [
+            [
+                noise.octave_noise(
+                    (world_x + x) * scale, (world_y + y) * scale,
+                    octaves=octaves, persistence=persistence, lacunarity=2.0
+                )
+                for x in range(size)
+            ]
+            for y in range(size)
+        ]
+
     def _generate_elevation_map(self, world_x: int, world_y: int, size: int) -> List[List[float]]:
         """Generate elevation in meters using multi-octave noise."""
+        noise_map = self._octave_noise_grid(
+            self.noise_elevation, world_x, world_y, size, self.continent_scale, octaves=5, persistence=0.6
+        )
         elevation_map = []
 
-        for y in range(size):
+        for noise_row in noise_map:
             row = []
-            for x in range(size):
-                world_pos_x = (world_x + x) * self.continent_scale
-                world_pos_y = (world_y + y) * self.continent_scale
-
-                elevation = self.noise_elevation.octave_noise(
-                    world_pos_x, world_pos_y,
-                    octaves=5,
-                    persistence=0.6,
-                    lacunarity=2.0
-                )
-
+            for elevation in noise_row:
                 # Convert from [-1, 1] to [0, 1]
                 normalized = (elevation + 1) / 2
                 normalized = max(0.0, min(1.0, normalized))
@@ -435,21 +498,14 @@ class OrganicWorldGenerator:
     
     def _generate_moisture_map(self, world_x: int, world_y: int, size: int) -> List[List[float]]:
         """Generate moisture patterns."""
+        noise_map = self._octave_noise_grid(
+            self.noise_moisture, world_x, world_y, size, self.regional_scale, octaves=3, persistence=0.5
+        )
         moisture_map = []
         
-        for y in range(size):
+        for noise_row in noise_map:
             row = []
-            for x in range(size):
-                world_pos_x = (world_x + x) * self.regional_scale
-                world_pos_y = (world_y + y) * self.regional_scale
-                
-                moisture = self.noise_moisture.octave_noise(
-                    world_pos_x, world_pos_y,
-                    octaves=3,
-                    persistence=0.5,
-                    lacunarity=2.0
-                )
-                
+            for moisture in noise_row:
                 moisture = (moisture + 1) / 2
                 row.append(max(0, min(1, moisture)))
             moisture_map.append(row)
@@ -458,21 +514,15 @@ class OrganicWorldGenerator:
     
     def _generate_temperature_map(self, world_x: int, world_y: int, size: int) -> List[List[float]]:
         """Generate temperature in Celsius with latitude influence."""
+        noise_map = self._octave_noise_grid(
+            self.noise_temperature, world_x, world_y, size, self.regional_scale, octaves=3, persistence=0.4
+        )
         temperature_map = []
 
-        for y in range(size):
+        for y, noise_row in enumerate(noise_map):
             row = []
-            for x in range(size):
-                world_pos_x = (world_x + x) * self.regional_scale
-                world_pos_y = (world_y + y) * self.regional_scale
-
+            for temp_noise in noise_row:
                 # Base temperature from noise (-20°C to 40°C range)
-                temp_noise = self.noise_temperature.octave_noise(
-                    world_pos_x, world_pos_y,
-                    octaves=3,
-                    persistence=0.4,
-                    lacunarity=2.0
-                )
                 base_temperature = 10 + (temp_noise * 20)  # -10°C to 30°C base
 
                 # Latitude-based cooling (distance from equator)
@@ -490,18 +540,14 @@ class OrganicWorldGenerator:
         """Create natural water bodies and lakes."""
         water_mask = [[False for _ in range(size)] for _ in range(size)]
 
+        # Use water-specific noise for natural boundaries
+        noise_map = self._octave_noise_grid(
+            self.noise_water, world_x, world_y, size, self.water_scale, octaves=3, persistence=0.6
+        )
+
         for y in range(size):
             for x in range(size):
-                world_pos_x = (world_x + x) * self.water_scale
-                world_pos_y = (world_y + y) * self.water_scale
-
-                # Use water-specific noise for natural boundaries
-                water_noise = self.noise_water.octave_noise(
-                    world_pos_x, world_pos_y,
-                    octaves=3,
-                    persistence=0.6,
-                    lacunarity=2.0
-                )
+                water_noise = noise_map[y][x]
 
                 # Dynamic water threshold based on elevation and noise (now in meters)
                 base_elevation = elevation_map[y][x]
@@ -515,13 +561,22 @@ class OrganicWorldGenerator:
 
     def _modify_moisture_by_water(self, moisture_map: List[List[float]], water_mask: List[List[bool]], size: int) -> List[List[float]]:
         """Increase moisture near water bodies."""
+        proximity_map = None
+        if HAS_NUMBA:
+            proximity = np.empty((size, size))
+            fill_water_proximity(proximity, np.array(water_mask, dtype=np.bool_), 4)
+            proximity_map = proximity.tolist()
+
         for y in range(size):
             for x in range(size):
                 if water_mask[y][x]:
                     moisture_map[y][x] = 1.0
                 else:
                     # Increase moisture near water
-                    water_proximity = self._calculate_water_proximity(water_mask, x, y, size, radius=4)
+                    if proximity_map is not None:
+                        water_proximity = proximity_map[y][x]
+                    else:
+                        water_proximity = self._calculate_water_proximity(water_mask, x, y, size, radius=4)
                     moisture_map[y][x] = min(1.0, moisture_map[y][x] + water_proximity * 0.4)
 
         return moisture_map
@@ -8,7 +8,7 @@ and their visual and gameplay properties.
 import math
 from dataclasses import dataclass
 from enum import Enum
-from typing import Tuple, TYPE_CHECKING
+from typing import Dict, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .environmental import EnvironmentalData
@@ -57,6 +57,11 @@ class TerrainType(Enum):
     SNOW = "snow"
 
 
+# Small integer id per terrain type, for compact per-tile storage
+TERRAIN_BY_ID: Tuple[TerrainType, ...] = tuple(TerrainType)
+TERRAIN_IDS: Dict[TerrainType, int] = {terrain: i for i, terrain in enumerate(TERRAIN_BY_ID)}
+
+
 @dataclass
 class TerrainProperties:
     """Properties for a terrain type including visual and gameplay attributes."""
@@ -178,6 +178,32 @@ class TestCamera:
         assert max_x == expected_max_x
         assert max_y == expected_max_y
 
+    def test_override_restores_settings(self):
+        """Test that override applies values inside the block and restores them after."""
+        camera = Camera()
+
+        with camera.override(screen_width=200, screen_height=100,
+                             crosshair_x=100, crosshair_y=50):
+            assert camera.screen_width == 200
+            assert camera.screen_height == 100
+            assert camera.config.crosshair_x == 100
+            assert camera.config.crosshair_y == 50
+
+        assert camera.screen_width == 80
+        assert camera.screen_height == 50
+        assert camera.config.crosshair_x == 40
+        assert camera.config.crosshair_y == 25
+
+    def test_override_restores_on_error(self):
+        """Test that override restores settings even if the block raises."""
+        camera = Camera()
+
+        with pytest.raises(RuntimeError):
+            with camera.override(screen_width=200):
+                raise RuntimeError("render failed")
+
+        assert camera.screen_width == 80
+
 
 class TestViewport:
     """Test the Viewport class."""
@@ -7,7 +7,7 @@ camera synchronization, and the complete game loop integration.
 
 import pytest
 import time
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, patch
 
 from src.covenant.world.generators.world_scale import WorldScaleGenerator
 from src.covenant.world.generators.regional_scale import RegionalScaleGenerator
@@ -112,7 +112,7 @@ class TestCompleteSystemIntegration:
     
     def test_rendering_at_all_scales(self):
         """Test rendering functionality at all scales."""
-        mock_console = Mock()
+        mock_console = MagicMock()  # Supports the renderer's buffer slice writes
         mock_console.width = 80
         mock_console.height = 50
         
@@ -127,7 +127,7 @@ class TestCompleteSystemIntegration:
             self.renderer.render_current_scale(mock_console)
             
             # Console should have been used
-            assert mock_console.print.called
+            assert mock_console.ch.__setitem__.called
             mock_console.reset_mock()
     
     def test_regional_generation_integration(self):
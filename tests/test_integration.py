@@ -7,13 +7,13 @@ three-tier world generation system without requiring graphics.
 
 import pytest
 import time
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, patch
 
 from src.covenant.world.generators.world_scale import WorldScaleGenerator
 from src.covenant.world.camera.multi_scale_camera import MultiScaleCameraSystem
 from src.covenant.world.camera.viewport_renderer import MultiScaleViewportRenderer
 from src.covenant.world.data.scale_types import ViewScale
-from src.covenant.world.data.config import get_world_config
+from src.covenant.world.data.config import WorldConfig, create_world_config_file, get_world_config
 
 
 class TestSystemIntegration:
@@ -68,7 +68,7 @@ class TestSystemIntegration:
         world_map = self.world_generator.generate_complete_world_map()
         
         # Test rendering at different scales
-        mock_console = Mock()
+        mock_console = MagicMock()  # Supports the renderer's buffer slice writes
         mock_console.width = 80
         mock_console.height = 50
         
@@ -79,7 +79,7 @@ class TestSystemIntegration:
             self.renderer.render_current_scale(mock_console)
             
             # Verify console was used
-            assert mock_console.print.called
+            assert mock_console.ch.__setitem__.called
             mock_console.reset_mock()
     
     def test_world_info_generation(self):
@@ -222,6 +222,52 @@ class TestConfigurationSystem:
         # Should be consistent
         assert seed1 == seed2
 
+    def test_config_files_load_on_first_use(self, tmp_path):
+        """Test that config files are parsed and resolved once, on first use."""
+        (tmp_path / "world.toml").write_text("[world]\nseed = 777\nsize = [4, 3]\n")
+        config = WorldConfig(str(tmp_path))
+        assert config._config_cache == {}
+        assert config._resolved is None
+
+        assert config.get_world_seed() == 777
+        resolved = config._resolved
+        assert config.get_world_size() == (4, 3)
+        assert config.get_noise_config() == {}
+        assert config.get_cache_settings()["max_local_chunks"] == 64
+        assert config._resolved is resolved
+        assert not hasattr(config, "__dict__")
+
+    def test_create_world_config_file(self, tmp_path, monkeypatch):
+        """Test that the default world.toml is written once and parses back."""
+        monkeypatch.chdir(tmp_path)
+        create_world_config_file()
+
+        config = WorldConfig("config")
+        assert config.get_world_size() == (8, 6)
+        assert config.is_development_mode()
+
+        (tmp_path / "config" / "world.toml").write_text("[world]\nsize = [2, 2]\n")
+        create_world_config_file()
+        assert WorldConfig("config").get_world_size() == (2, 2)
+
+    def test_world_size_parsed_once(self, tmp_path):
+        """Test that the configured world size is parsed into an int tuple."""
+        (tmp_path / "world.toml").write_text("[world]\nsize = [12.0, 9]\n")
+        size = WorldConfig(str(tmp_path)).get_world_size()
+        assert size == (12, 9)
+        assert all(type(value) is int for value in size)
+
+        (tmp_path / "world.toml").write_text("[world]\nsize = [1, 2, 3]\n")
+        assert WorldConfig(str(tmp_path)).get_world_size() == (8, 6)
+
+    def test_default_cache_settings_not_shared(self, tmp_path):
+        """Test that mutating one config's default cache settings does not leak into another."""
+        first = WorldConfig(str(tmp_path))
+        first.get_cache_settings()["max_local_chunks"] = 1
+
+        second = WorldConfig(str(tmp_path))
+        assert second.get_cache_settings()["max_local_chunks"] == 64
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -86,6 +86,39 @@ class TestRegionalMapData:
         assert retrieved_block == block_data
         assert regional_map.get_block(0, 0) is None  # Non-existent block
     
+    def test_display_arrays(self):
+        """Test display arrays mark missing blocks and follow block updates."""
+        regional_map = RegionalMapData(0, 0, 12345)
+
+        from src.covenant.world.data.world_data import WorldSectorData
+        sector_data = WorldSectorData(
+            sector_x=0, sector_y=0,
+            dominant_terrain="temperate_land",
+            average_elevation=500.0,
+            climate_zone="temperate",
+            display_char=".",
+            display_color=(100, 150, 100),
+            display_bg_color=(50, 75, 50),
+            has_major_mountain_range=False,
+            has_major_river_system=True,
+            continental_plate_id=0
+        )
+
+        ch, fg, bg = regional_map.to_arrays()
+        assert ch.shape == (32, 32)
+        assert chr(ch[15, 10]) == "?"
+        assert tuple(fg[15, 10]) == (255, 0, 0)
+
+        block_data = RegionalBlockData(10, 15, sector_data)
+        block_data.display_char = "♠"
+        block_data.display_bg_color = (0, 60, 0)
+        regional_map.set_block(block_data)
+
+        ch, fg, bg = regional_map.to_arrays()
+        assert chr(ch[15, 10]) == "♠"
+        assert tuple(bg[15, 10]) == (0, 60, 0)
+        assert chr(ch[10, 15]) == "?"
+
     def test_completion_tracking(self):
         """Test completion tracking."""
         regional_map = RegionalMapData(0, 0, 12345)
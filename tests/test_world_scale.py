@@ -9,8 +9,11 @@ import pytest
 import time
 from src.covenant.world.generators.world_scale import WorldScaleGenerator
 from src.covenant.world.generators.base_generator import HierarchicalNoiseGenerator
-from src.covenant.world.data.world_data import WorldSectorData, WorldMapData
-from src.covenant.world.data.scale_types import ViewScale, get_scale_config
+from src.covenant.world.data.world_data import (
+    WorldSectorData, WorldMapData, WORLD_TERRAIN_TYPES, WORLD_TERRAIN_IDS,
+    WORLD_TERRAIN_CHAR_LUT, WORLD_TERRAIN_FG_LUT, WORLD_TERRAIN_BG_LUT
+)
+from src.covenant.world.data.scale_types import ViewScale, ScaleConfig, get_scale_config
 
 
 class TestHierarchicalNoiseGenerator:
@@ -131,6 +134,35 @@ class TestWorldScaleGenerator:
                 assert isinstance(sector.has_major_river_system, bool)
                 assert isinstance(sector.continental_plate_id, int)
     
+    def test_sector_display_arrays(self):
+        """Test that sectors carry their display codepoint and colors as arrays."""
+        generator = WorldScaleGenerator(seed=12345)
+        sector = generator.generate_world_sector(3, 2)
+
+        assert sector.display_char_code == ord(sector.display_char)
+        assert tuple(sector.display_fg_array) == tuple(sector.display_color)
+        assert tuple(sector.display_bg_array) == tuple(sector.display_bg_color)
+
+        # The display lookup tables agree with the terrain registry
+        terrain_id = WORLD_TERRAIN_IDS[sector.dominant_terrain]
+        props = WORLD_TERRAIN_TYPES[sector.dominant_terrain]
+        assert WORLD_TERRAIN_CHAR_LUT[terrain_id] == ord(props["char"])
+        assert tuple(WORLD_TERRAIN_FG_LUT[terrain_id]) == props["fg"]
+        assert tuple(WORLD_TERRAIN_BG_LUT[terrain_id]) == props["bg"]
+    
+    def test_dense_sector_grids(self):
+        """Test that the dense sector grids mirror the sector dictionary."""
+        generator = WorldScaleGenerator(seed=12345)
+        world_map = generator.generate_complete_world_map()
+
+        width, height = world_map.world_size_sectors
+        assert world_map.sector_grid.shape == (height, width)
+        for (sector_x, sector_y), sector in world_map.sectors.items():
+            assert world_map.get_sector(sector_x, sector_y) is sector
+            assert world_map.terrain_ids[sector_y, sector_x] == WORLD_TERRAIN_IDS[sector.dominant_terrain]
+        assert world_map.get_sector(-1, 0) is None
+        assert world_map.get_sector(width, 0) is None
+    
     def test_world_coordinates_lookup(self):
         """Test looking up sectors by world coordinates."""
         generator = WorldScaleGenerator(seed=12345)
@@ -207,6 +239,18 @@ class TestScaleTypes:
         assert local_config.pixels_per_unit == 32
         assert local_config.map_size == (32, 32)
     
+    def test_scale_config_is_immutable(self):
+        """Test that shared scale configurations cannot be modified."""
+        import dataclasses
+
+        config = get_scale_config(ViewScale.REGIONAL)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.pixels_per_unit = 1
+        assert not hasattr(config, "__dict__")
+
+        with pytest.raises(ValueError):
+            ScaleConfig("Bad", 0, (1, 1), 1.0)
+    
     def test_coordinate_conversion(self):
         """Test coordinate conversion utilities."""
         from src.covenant.world.data.scale_types import (
@@ -232,6 +276,54 @@ class TestScaleTypes:
         assert scale_x == 2
         assert scale_y == 3
 
+    def test_coordinate_conversion_batches(self):
+        """Test that coordinate conversion works element-wise on NumPy arrays."""
+        import numpy as np
+        from src.covenant.world.data.scale_types import (
+            get_world_coordinates_for_scale,
+            get_scale_coordinates_from_world
+        )
+
+        world_xs = np.array([-1, 0, 1023, 1024, 40000], dtype=np.int64)
+        world_ys = world_xs[::-1]
+        scale_xs, scale_ys = get_scale_coordinates_from_world(ViewScale.REGIONAL, world_xs, world_ys)
+        for world_x, world_y, scale_x, scale_y in zip(world_xs, world_ys, scale_xs, scale_ys):
+            assert (scale_x, scale_y) == get_scale_coordinates_from_world(
+                ViewScale.REGIONAL, int(world_x), int(world_y))
+
+        back_xs, _ = get_world_coordinates_for_scale(ViewScale.REGIONAL, scale_xs, scale_ys)
+        assert back_xs.tolist() == [-1024, 0, 0, 1024, 39936]
+
+    def test_tile_size_constants(self):
+        """Test that the precomputed tile sizes match the scale configurations."""
+        from src.covenant.world.data.scale_types import (
+            SECTOR_SIZE_TILES, BLOCK_SIZE_TILES, CHUNK_SIZE_TILES
+        )
+
+        assert SECTOR_SIZE_TILES == get_scale_config(ViewScale.WORLD).pixels_per_unit
+        assert BLOCK_SIZE_TILES == get_scale_config(ViewScale.REGIONAL).pixels_per_unit
+        assert CHUNK_SIZE_TILES == get_scale_config(ViewScale.LOCAL).pixels_per_unit
+        generator = WorldScaleGenerator(seed=12345)
+        assert generator.sector_size_tiles == SECTOR_SIZE_TILES
+        with pytest.raises(AttributeError):
+            generator.sector_size_tiles = 1024
+
+    def test_shift_conversions_match_division(self):
+        """Test that the shift/mask constants agree with floor division and modulo."""
+        from src.covenant.world.data.scale_types import (
+            SECTOR_SIZE_TILES, BLOCK_SIZE_TILES, SECTOR_SHIFT, BLOCK_SHIFT, SECTOR_MASK
+        )
+
+        assert 1 << SECTOR_SHIFT == SECTOR_SIZE_TILES
+        assert 1 << BLOCK_SHIFT == BLOCK_SIZE_TILES
+        for scale in ViewScale:
+            pixels_per_unit = get_scale_config(scale).pixels_per_unit
+            assert pixels_per_unit & (pixels_per_unit - 1) == 0
+        for world_x in (-20000, -1, 0, 1023, 1024, 16383, 16384, 50000):
+            assert world_x >> SECTOR_SHIFT == world_x // SECTOR_SIZE_TILES
+            assert ((world_x & SECTOR_MASK) >> BLOCK_SHIFT ==
+                    world_x % SECTOR_SIZE_TILES // BLOCK_SIZE_TILES)
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
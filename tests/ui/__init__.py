@@ -0,0 +1 @@
+"""Tests for UI components."""
@@ -0,0 +1,73 @@
+"""
+Tests for the instructions panel.
+"""
+
+import tcod
+
+from src.covenant.ui.instructions_panel import InstructionsPanel
+
+
+class TestInstructionsPanel:
+    """Test the InstructionsPanel class."""
+
+    def test_render_draws_rounded_border(self):
+        """Test that the panel border is drawn at the bottom of the console."""
+        console = tcod.console.Console(40, 20)
+        panel = InstructionsPanel()
+
+        panel.render(console)
+
+        top, bottom = 20 - panel.height - 1, 20 - 2
+        left, right = 2, 40 - 3
+        assert chr(console.ch[top, left]) == "╭"
+        assert chr(console.ch[top, right]) == "╮"
+        assert chr(console.ch[bottom, left]) == "╰"
+        assert chr(console.ch[bottom, right]) == "╯"
+        assert chr(console.ch[top, left + 1]) == "─"
+        assert chr(console.ch[top + 1, left]) == "│"
+        assert tuple(console.fg[top, left]) == (120, 120, 120)
+        assert tuple(console.bg[top + 1, left + 1]) == (60, 60, 60)
+
+    def test_render_writes_instruction_text(self):
+        """Test that the instruction lines are written inside the border."""
+        console = tcod.console.Console(80, 20)
+        panel = InstructionsPanel()
+
+        panel.render(console)
+
+        content_y = 20 - panel.height
+        line = "".join(chr(c) for c in console.ch[content_y, 4:45])
+        assert line == "⌘ CMD+K or CTRL+K to open command palette"
+        assert tuple(console.fg[content_y, 4]) == (255, 255, 255)
+        assert tuple(console.fg[content_y + 1, 4]) == (150, 200, 255)
+        assert tuple(console.bg[content_y + 2, 4]) == (60, 60, 60)
+
+    def test_render_leaves_margins_untouched(self):
+        """Test that cells outside the panel keep their previous contents."""
+        console = tcod.console.Console(40, 20)
+        panel = InstructionsPanel()
+
+        panel.render(console)
+
+        assert chr(console.ch[19, 10]) == " "
+        assert tuple(console.bg[19, 10]) == (0, 0, 0)
+        assert tuple(console.bg[13, 1]) == (0, 0, 0)
+
+    def test_hidden_panel_renders_nothing(self):
+        """Test that a hidden panel does not touch the console."""
+        console = tcod.console.Console(40, 20)
+        panel = InstructionsPanel()
+        panel.toggle_visibility()
+
+        panel.render(console)
+
+        assert (console.ch == ord(" ")).all()
+
+    def test_render_on_tiny_console(self):
+        """Test that a console too small for the panel is left alone."""
+        console = tcod.console.Console(4, 4)
+        panel = InstructionsPanel()
+
+        panel.render(console)
+
+        assert (console.ch == ord(" ")).all()
@@ -0,0 +1,241 @@
+"""
+Tests for the zoomed map overview renderer.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import tcod
+
+from src.covenant.ui.zoomed_map import ChunkSummary, TerrainId, ZoomedMapRenderer
+
+
+def make_summary(terrain=TerrainId.GRASSLAND, has_water=False, has_resources=False, population_level=0):
+    """Build a chunk summary with a fixed color."""
+    return ChunkSummary(
+        terrain_id=terrain,
+        average_elevation=0.5,
+        has_water=has_water,
+        has_resources=has_resources,
+        population_level=population_level,
+        char=".",
+        color=(50, 120, 50),
+    )
+
+
+class TestChunkBlockRendering:
+    """Test rendering of single 4x4 chunk blocks."""
+
+    def setup_method(self):
+        """Create a renderer without a world generator backend."""
+        self.renderer = ZoomedMapRenderer(SimpleNamespace(), 80, 50)
+
+    def teardown_method(self):
+        """Stop the background worker."""
+        self.renderer.cleanup()
+
+    def test_block_fills_pattern(self):
+        """Test that a land block is filled with its character and varied colors."""
+        console = tcod.console.Console(80, 50)
+
+        self.renderer._render_chunk_block(console, make_summary(), 2, 3)
+
+        block = console.ch[12:16, 8:12]
+        assert (block == ord(".")).all()
+        assert tuple(console.fg[12, 8]) == (45, 115, 45)   # (dx + dy) % 3 == 0
+        assert tuple(console.fg[12, 9]) == (50, 120, 50)   # (dx + dy) % 3 == 1
+        assert tuple(console.fg[12, 10]) == (55, 125, 55)  # (dx + dy) % 3 == 2
+        assert tuple(console.bg[12, 8]) == (7, 22, 7)
+
+    def test_water_block_alternates_characters(self):
+        """Test that water blocks use alternating wave characters."""
+        console = tcod.console.Console(80, 50)
+
+        self.renderer._render_chunk_block(console, make_summary(TerrainId.WATER, has_water=True, has_resources=True), 0, 0)
+
+        assert chr(console.ch[0, 0]) == "~"
+        assert chr(console.ch[0, 1]) == "≈"
+        assert chr(console.ch[1, 1]) == "~"  # No resource marker on water
+
+    def test_block_center_markers(self):
+        """Test the resource and population markers in the block center."""
+        console = tcod.console.Console(80, 50)
+
+        self.renderer._render_chunk_block(console, make_summary(has_resources=True), 0, 0)
+        self.renderer._render_chunk_block(console, make_summary(population_level=3), 1, 0)
+        self.renderer._render_chunk_block(console, make_summary(population_level=1), 2, 0)
+
+        assert chr(console.ch[1, 1]) == "●"
+        assert chr(console.ch[1, 5]) == "■"
+        assert chr(console.ch[1, 9]) == "□"
+
+    def test_block_clipped_at_console_edge(self):
+        """Test that blocks overlapping the console edge are clipped."""
+        renderer = ZoomedMapRenderer(SimpleNamespace(), 82, 50)
+        console = tcod.console.Console(82, 50)
+
+        renderer._render_chunk_block(console, make_summary(), 20, 0)
+        renderer._render_chunk_block(console, make_summary(), 21, 0)
+        renderer.cleanup()
+
+        assert (console.ch[0:4, 80:82] == ord(".")).all()
+
+    def test_overview_fills_resized_console(self):
+        """Test that the overview renderer is rebuilt for a new console size."""
+        world_generator = SimpleNamespace(chunk_manager=SimpleNamespace(chunk_size=32))
+        renderer = ZoomedMapRenderer(world_generator, 80, 50)
+        renderer.update_console_size(90, 30)
+        console = tcod.console.Console(90, 30)
+
+        renderer._render_fn(console, 0, 0, 0.0)
+        renderer.cleanup()
+
+        assert (console.ch[:, 88:90] == ord(".")).all()
+        assert (console.ch[28:30, :] == ord(".")).all()
+
+
+class TestSummaryCache:
+    """Test the open-addressed chunk summary table."""
+
+    def setup_method(self):
+        """Create a renderer whose summaries fall back to plain grassland."""
+        world_generator = SimpleNamespace(chunk_manager=SimpleNamespace(chunk_size=32))
+        self.renderer = ZoomedMapRenderer(world_generator, 80, 50)
+
+    def teardown_method(self):
+        """Stop the background worker."""
+        self.renderer.cleanup()
+
+    def test_summary_round_trip(self):
+        """Test that a generated summary is cached and read back intact."""
+        summary = self.renderer.get_or_generate_chunk_summary(-3, 7)
+
+        assert summary.terrain_id == TerrainId.GRASSLAND
+        assert summary.char == "."
+        assert self.renderer._find_slot(-3, 7) >= 0
+        assert self.renderer.get_or_generate_chunk_summary(-3, 7) == summary
+
+    def test_colliding_chunks_get_separate_slots(self):
+        """Test that chunks sharing a home slot are linearly probed."""
+        first = self.renderer._get_or_generate_slot(1, 2, 0.0)
+        second = self.renderer._get_or_generate_slot(1 + 256, 2 - 512, 0.0)
+
+        assert first != second
+        assert self.renderer._find_slot(1, 2) == first
+        assert self.renderer._find_slot(1 + 256, 2 - 512) == second
+
+    def test_batch_lookup_respects_ttl(self):
+        """Test that batch lookups report stale and missing chunks as -1."""
+        slot = self.renderer._get_or_generate_slot(5, 5, 0.0)
+        chunk_x, chunk_y = np.array([5, 6]), np.array([5, 5])
+
+        assert self.renderer._lookup_slots(chunk_x, chunk_y).tolist() == [slot, -1]
+        assert self.renderer._lookup_slots(chunk_x, chunk_y, 1.0).tolist() == [slot, -1]
+        assert self.renderer._lookup_slots(chunk_x, chunk_y, 1000.0).tolist() == [-1, -1]
+
+    def test_background_results_stored_by_main_thread(self):
+        """Test that chunks sampled by the worker land in the table once drained."""
+        self.renderer._queue_background_generation(40, -40, 1, 1)
+        queued = self.renderer._ring_head
+        rows = self.renderer._done_queue.get(timeout=5)
+        self.renderer._done_queue.put(rows)
+
+        # Queued chunks are reserved, but stay misses for rendering until drained
+        assert queued > 0
+        assert self.renderer._lookup_slots(np.array([40]), np.array([-40]))[0] >= 0
+        assert self.renderer._lookup_slots(np.array([40]), np.array([-40]), 0.0)[0] < 0
+        self.renderer._queue_background_generation(40, -40, 1, 1)
+        assert self.renderer._ring_head == queued
+
+        self.renderer._drain_background_results(0.0)
+
+        assert self.renderer._lookup_slots(np.array([40]), np.array([-40]), 0.0)[0] >= 0
+        assert self.renderer.get_or_generate_chunk_summary(-2, -42, 0.0).terrain_id == TerrainId.GRASSLAND
+
+    def test_broken_generator_falls_back_at_setup(self):
+        """Test that samplers are bound once, skipping generators that fail to sample."""
+        def broken_grid(x, y):
+            raise RuntimeError("no grid support")
+
+        world_generator = SimpleNamespace(
+            chunk_manager=SimpleNamespace(chunk_size=32),
+            noise_generator=SimpleNamespace(generate_grid=broken_grid),
+        )
+        renderer = ZoomedMapRenderer(world_generator, 80, 50)
+        renderer.cleanup()
+
+        assert renderer._sample_terrain == renderer._sample_terrain_const
+        assert renderer._sample_resources == renderer._sample_resources_none
+        assert renderer.create_fast_chunk_summary(3, 4).terrain_id == TerrainId.GRASSLAND
+
+    def test_unchanged_region_is_not_requeued(self):
+        """Test that queueing returns early while the view region stays the same."""
+        self.renderer._queue_background_generation(0, 0, 4, 4)
+        self.renderer._lookup_slots = None  # Any further table scan would fail
+
+        self.renderer._queue_background_generation(0, 0, 4, 4)
+
+
+class TestOverviewCharacters:
+    """Test the per-cell characters of the character-based overview."""
+
+    def setup_method(self):
+        """Create a renderer without a world generator backend."""
+        self.renderer = ZoomedMapRenderer(SimpleNamespace(), 80, 50)
+
+    def teardown_method(self):
+        """Stop the background worker."""
+        self.renderer.cleanup()
+
+    def test_terrain_variation_cycles(self):
+        """Test that varied terrains cycle their characters along diagonals."""
+        summary = make_summary(TerrainId.FOREST)
+
+        chars = [self.renderer.get_overview_char(summary, dx, 0) for dx in range(4)]
+
+        assert chars == ["♠", "♣", "T", "♠"]
+        assert self.renderer.get_overview_char(summary, 1, 1) == "T"
+
+    def test_unvaried_terrain_uses_summary_char(self):
+        """Test that terrains without variations keep the summary's character."""
+        summary = make_summary(TerrainId.SAND)
+
+        assert self.renderer.get_overview_char(summary, 2, 3) == "."
+
+    def test_chunk_overview_matches_cell_colors(self):
+        """Test that the block renderer draws the per-cell characters and colors."""
+        console = tcod.console.Console(80, 50)
+        summary = make_summary(TerrainId.HILLS)
+
+        self.renderer.render_chunk_overview(console, summary, 3, 2)
+
+        for dy in range(4):
+            for dx in range(4):
+                y, x = 8 + dy, 12 + dx
+                assert chr(console.ch[y, x]) == self.renderer.get_overview_char(summary, dx, dy)
+                assert tuple(console.fg[y, x]) == self.renderer.get_overview_color(summary, dx, dy)
+                assert tuple(console.bg[y, x]) == self.renderer.get_overview_bg_color(summary, dx, dy)
+
+
+class TestOverviewNavigation:
+    """Test moving around and fast traveling from the overview."""
+
+    def setup_method(self):
+        """Create a renderer for 32-tile chunks."""
+        world_generator = SimpleNamespace(chunk_manager=SimpleNamespace(chunk_size=32))
+        self.renderer = ZoomedMapRenderer(world_generator, 80, 40)
+
+    def teardown_method(self):
+        """Stop the background worker."""
+        self.renderer.cleanup()
+
+    def test_fast_travel_follows_resized_view_center(self):
+        """Test that fast travel lands on the center chunk of the resized overview."""
+        self.renderer.toggle_map_mode()
+        self.renderer.update_console_size(120, 60)
+        self.renderer.zoom_camera_x, self.renderer.zoom_camera_y = 0, 0
+
+        self.renderer.fast_travel_to_cursor()
+
+        # 30x15 visible chunks, so the center is chunk (15, 7)
+        assert (self.renderer.camera_x, self.renderer.camera_y) == (15 * 32 + 16, 7 * 32 + 16)
@@ -64,9 +64,9 @@ class TestChunk:
         
         assert chunk.coordinate == coord
         assert chunk.size == 16
-        assert chunk.terrain_data == []
+        assert chunk.terrain_data.size == 0
         assert chunk.is_generated is False
-        assert chunk.last_accessed == 0
+        assert not hasattr(chunk, "__dict__")
     
     def test_set_terrain_data(self):
         """Test setting terrain data."""
@@ -83,7 +83,8 @@ class TestChunk:
         
         chunk.set_terrain_data(terrain_data)
         
-        assert chunk.terrain_data == terrain_data
+        assert chunk.terrain_data.shape == (4, 4)
+        assert [[chunk.get_terrain_at(x, y) for x in range(4)] for y in range(4)] == terrain_data
         assert chunk.is_generated is True
     
     def test_set_terrain_data_wrong_size(self):
@@ -170,7 +171,6 @@ class TestChunkManager:
         assert manager.chunk_size == 16
         assert manager.cache_size == 32
         assert len(manager._chunks) == 0
-        assert len(manager._access_order) == 0
     
     def test_world_to_chunk_coordinate(self):
         """Test converting world coordinates to chunk coordinates."""
@@ -266,6 +266,22 @@ class TestChunkManager:
         assert manager.get_chunk(coord1) is None
         assert manager.get_chunk(coord2) is not None
         assert manager.get_chunk(coord3) is not None
+
+    def test_cache_eviction_respects_recent_access(self):
+        """Test that reading a chunk protects it from the next eviction."""
+        manager = ChunkManager(chunk_size=16, cache_size=2)
+
+        coord1 = ChunkCoordinate(0, 0)
+        coord2 = ChunkCoordinate(1, 0)
+        manager.add_chunk(Chunk(coord1, 16))
+        manager.add_chunk(Chunk(coord2, 16))
+
+        # Touch the oldest chunk so the second one becomes least recently used
+        manager.get_chunk(coord1)
+        manager.add_chunk(Chunk(ChunkCoordinate(2, 0), 16))
+
+        assert manager.get_chunk(coord1) is not None
+        assert manager.get_chunk(coord2) is None
     
     def test_get_chunks_in_radius(self):
         """Test getting chunks within a radius."""
@@ -292,6 +308,10 @@ class TestChunkManager:
         assert ChunkCoordinate(-2, -2) in chunks
         assert ChunkCoordinate(2, 2) in chunks
         assert ChunkCoordinate(0, 0) in chunks
+
+        # Cached offsets are reused around a different center
+        chunks = manager.get_chunks_in_radius(ChunkCoordinate(5, -3), 1)
+        assert chunks == {ChunkCoordinate(5 + c.x, -3 + c.y) for c in expected}
     
     def test_get_loaded_chunks(self):
         """Test getting all loaded chunks."""
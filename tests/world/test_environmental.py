@@ -5,6 +5,7 @@ This module tests the environmental data structures, generators, and
 terrain mapping functionality.
 """
 
+import numpy as np
 import pytest
 from src.covenant.world.environmental import (
     EnvironmentalData, EnvironmentalGenerator, 
@@ -95,6 +96,17 @@ class TestEnvironmentalGenerator:
         assert 0.0 <= env_data.moisture <= 1.0
         assert 0.0 <= env_data.temperature <= 1.0
     
+    def test_elevation_grid_matches_point_generation(self):
+        """Test that the vectorized elevation grid matches per-point generation."""
+        generator = create_default_environmental_generator(seed=12345)
+        
+        xs = np.arange(-4000, 4000, 160)
+        ys = np.arange(-2500, 2500, 100)
+        grid = generator.generate_elevation_grid(xs, ys)
+        
+        expected = [generator.generate_environmental_data(int(x), int(y)).elevation for x, y in zip(xs, ys)]
+        assert np.allclose(grid, expected, rtol=0, atol=1e-9)
+    
     def test_deterministic_generation(self):
         """Test that same seed produces same results."""
         generator1 = create_default_environmental_generator(seed=12345)
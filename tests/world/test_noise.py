@@ -2,6 +2,7 @@
 Tests for the noise generation module.
 """
 
+import numpy as np
 import pytest
 
 from src.covenant.world.noise import (
@@ -156,6 +157,19 @@ class TestNoiseGenerator:
                 chunk_value = chunk_data[y][x]
                 
                 assert abs(individual_value - chunk_value) < 1e-10
+    
+    def test_grid_matches_individual_generation(self):
+        """Test that vectorized grid generation matches point-by-point generation."""
+        config = NoiseConfig()
+        generator = NoiseGenerator(config)
+        
+        xs = np.array([[-1234.5, 0.0, 7.25], [3.0, 99.9, -0.01]])
+        ys = np.array([[17.0, -3.5, 250.0], [0.0, -812.75, 1e4]])
+        grid = generator.generate_grid(xs, ys)
+        
+        assert grid.shape == xs.shape
+        for index in np.ndindex(xs.shape):
+            assert grid[index] == generator.generate(xs[index], ys[index])
 
 
 class TestNoiseFactoryFunctions:
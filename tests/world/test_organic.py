@@ -6,6 +6,7 @@ and visual enhancements.
 """
 
 import pytest
+from src.covenant.world import organic
 from src.covenant.world.organic import (
     OrganicWorldGenerator, OrganicTerrainData, OrganicNoiseGenerator,
     TERRAIN_CHARACTER_VARIATIONS, create_organic_world_generator
@@ -117,6 +118,17 @@ class TestOrganicWorldGenerator:
                 assert data1.moisture == data2.moisture
                 assert data1.temperature == data2.temperature
     
+    def test_compiled_kernels_match_python_generation(self, monkeypatch):
+        """Test that the compiled chunk kernels reproduce the per-cell Python path."""
+        generator = OrganicWorldGenerator(seed=12345)
+        coords = [(0, 0), (3, -2), (-40, 17)]
+        compiled = [generator.generate_chunk_data(x, y, 8) for x, y in coords]
+
+        monkeypatch.setattr(organic, "HAS_NUMBA", False)
+        python = [generator.generate_chunk_data(x, y, 8) for x, y in coords]
+
+        assert compiled == python
+    
     def test_character_variations(self):
         """Test that different characters are used for the same terrain type."""
         generator = OrganicWorldGenerator(seed=12345)